@@ -0,0 +1,113 @@
+"""
+Benchmark suite for the scheduler engines.
+
+Times every fuzzer TARGET against its reference implementation on fixed,
+seeded workloads. The differential fuzzer runs first as a gate: if any
+engine disagrees with its reference the suite fails before timing, so a
+speedup is only ever reported for an engine that produces the same
+timelines.
+
+    python -m algorithms.benchmark               # fuzz 500 cases, then time
+    python -m algorithms.benchmark --fuzz 0      # timings only
+"""
+import random
+import time
+
+from algorithms.fuzz import TARGETS, fuzz
+from algorithms.process import Process
+from algorithms.reference import reference
+
+
+def periodic_tasks(periods=(7, 11, 13, 17), deadlines=True):
+    """Tasks released at 0 with bursts 1–3; the default periods give a hyperperiod of 17017."""
+    return [Process(i, 0, 1 + i % 3, deadline=p if deadlines else None, period=p)
+            for i, p in enumerate(periods, start=1)]
+
+
+def queued_processes(n=1000, seed=0):
+    """`n` jobs arriving faster than they are served, so queues grow long."""
+    rng, t, procs = random.Random(seed), 0, []
+    for pid in range(1, n + 1):
+        procs.append(Process(pid, t, rng.randint(1, 10)))
+        t += rng.randint(0, 6)
+    return procs
+
+
+# target → (workload factory, scheduler parameters)
+WORKLOADS = {
+    "FCFS"           : (queued_processes, {}),
+    "FCFS+add"       : (queued_processes, {}),
+    "FCFS+remove"    : (queued_processes, {}),
+    "FCFS/vectorized": (queued_processes, {}),
+    "SJN"            : (queued_processes, {}),
+    "SJN+add"        : (queued_processes, {}),
+    "SJN+remove"     : (queued_processes, {}),
+    "RR"             : (queued_processes, {"time_quantum": 2}),
+    "RR+add"         : (queued_processes, {"time_quantum": 2}),
+    "RR+remove"      : (queued_processes, {"time_quantum": 2}),
+    "RM/tick"        : (lambda: periodic_tasks(deadlines=False), {}),
+    "RM/event"       : (lambda: periodic_tasks(deadlines=False), {}),
+    "DF/tick"        : (periodic_tasks, {}),
+    "DF/event"       : (periodic_tasks, {}),
+}
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def run_benchmarks(targets=None, repeat=3):
+    """One row per target: workload size, best engine and reference seconds, speedup."""
+    rows = []
+    refs = {}  # algorithm → reference seconds, shared by its targets
+    for target in targets or TARGETS:
+        algorithm, extra, runner = TARGETS[target]
+        factory, params          = WORKLOADS[target]
+        procs = factory()
+        secs  = _best(lambda: runner(algorithm, {**params, **extra}, procs), repeat)
+        if algorithm not in refs:
+            refs[algorithm] = _best(lambda: reference(algorithm, procs, **params), repeat)
+        ref = refs[algorithm]
+        rows.append({
+            "target"   : target,
+            "processes": len(procs),
+            "seconds"  : secs,
+            "reference": ref,
+            "speedup"  : ref / secs if secs > 0 else float("inf"),
+        })
+    return rows
+
+
+def main(argv=None):
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Check the scheduler engines against their references and time them")
+    parser.add_argument("--fuzz", type=int, default=500, metavar="N", help="fuzz cases before timing (0: skip)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--target", action="append", choices=sorted(TARGETS), help="engines to run (default: all)")
+    args = parser.parse_args(argv)
+
+    if args.fuzz:
+        t        = time.perf_counter()
+        failures = fuzz(args.fuzz, args.seed, args.target)
+        print(f"fuzz: {args.fuzz} cases in {time.perf_counter() - t:.1f}s, {len(failures)} failures")
+        if failures:
+            for f in failures:
+                print(f"  {f}")
+            sys.exit(1)
+
+    print(f"{'engine':15s} {'processes':>9s} {'seconds':>9s} {'reference':>10s} {'speedup':>8s}")
+    for r in run_benchmarks(args.target, args.repeat):
+        print(f"{r['target']:15s} {r['processes']:9d} {r['seconds']:9.4f} {r['reference']:10.4f} "
+              f"{r['speedup']:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
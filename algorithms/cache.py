@@ -0,0 +1,227 @@
+import hashlib
+import io
+import json
+import os
+import pickle
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+
+# Scheduler attributes that make up a run's result
+RESULT_ATTRS = (
+    "timeline", "core_timelines", "metrics", "jobs", "migrations",
+    "received", "entitled", "share_error", "demotions", "boosts",
+    "device_timelines", "io_wait", "blocked", "overhead_stats",
+)
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "algo-scheduler", "results.sqlite")
+
+_version = None
+
+# the only globals a cached result may refer to; anything else in a blob
+# is refused instead of being imported and called
+SAFE_GLOBALS = {
+    ("algorithms.metrics", "Metrics"),
+    ("algorithms.metrics", "ProcessMetrics"),
+    ("algorithms.jobs", "JobLog"),
+    ("algorithms.jobs", "TaskSummary"),
+    ("array", "array"),
+    ("array", "_array_reconstructor"),
+}
+
+
+def code_version(cls=None):
+    """
+    Hash of the source of every module in the algorithms package, so
+    editing any code a run may depend on (the scheduler, its base classes,
+    metrics, jobs, workloads, the overhead model, the schedulers a
+    partitioned run delegates to, ...) invalidates cached results. `cls`
+    is accepted for callers that version one scheduler class; all share
+    the package's version.
+    """
+    global _version
+    if _version is None:
+        package = os.path.dirname(os.path.abspath(__file__))
+        h = hashlib.sha256()
+        for name in sorted(os.listdir(package)):
+            if name.endswith(".py"):
+                h.update(name.encode())
+                with open(os.path.join(package, name), "rb") as f:
+                    h.update(f.read())
+        _version = h.hexdigest()[:16]
+    return _version
+
+
+class _ResultUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if (module, name) not in SAFE_GLOBALS:
+            raise pickle.UnpicklingError(f"cached result refers to {module}.{name}, which is not allowed")
+        return super().find_class(module, name)
+
+
+def _loads(blob):
+    return _ResultUnpickler(io.BytesIO(zlib.decompress(blob))).load()
+
+
+def workload_key(scheduler):
+    """Canonical hash of (algorithm, code version, parameters, workload)."""
+    cls = type(scheduler)
+    doc = {
+        "algorithm": f"{cls.__module__}.{cls.__qualname__}",
+        "version"  : code_version(cls),
+        "params"   : scheduler.params(),
+        "workload" : [
+            [p.pid, p.arrival_time, p.burst_time, p.deadline, p.period, getattr(p, "weight", 1)]
+            + ([p.bursts] if getattr(p, "bursts", None) else [])
+            for p in scheduler.processes
+        ],
+    }
+    if getattr(scheduler, "overhead", None) is not None:
+        doc["overhead"] = scheduler.overhead.params()
+    blob = json.dumps(doc, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed, on-disk cache of schedule results.
+
+    Results (timeline, metrics and the scheduler-specific extras in
+    RESULT_ATTRS) are stored as compressed pickles in a SQLite table keyed by
+    workload_key(). Entries are evicted least-recently-used once the cache
+    exceeds `max_bytes` or `max_entries`. Because the key includes the
+    scheduler's code version, results from older code are never returned,
+    and they are purged the next time that algorithm stores a result.
+
+    A small in-memory LRU (`memory_entries`) of the compressed blobs sits
+    in front of SQLite so per-frame lookups in the UI do not touch the
+    disk. Every hit unpickles its own copy, so a scheduler that reruns or
+    edits a restored result cannot change what later hits get.
+
+    Trust boundary: the database is a per-user file (the default lives in
+    the user's ~/.cache). Blobs are loaded with an unpickler restricted to
+    SAFE_GLOBALS, so a tampered entry cannot import or call anything else;
+    it is dropped as a miss. Still, do not point `path` at a database that
+    other users can write.
+    """
+    def __init__(self, path=None, max_bytes=64 * 1024 * 1024, max_entries=None, memory_entries=64):
+        self.path           = path or os.environ.get("ALGO_SCHEDULER_CACHE", DEFAULT_PATH)
+        self.max_bytes      = max_bytes
+        self.max_entries    = max_entries
+        self.memory_entries = memory_entries
+        self._memory        = OrderedDict()
+        self.hits           = 0
+        self.misses         = 0
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                key       TEXT PRIMARY KEY,
+                algorithm TEXT NOT NULL,
+                version   TEXT NOT NULL,
+                size      INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                blob      BLOB NOT NULL
+            )
+        """)
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_lru ON results(last_used)")
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    # ─── lookups ─────────────────────────────────────────────────────────────
+
+    def get(self, scheduler, key=None):
+        """Load a cached result into `scheduler`; returns True on a hit."""
+        key = key or workload_key(scheduler)
+        blob = self._memory.get(key)
+        if blob is not None:
+            self._memory.move_to_end(key)
+            result = _loads(blob)
+        else:
+            row = self.db.execute("SELECT blob FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return False
+            self.db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+            self.db.commit()
+            try:
+                result = _loads(row[0])
+            except (pickle.UnpicklingError, zlib.error, EOFError):
+                # foreign or corrupt entry: drop it and recompute
+                self.db.execute("DELETE FROM results WHERE key = ?", (key,))
+                self.db.commit()
+                self.misses += 1
+                return False
+            self._remember(key, row[0])
+        self.hits += 1
+        self._restore(scheduler, result)
+        return True
+
+    def put(self, scheduler, key=None):
+        """Store the result of a scheduler that has already run."""
+        key    = key or workload_key(scheduler)
+        cls    = type(scheduler)
+        name   = f"{cls.__module__}.{cls.__qualname__}"
+        result = {a: getattr(scheduler, a) for a in RESULT_ATTRS if hasattr(scheduler, a)}
+        blob   = zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        version = code_version(cls)
+        self.db.execute("DELETE FROM results WHERE algorithm = ? AND version != ?", (name, version))
+        self.db.execute(
+            "INSERT OR REPLACE INTO results (key, algorithm, version, size, last_used, blob) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, name, version, len(blob), time.time(), blob)
+        )
+        self._evict()
+        self.db.commit()
+        self._remember(key, blob)
+
+    def run(self, scheduler):
+        """schedule() through the cache: reuse a stored result or compute and store it."""
+        key = workload_key(scheduler)
+        if not self.get(scheduler, key):
+            scheduler.schedule()
+            self.put(scheduler, key)
+        return scheduler
+
+    def clear(self):
+        self.db.execute("DELETE FROM results")
+        self.db.commit()
+        self._memory.clear()
+
+    # ─── internals ───────────────────────────────────────────────────────────
+
+    def _restore(self, scheduler, result):
+        for attr, value in result.items():
+            if attr != "metrics":
+                setattr(scheduler, attr, value)
+        if result.get("metrics") is not None:
+            scheduler.apply_metrics(result["metrics"])
+
+    def _remember(self, key, blob):
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        count, total = self.db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        rows = self.db.execute("SELECT key, size FROM results ORDER BY last_used ASC")
+        doomed = []
+        for key, size in rows:
+            over_size  = self.max_bytes is not None and total > self.max_bytes
+            over_count = self.max_entries is not None and count > self.max_entries
+            if not (over_size or over_count):
+                break
+            doomed.append((key,))
+            total -= size
+            count -= 1
+        self.db.executemany("DELETE FROM results WHERE key = ?", doomed)
+        for (key,) in doomed:
+            self._memory.pop(key, None)
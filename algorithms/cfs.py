@@ -0,0 +1,85 @@
+import heapq
+from algorithms.scheduler import Scheduler
+from algorithms.fairness import ShareTracker
+
+class CompletelyFairScheduler(Scheduler):
+    """
+    CFS-style weighted fair scheduling.
+
+    Runnable processes sit in a heap keyed by virtual runtime. The one with
+    the smallest vruntime runs for sched_latency * weight / total_weight
+    (never less than min_granularity), and its vruntime grows by
+    runtime / weight. Newcomers start at the queue's min_vruntime so they
+    neither starve others nor get starved. Each decision is O(log n).
+
+    After scheduling:
+        received    – pid → CPU time actually given
+        entitled    – pid → CPU time owed under ideal weighted sharing
+        share_error – pid → received - entitled
+    """
+    def __init__(self, sched_latency=6, min_granularity=1):
+        super().__init__()
+        self.sched_latency   = sched_latency
+        self.min_granularity = min_granularity
+        self.received        = {}
+        self.entitled        = {}
+        self.share_error     = {}
+
+    def schedule(self):
+        if not self.processes:
+            return
+
+        order     = sorted(self.processes, key=lambda p: p.arrival_time)
+        remaining = {p.pid: p.burst_time for p in order}
+        tracker   = ShareTracker()
+        self.received = {p.pid: 0 for p in order}
+
+        heap         = []  # (vruntime, seq, process)
+        seq          = 0
+        min_vruntime = 0.0
+        total_weight = 0
+        index        = 0
+        current_time = order[0].arrival_time
+
+        def admit(t):
+            nonlocal index, seq, total_weight
+            while index < len(order) and order[index].arrival_time <= t:
+                p = order[index]
+                heapq.heappush(heap, (min_vruntime, seq, p))
+                tracker.join(p.pid, p.weight, p.arrival_time)
+                total_weight += p.weight
+                seq   += 1
+                index += 1
+
+        while heap or index < len(order):
+            admit(current_time)
+            if not heap:
+                current_time = order[index].arrival_time
+                continue
+
+            vruntime, _, proc = heapq.heappop(heap)
+            slice_ = max(self.min_granularity, self.sched_latency * proc.weight / total_weight)
+            run    = min(slice_, remaining[proc.pid])
+            start  = current_time
+            current_time += run
+            self._append_segment(proc.pid, start, current_time)
+            self.received[proc.pid] += run
+            remaining[proc.pid]     -= run
+            vruntime += run / proc.weight
+
+            # min_vruntime only moves forward
+            floor = min(vruntime, heap[0][0]) if heap else vruntime
+            min_vruntime = max(min_vruntime, floor)
+
+            admit(current_time)
+            if remaining[proc.pid] > 0:
+                heapq.heappush(heap, (vruntime, seq, proc))
+                seq += 1
+            else:
+                tracker.leave(proc.pid, current_time)
+                total_weight -= proc.weight
+
+        self.entitled    = tracker.entitled
+        self.share_error = tracker.errors(self.received)
+        self.update_metrics()
+        return self.result
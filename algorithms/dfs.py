@@ -1,7 +1,8 @@
-from math import gcd
+from math import gcd, ceil
 from functools import reduce
 from copy import deepcopy
 from algorithms.scheduler import Scheduler
+from algorithms.jobs import JobLog
 
 class DeadlineFirstScheduler(Scheduler):
     """
@@ -10,12 +11,37 @@ class DeadlineFirstScheduler(Scheduler):
       - .period    (int)
       - .burst_time (capacity)
       - .deadline  (relative, int)
+
+    horizon             – optional number of ticks to simulate instead of the hyperperiod
+    checkpoint_interval – optional; snapshot the state every this many ticks
+    engine              – "tick" steps one time unit at a time; "event" jumps
+                          from one release or completion to the next (same
+                          schedule, cost proportional to the number of jobs)
+
+    Every release is recorded in `jobs` (a JobLog).
     """
+    ENGINES = ("tick", "event")
+
+    def __init__(self, horizon=None, checkpoint_interval=None, engine="tick"):
+        super().__init__()
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {self.ENGINES}")
+        self.horizon = horizon
+        self.engine  = engine
+        self.jobs    = JobLog()
+        self.checkpoint_interval = checkpoint_interval
 
     def schedule(self):
         if not self.processes:
             return
+        self.timeline    = []
+        self.checkpoints = []
+        self._next_checkpoint = 0
+        self.jobs        = JobLog()
+        self._continue(self._initial_state())
+        return self.result
 
+    def _initial_state(self):
         # 1) Validate
         for p in self.processes:
             if p.period is None or p.deadline is None:
@@ -24,23 +50,50 @@ class DeadlineFirstScheduler(Scheduler):
         # 2) Compute hyperperiod = lcm of all periods
         periods = [int(p.period) for p in self.processes]
         hyper = reduce(lambda a, b: a * b // gcd(a, b), periods)
+        if self.horizon is not None:
+            hyper = int(self.horizon)
 
         # 3) Initialize runtime state
-        RT = {}
+        RT = []
         for p in self.processes:
-            RT[p.pid] = {
+            RT.append([p.pid, {
                 'orig_period'   : int(p.period),
                 'orig_capacity' : int(p.burst_time),
                 'orig_deadline' : int(p.deadline),
                 'current_capacity': int(p.burst_time),
                 # first absolute deadline at t=0 is deadline itself
                 'current_deadline': int(p.deadline)
-            }
+            }])
+
+        # every task releases its first job at t=0
+        jobs = [[pid, 0, info['current_deadline'], 0] for pid, info in RT]
+        return {'t': 0, 'end': hyper, 'tasks': RT, 'jobs': jobs}
+
+    def _continue(self, state):
+        # self.jobs holds the jobs closed before `state` (see Scheduler.resume)
+        for job in state['jobs']:
+            self.jobs.reopen(*job)
+
+        # 4) Tick-by-tick simulation, straight into self.timeline
+        self._advance(state, state['end'], self.timeline, self.jobs, checkpoints=True)
+        self.jobs.close(state['end'])
 
-        timeline = []  # will build list of {'task': pid, 'start':, 'end':}
+        # 5) Compute metrics
+        self.update_metrics()
+
+    def _advance(self, state, stop, timeline, jobs=None, checkpoints=False):
+        if self.engine == "event":
+            return self._advance_events(state, stop, timeline, jobs, checkpoints)
+        RT    = dict(state['tasks'])  # shares the per-task dicts with `state`
+        hyper = state['end']
+        stop  = min(ceil(stop), hyper)
+        for t in range(state['t'], stop):
+            if checkpoints and self._checkpoint_due(t):
+                state['t'] = t
+                if jobs is not None:
+                    state['jobs'] = jobs.open_jobs()
+                self._save_checkpoint(t, state)
 
-        # 4) Tick-by-tick simulation
-        for t in range(hyper):
             # a) choose all with current_capacity>0
             ready = [pid for pid,info in RT.items() if info['current_capacity'] > 0]
             if ready:
@@ -49,18 +102,13 @@ class DeadlineFirstScheduler(Scheduler):
                 info = RT[pid]
                 # consume one unit
                 info['current_capacity'] -= 1
+                if jobs is not None:
+                    jobs.run(pid, 1)
+                    if info['current_capacity'] == 0:
+                        jobs.complete(pid, t+1)
 
                 # append or extend last segment
-                if timeline and timeline[-1]['task'] == pid and timeline[-1]['end'] == t:
-                    timeline[-1]['end']   = t+1
-                    timeline[-1]['length'] += 1
-                else:
-                    timeline.append({
-                        'task': pid,
-                        'start': t,
-                        'end':   t+1,
-                        'length': 1
-                    })
+                self._append_segment(pid, t, t+1, timeline)
             # else: idle (we skip)
 
             # b) at end of tick, reload any whose (t+1)%period==0
@@ -68,15 +116,51 @@ class DeadlineFirstScheduler(Scheduler):
                 if (t+1) % info['orig_period'] == 0:
                     info['current_capacity'] = info['orig_capacity']
                     info['current_deadline'] = (t+1) + info['orig_deadline']
+                    if jobs is not None and t+1 < hyper:
+                        jobs.release(pid, t+1, info['current_deadline'])
+        state['t'] = max(state['t'], stop)
 
-        # 5) Flatten our dict‐style timeline into self.timeline = [(pid,start,end),...]
-        self.timeline = [(seg['task'], seg['start'], seg['end']) for seg in timeline]
+    def _advance_events(self, state, stop, timeline, jobs=None, checkpoints=False):
+        """
+        Same schedule as the tick loop, one iteration per event: absolute
+        deadlines only change at releases, so the running task only changes
+        at a release or a completion.
+        """
+        RT    = dict(state['tasks'])
+        hyper = state['end']
+        stop  = min(ceil(stop), hyper)
+        t     = state['t']
+        while t < stop:
+            if checkpoints and self._checkpoint_due(t):
+                state['t'] = t
+                if jobs is not None:
+                    state['jobs'] = jobs.open_jobs()
+                self._save_checkpoint(t, state)
 
-        # 6) Compute metrics
-        for p in self.processes:
-            segs = [s for s in self.timeline if s[0] == p.pid]
-            if segs:
-                last_finish = segs[-1][2]
-                p.completion_time = last_finish
-                p.turnaround_time = last_finish - p.arrival_time
-                p.waiting_time    = p.turnaround_time - p.burst_time
+            # next release (multiple of a period), and the earliest-deadline ready task
+            step, pid = stop - t, None
+            for i, info in RT.items():
+                step = min(step, (t // info['orig_period'] + 1) * info['orig_period'] - t)
+                if info['current_capacity'] > 0 and (
+                        pid is None or info['current_deadline'] < RT[pid]['current_deadline']):
+                    pid = i
+            if checkpoints and self.checkpoint_interval is not None:
+                step = min(step, self._next_checkpoint - t)
+            if pid is not None:
+                info = RT[pid]
+                step = min(step, info['current_capacity'])
+                info['current_capacity'] -= step
+                if jobs is not None:
+                    jobs.run(pid, step)
+                    if info['current_capacity'] == 0:
+                        jobs.complete(pid, t+step)
+                self._append_segment(pid, t, t+step, timeline)
+
+            t += step
+            for i, info in RT.items():
+                if t % info['orig_period'] == 0:
+                    info['current_capacity'] = info['orig_capacity']
+                    info['current_deadline'] = t + info['orig_deadline']
+                    if jobs is not None and t < hyper:
+                        jobs.release(i, t, info['current_deadline'])
+        state['t'] = max(state['t'], stop)
@@ -0,0 +1,37 @@
+class ShareTracker:
+    """
+    Entitlement bookkeeping for proportional-share schedulers.
+
+    Under ideal weighted fair sharing every runnable process receives
+    weight / (total runnable weight) of the CPU. Instead of integrating that
+    per process, we keep one "virtual time" = service per unit of weight,
+    so join/leave are O(1) and a process's entitlement is
+    weight * (virtual time at leave - virtual time at join).
+    """
+    def __init__(self):
+        self.total_weight = 0
+        self.virtual      = 0.0
+        self.last_time    = None
+        self.joined       = {}  # pid → (weight, virtual time at join)
+        self.entitled     = {}  # pid → CPU time owed under ideal sharing
+
+    def advance(self, t):
+        if self.last_time is not None and t > self.last_time and self.total_weight > 0:
+            self.virtual += (t - self.last_time) / self.total_weight
+        if self.last_time is None or t > self.last_time:
+            self.last_time = t
+
+    def join(self, pid, weight, t):
+        self.advance(t)
+        self.total_weight += weight
+        self.joined[pid] = (weight, self.virtual)
+
+    def leave(self, pid, t):
+        self.advance(t)
+        weight, start = self.joined.pop(pid)
+        self.total_weight -= weight
+        self.entitled[pid] = weight * (self.virtual - start)
+
+    def errors(self, received):
+        """pid → received CPU time minus entitled CPU time."""
+        return {pid: received.get(pid, 0) - owed for pid, owed in self.entitled.items()}
@@ -1,16 +1,95 @@
+import bisect
+
 from algorithms.scheduler import Scheduler
 
 class FCFS_Scheduler(Scheduler):
-    """First-Come-First-Served scheduling."""
+    """
+    First-Come-First-Served scheduling.
+
+    engine – "loop" walks the processes one by one; "vectorized" computes
+             every finish time at once with numpy (worth it for large
+             workloads; identical results for integer times)
+    """
+    ENGINES = ("loop", "vectorized")
+    INCREMENTAL = True
+
+    def __init__(self, engine="loop"):
+        super().__init__()
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {self.ENGINES}")
+        self.engine = engine
+
     def schedule(self):
-        self.processes.sort(key=lambda p: p.arrival_time)
-        current_time = 0
-        for process in self.processes:
-            start_time = max(current_time, process.arrival_time)
-            finish_time = start_time + process.burst_time
-            self.timeline.append((process.pid, start_time, finish_time))
-            process.start_time = start_time
-            process.completion_time = finish_time
-            process.waiting_time = start_time - process.arrival_time
-            process.turnaround_time = finish_time - process.arrival_time
+        self.timeline    = []
+        self.checkpoints = []
+        self._next_checkpoint = 0
+        if self.engine == "vectorized":
+            self._schedule_vectorized()
+        else:
+            self._advance(self._initial_state(), float('inf'), self.timeline, checkpoints=True)
+        self.update_metrics()
+        return self.result
+
+    def _initial_state(self):
+        return {'time': 0, 'index': 0}  # index: next process in arrival order
+
+    def _idle_state(self, time, index):
+        return {'time': time, 'index': index}
+
+    def _resume_point(self, t, old, removed_pid=None):
+        # the timeline is in arrival order, one segment per process, so the
+        # run can resume right where the change is
+        if removed_pid is None:
+            w   = self.workload
+            cut = bisect.bisect_right(w.order, t, key=w.arrival.__getitem__) - 1
+        else:
+            cut = bisect.bisect_left(old, t, key=lambda seg: seg[1])
+            while old[cut][0] != removed_pid:
+                cut += 1
+        return {'time': old[cut - 1][2] if cut else 0, 'index': cut}, cut
+
+    def _continue(self, state):
+        self._advance(state, float('inf'), self.timeline, checkpoints=True)
+        self.update_metrics()
+
+    def _advance(self, state, stop, timeline, jobs=None, checkpoints=False, converge=None):
+        w            = self.workload
+        order        = w.order
+        index        = state['index']
+        current_time = state['time']
+        while index < len(order) and current_time < stop:
+            if checkpoints and self._checkpoint_due(current_time):
+                self._save_checkpoint(current_time, {'time': current_time, 'index': index})
+            i = order[index]
+            start_time = max(current_time, w.arrival[i])
+            # the rest of the run depends only on when this process starts
+            if converge is not None and converge(start_time, w.pids[i]):
+                break
+            finish_time = start_time + w.burst[i]
+            timeline.append((w.pids[i], start_time, finish_time))
             current_time = finish_time
+            index += 1
+        state['time']  = current_time
+        state['index'] = index
+
+    def _schedule_vectorized(self):
+        """
+        finish_i = C_i + max(0, max_{j<=i} (arrival_j - C_{j-1})), where C is
+        the running sum of bursts: the CPU last went idle before the latest
+        arrival that found it free.
+        """
+        import numpy as np
+
+        w = self.workload
+        if not len(w):
+            return
+        order   = list(w.order)
+        arrival = np.array(w.arrival)[order]
+        burst   = np.array(w.burst)[order]
+        done    = np.cumsum(burst)
+        slack   = np.maximum.accumulate(arrival - (done - burst))
+        finish  = done + np.maximum(slack, 0)
+        start   = finish - burst
+        self.timeline.extend(zip(
+            (w.pids[i] for i in order), start.tolist(), finish.tolist()
+        ))
@@ -0,0 +1,294 @@
+"""
+Differential fuzzer: scheduler engines against the reference oracles.
+
+Generates edge-case workloads, runs every engine TARGET on each and
+diffs its canonical timeline segment by segment against
+algorithms.reference. A disagreement (or an exception) is shrunk to a
+smallest failing case: fewer processes, smaller numbers, renumbered
+pids. The shrunk case is a request in the service's format, so it can
+be replayed with registry.run().
+
+Workload shapes:
+    random       – independent arrivals, bursts and periods
+    simultaneous – every process arrives (or is released) at once
+    ties         – equal bursts, periods and deadlines, arrivals on a coarse grid
+    back_to_back – each arrival exactly when the previous process would
+                   finish (zero gaps); periodic: bursts fill whole periods
+    overload     – more work than the CPU can do (utilization above 1)
+    large_hyper  – pairwise coprime periods, hyperperiods in the thousands
+    horizon      – periodic run cut at a horizon that is not a multiple of the periods
+
+    python -m algorithms.fuzz -n 2000 --seed 1
+    failures = fuzz(500)                      # [] when every engine agrees
+"""
+import json
+import random
+import time
+
+from algorithms import registry
+from algorithms.process import Process
+from algorithms.reference import canonical, first_difference, reference
+
+SHAPES   = ("random", "simultaneous", "ties", "back_to_back", "overload", "large_hyper", "horizon")
+PERIODIC = ("RM", "DF")
+_PRIMES  = (5, 7, 11, 13, 17, 19, 23)
+
+
+# ─── targets ────────────────────────────────────────────────────────────────
+
+def _full(algorithm, params, processes):
+    return registry.run(algorithm, processes, **params).timeline
+
+
+def _add_last(algorithm, params, processes):
+    # schedule all but the last process, then update the run with it
+    sched = registry.run(algorithm, processes[:-1], **params)
+    sched.add_process(processes[-1])
+    if sched.result is None:
+        sched.schedule()
+    return sched.timeline
+
+
+def _remove_extra(algorithm, params, processes):
+    # schedule with a copy of the first process under a new pid, then remove it
+    p     = processes[0]
+    extra = Process(max(q.pid for q in processes) + 1, p.arrival_time, p.burst_time, p.deadline, p.period)
+    sched = registry.run(algorithm, processes + [extra], **params)
+    sched.remove_process(extra.pid)
+    return sched.timeline
+
+
+# label → (algorithm, extra params, runner); every engine a reference can check
+TARGETS = {
+    "FCFS"           : ("FCFS", {}, _full),
+    "FCFS+add"       : ("FCFS", {}, _add_last),
+    "FCFS+remove"    : ("FCFS", {}, _remove_extra),
+    "FCFS/vectorized": ("FCFS", {"engine": "vectorized"}, _full),
+    "SJN"            : ("SJN", {}, _full),
+    "SJN+add"        : ("SJN", {}, _add_last),
+    "SJN+remove"     : ("SJN", {}, _remove_extra),
+    "RR"             : ("RR", {}, _full),
+    "RR+add"         : ("RR", {}, _add_last),
+    "RR+remove"      : ("RR", {}, _remove_extra),
+    "RM/tick"        : ("RM", {"engine": "tick"}, _full),
+    "RM/event"       : ("RM", {"engine": "event"}, _full),
+    "DF/tick"        : ("DF", {"engine": "tick"}, _full),
+    "DF/event"       : ("DF", {"engine": "event"}, _full),
+}
+
+
+# ─── generation ─────────────────────────────────────────────────────────────
+
+def _aperiodic(rng, shape, n):
+    if shape == "simultaneous":
+        at = rng.choice((0, rng.randint(1, 5)))
+        return [(at, rng.randint(1, 10)) for _ in range(n)]
+    if shape == "ties":
+        burst = rng.randint(1, 6)
+        return [(rng.choice((0, 2, 4)), burst if rng.random() < 0.8 else rng.randint(1, 6)) for _ in range(n)]
+    if shape == "back_to_back":
+        rows, t = [], rng.randint(0, 3)
+        for _ in range(n):
+            burst = rng.randint(1, 8)
+            rows.append((t, burst))
+            t += burst
+        return rows
+    if shape == "overload":
+        return [(rng.randint(0, n), rng.randint(5, 20)) for _ in range(n)]
+    # random, with room for idle gaps
+    return [(rng.randint(0, 30), rng.randint(1, 10)) for _ in range(n)]
+
+
+def _periodic(rng, shape, n):
+    # rows of (period, burst, relative deadline)
+    if shape == "large_hyper":
+        periods = rng.sample(_PRIMES, min(n, 3))
+        periods += [rng.choice(periods) for _ in range(n - len(periods))]
+    elif shape in ("ties", "simultaneous"):
+        periods = [rng.choice((4, 6, 12))] * n
+    elif shape == "back_to_back":
+        periods = [rng.choice((2, 4, 8)) for _ in range(n)]
+    else:
+        periods = [rng.randint(2, 12) for _ in range(n)]
+    rows = []
+    for period in periods:
+        if shape == "back_to_back":
+            burst = max(1, period // n)
+        elif shape == "overload":
+            burst = rng.randint(max(1, period // 2), period)
+        else:
+            burst = rng.randint(1, max(1, period // n))
+        deadline = period if shape == "ties" else rng.randint(burst, period + 3)
+        rows.append((period, burst, deadline))
+    return rows
+
+
+def generate(rng, algorithm, shape):
+    """A case {"algorithm", "params", "processes", "shape"} of `shape` for `algorithm`."""
+    n      = rng.randint(1, 8)
+    params = {}
+    if algorithm in PERIODIC:
+        processes = [{"pid": pid, "arrival": 0, "burst": b, "period": p,
+                      "deadline": d if algorithm == "DF" else None}
+                     for pid, (p, b, d) in enumerate(_periodic(rng, shape, n), start=1)]
+        if shape == "horizon":
+            params["horizon"] = rng.randint(1, 60)
+    else:
+        processes = [{"pid": pid, "arrival": a, "burst": b}
+                     for pid, (a, b) in enumerate(_aperiodic(rng, shape, n), start=1)]
+        if algorithm == "RR":
+            # quanta that divide the bursts make expiries coincide with arrivals
+            params["time_quantum"] = rng.choice((1, 2, 3, 4, 8))
+    return {"algorithm": algorithm, "params": params, "processes": processes, "shape": shape}
+
+
+# ─── checking ───────────────────────────────────────────────────────────────
+
+class Failure:
+    """
+    target     – TARGETS label of the engine that disagreed
+    case       – the generated case
+    shrunk     – smallest case found that still fails
+    difference – (index, expected segment, actual segment) on `shrunk`,
+                 or the exception the engine raised as a string
+    """
+    def __init__(self, target, case, shrunk, difference):
+        self.target     = target
+        self.case       = case
+        self.shrunk     = shrunk
+        self.difference = difference
+
+    def __repr__(self):
+        return (f"Failure({self.target}, {self.case['shape']}: {len(self.case['processes'])} → "
+                f"{len(self.shrunk['processes'])} processes, {self.difference})")
+
+
+def _processes(case):
+    return [registry.process_from_dict(d) for d in case["processes"]]
+
+
+def _expected(case):
+    return canonical(reference(case["algorithm"], _processes(case), **case["params"]))
+
+
+def check(target, case, expected=None):
+    """None if `target` agrees with the reference on `case`, else the difference."""
+    algorithm, extra, runner = TARGETS[target]
+    if expected is None:
+        expected = _expected(case)
+    try:
+        actual = canonical(runner(algorithm, {**case["params"], **extra}, _processes(case)))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return first_difference(expected, actual)
+
+
+# ─── shrinking ──────────────────────────────────────────────────────────────
+
+def _smaller(value, lowest):
+    """Candidate replacements for `value`, smallest first."""
+    out = []
+    for v in (lowest, value // 2, value - 1):
+        if lowest <= v < value and v not in out:
+            out.append(v)
+    return out
+
+
+def _candidates(case):
+    procs = case["processes"]
+    # drop one process
+    if len(procs) > 1:
+        for k in range(len(procs)):
+            yield {**case, "processes": procs[:k] + procs[k + 1:]}
+    # smaller numbers, one field at a time
+    for k, d in enumerate(procs):
+        for field, lowest in (("arrival", 0), ("burst", 1), ("period", 1), ("deadline", 1)):
+            if d.get(field) is None:
+                continue
+            for v in _smaller(d[field], lowest):
+                yield {**case, "processes": procs[:k] + [{**d, field: v}] + procs[k + 1:]}
+    for name, lowest in (("time_quantum", 1), ("horizon", 1)):
+        if name in case["params"]:
+            for v in _smaller(case["params"][name], lowest):
+                yield {**case, "params": {**case["params"], name: v}}
+    # pids 1..n
+    renumbered = [{**d, "pid": pid} for pid, d in enumerate(procs, start=1)]
+    if renumbered != procs:
+        yield {**case, "processes": renumbered}
+
+
+def shrink(target, case, max_checks=2000):
+    """Greedily reduce a failing case while `target` still disagrees; returns (case, difference)."""
+    difference = check(target, case)
+    checks     = 0
+    progress   = True
+    while progress and checks < max_checks:
+        progress = False
+        for candidate in _candidates(case):
+            checks += 1
+            try:
+                expected = _expected(candidate)
+            except Exception:
+                continue  # not a valid workload for the reference
+            d = check(target, candidate, expected)
+            if d is not None:
+                case, difference, progress = candidate, d, True
+                break
+            if checks >= max_checks:
+                break
+    return case, difference
+
+
+# ─── driver ─────────────────────────────────────────────────────────────────
+
+def fuzz(n=500, seed=0, targets=None, shapes=SHAPES, max_failures=3, time_budget=None):
+    """
+    Check `n` generated cases against every target (TARGETS labels, all by
+    default); returns the failures, shrunk, at most `max_failures` per
+    target. Stops early after `time_budget` seconds.
+    """
+    rng      = random.Random(seed)
+    targets  = list(targets or TARGETS)
+    families = sorted({TARGETS[t][0] for t in targets})
+    failures = []
+    failed   = dict.fromkeys(targets, 0)
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    for i in range(n):
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        algorithm = families[i % len(families)]
+        case      = generate(rng, algorithm, rng.choice(shapes))
+        expected  = _expected(case)
+        for target in targets:
+            if TARGETS[target][0] != algorithm or failed[target] >= max_failures:
+                continue
+            if check(target, case, expected) is not None:
+                shrunk, difference = shrink(target, case)
+                failures.append(Failure(target, case, shrunk, difference))
+                failed[target] += 1
+    return failures
+
+
+def main(argv=None):
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Diff scheduler engines against the reference implementations")
+    parser.add_argument("-n", type=int, default=1000, help="cases to generate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--target", action="append", choices=sorted(TARGETS), help="engines to check (default: all)")
+    parser.add_argument("--budget", type=float, default=None, help="stop after this many seconds")
+    args = parser.parse_args(argv)
+
+    t        = time.perf_counter()
+    failures = fuzz(args.n, args.seed, args.target, time_budget=args.budget)
+    print(f"{len(args.target or TARGETS)} engines, {time.perf_counter() - t:.1f}s: "
+          f"{len(failures)} failures")
+    for f in failures:
+        print(f)
+        print("  " + json.dumps({k: v for k, v in f.shrunk.items() if k != "shape"}))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
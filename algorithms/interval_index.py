@@ -0,0 +1,146 @@
+from bisect import bisect_left, bisect_right
+
+
+class _Node:
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+
+class IntervalIndex:
+    """
+    Static index over a timeline of (pid, start, end) segments, built once.
+
+    Segments are half-open [start, end). When no two segments overlap (any
+    uniprocessor timeline, or one lane of a multicore run) the index is a
+    pair of sorted start/end arrays searched with bisect. Overlapping
+    segments (a merged multicore timeline) go into a centered interval
+    tree instead. Either way point and range queries cost O(log S + k) for
+    k reported segments.
+
+    start and end are the earliest start and latest end of the indexed
+    segments (None when there are none).
+    """
+    def __init__(self, timeline):
+        segments = sorted((seg for seg in timeline if seg[2] > seg[1]), key=lambda seg: seg[1])
+        self.segments    = segments
+        self.start       = segments[0][1] if segments else None
+        self.end         = max((seg[2] for seg in segments), default=None)
+        self.overlapping = any(segments[i][1] < segments[i-1][2] for i in range(1, len(segments)))
+        if self.overlapping:
+            self._root = self._build(segments)
+        else:
+            self._starts = [seg[1] for seg in segments]
+            self._ends   = [seg[2] for seg in segments]
+
+    def __len__(self):
+        return len(self.segments)
+
+    # ─── queries ─────────────────────────────────────────────────────────────
+
+    def at(self, t):
+        """Segments running at time t (at most one unless segments overlap)."""
+        if self.overlapping:
+            out = []
+            node = self._root
+            while node is not None:
+                if t < node.center:
+                    for seg in node.by_start:
+                        if seg[1] > t:
+                            break
+                        out.append(seg)
+                    node = node.left
+                else:
+                    for seg in node.by_end:
+                        if seg[2] <= t:
+                            break
+                        out.append(seg)
+                    node = node.right
+            return sorted(out, key=lambda seg: seg[1])
+
+        i = bisect_right(self._starts, t) - 1
+        if i >= 0 and self._ends[i] > t:
+            return [self.segments[i]]
+        return []
+
+    def overlapping_range(self, a, b):
+        """Segments that overlap [a, b), ordered by start."""
+        if b <= a:
+            return []
+        if self.overlapping:
+            out   = []
+            stack = [self._root]
+            while stack:
+                node = stack.pop()
+                if node is None:
+                    continue
+                if b <= node.center:
+                    for seg in node.by_start:
+                        if seg[1] >= b:
+                            break
+                        out.append(seg)
+                    stack.append(node.left)
+                elif a > node.center:
+                    for seg in node.by_end:
+                        if seg[2] <= a:
+                            break
+                        out.append(seg)
+                    stack.append(node.right)
+                else:
+                    out.extend(node.by_start)
+                    stack.append(node.left)
+                    stack.append(node.right)
+            return sorted(out, key=lambda seg: seg[1])
+
+        # ends are sorted too, so the first overlap is the first end > a
+        lo = bisect_right(self._ends, a)
+        hi = bisect_left(self._starts, b)
+        return self.segments[lo:hi]
+
+    # ─── construction ────────────────────────────────────────────────────────
+
+    def _build(self, segments):
+        """Centered interval tree; each node keeps the segments covering its center."""
+        if not segments:
+            return None
+        node = _Node()
+        points = sorted(p for seg in segments for p in (seg[1], seg[2]))
+        node.center = points[(len(points) - 1) // 2]  # lower median: at least one segment stays here
+        here, left, right = [], [], []
+        for seg in segments:
+            if seg[2] <= node.center:
+                left.append(seg)
+            elif seg[1] > node.center:
+                right.append(seg)
+            else:
+                here.append(seg)
+        node.by_start = sorted(here, key=lambda seg: seg[1])
+        node.by_end   = sorted(here, key=lambda seg: seg[2], reverse=True)
+        node.left     = self._build(left)
+        node.right    = self._build(right)
+        return node
+
+
+_cache = {}
+
+
+def index_for(timeline, max_entries=8):
+    """
+    IntervalIndex for `timeline`, reused across calls (e.g. every UI frame)
+    until the list is replaced or grows. Code that edits a timeline in
+    place without changing its length must call invalidate() afterwards.
+    """
+    hit = _cache.get(id(timeline))
+    if hit is not None and hit[0] is timeline and hit[1] == len(timeline):
+        return hit[2]
+    index = IntervalIndex(timeline)
+    if len(_cache) >= max_entries:
+        _cache.pop(next(iter(_cache)))
+    # keep a reference to the list so its id cannot be reused while cached
+    _cache[id(timeline)] = (timeline, len(timeline), index)
+    return index
+
+
+def invalidate(timeline):
+    """Forget the cached index of `timeline` after it changed."""
+    hit = _cache.get(id(timeline))
+    if hit is not None and hit[0] is timeline:
+        del _cache[id(timeline)]
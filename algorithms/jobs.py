@@ -0,0 +1,225 @@
+from array import array
+from math import isnan
+
+NAN = float("nan")
+
+
+class TaskSummary:
+    """
+    Per-task statistics over its job instances.
+
+    Attributes:
+        jobs           – jobs whose outcome is known (met or missed)
+        missed         – jobs that finished late or never finished
+        miss_ratio     – missed / jobs
+        worst_response – largest finish - release over completed jobs
+        best_response  – smallest finish - release over completed jobs
+        jitter         – worst_response - best_response
+        max_lateness   – largest finish - deadline over completed jobs
+    """
+    def __init__(self, pid):
+        self.pid            = pid
+        self.jobs           = 0
+        self.missed         = 0
+        self.worst_response = None
+        self.best_response  = None
+        self.max_lateness   = None
+
+    @property
+    def miss_ratio(self):
+        return self.missed / self.jobs if self.jobs else 0.0
+
+    @property
+    def jitter(self):
+        if self.worst_response is None:
+            return None
+        return self.worst_response - self.best_response
+
+    def __repr__(self):
+        return (f"TaskSummary(pid={self.pid}, jobs={self.jobs}, missed={self.missed}, "
+                f"worst_response={self.worst_response}, jitter={self.jitter}, "
+                f"max_lateness={self.max_lateness})")
+
+
+class JobLog:
+    """
+    Job-instance records for periodic tasks, kept in parallel typed arrays
+    (one entry per release) so long horizons stay compact.
+
+    Arrays:
+        task     – task index (see `pids`)
+        released – release time
+        deadline – absolute deadline
+        finished – completion time, NaN if the job never finished
+        executed – CPU time the job received
+        missed   – 1 if the job finished after its deadline or never
+                   finished (dropped at the next release), else 0
+        pending  – 1 if the horizon ended before the job's deadline
+
+    A task has at most one open job; releasing the next one closes it.
+    """
+    def __init__(self):
+        self.pids     = []
+        self._index   = {}
+        self._open    = {}  # task index → job id of its current job
+        self.task     = array('l')
+        self.released = array('d')
+        self.deadline = array('d')
+        self.finished = array('d')
+        self.executed = array('d')
+        self.missed   = array('b')
+        self.pending  = array('b')
+
+    def __len__(self):
+        return len(self.task)
+
+    def task_index(self, pid):
+        if pid not in self._index:
+            self._index[pid] = len(self.pids)
+            self.pids.append(pid)
+        return self._index[pid]
+
+    def release(self, pid, t, deadline):
+        """Start a new job of `pid` at time t; an unfinished predecessor is dropped."""
+        idx = self.task_index(pid)
+        if idx in self._open:
+            # its capacity is overwritten, so it can never finish
+            self.missed[self._open.pop(idx)] = 1
+        job = len(self.task)
+        self.task.append(idx)
+        self.released.append(t)
+        self.deadline.append(deadline)
+        self.finished.append(NAN)
+        self.executed.append(0)
+        self.missed.append(0)
+        self.pending.append(0)
+        self._open[idx] = job
+        return job
+
+    def current(self, pid):
+        """Job id of pid's open job, or None."""
+        return self._open.get(self._index.get(pid))
+
+    def open_jobs(self):
+        """[pid, release, deadline, executed] for every open job (for snapshots)."""
+        return [
+            [self.pids[idx], self.released[job], self.deadline[job], self.executed[job]]
+            for idx, job in self._open.items()
+        ]
+
+    def reopen(self, pid, t, deadline, executed=0):
+        """Restore an open job taken from open_jobs()."""
+        job = self.release(pid, t, deadline)
+        self.executed[job] = executed
+        return job
+
+    def run(self, pid, amount):
+        job = self.current(pid)
+        if job is not None:
+            self.executed[job] += amount
+
+    def complete(self, pid, t):
+        """The open job of `pid` finished at time t."""
+        job = self._open.pop(self._index[pid], None)
+        if job is None:
+            return
+        self.finished[job] = t
+        if t > self.deadline[job]:
+            self.missed[job] = 1
+
+    def close(self, horizon):
+        """End of simulation: open jobs past their deadline are misses, the rest pending."""
+        for job in self._open.values():
+            if self.deadline[job] <= horizon:
+                self.missed[job] = 1
+            else:
+                self.pending[job] = 1
+        self._open.clear()
+
+    def merge(self, other):
+        """Append another log's jobs (e.g. from another core's partition)."""
+        remap = [self.task_index(pid) for pid in other.pids]
+        for job in range(len(other)):
+            self.task.append(remap[other.task[job]])
+        self.released.extend(other.released)
+        self.deadline.extend(other.deadline)
+        self.finished.extend(other.finished)
+        self.executed.extend(other.executed)
+        self.missed.extend(other.missed)
+        self.pending.extend(other.pending)
+
+    def clip(self, t, open_jobs=()):
+        """
+        New log with the jobs released before time t, except the ones in
+        `open_jobs` ([pid, release, ...] as from open_jobs()): what a run
+        resumed at t keeps, before it reopens those from its snapshot.
+        """
+        skip = {(pid, release) for pid, release, *_ in open_jobs}
+        out  = JobLog()
+        for job in range(len(self.task)):
+            pid = self.pids[self.task[job]]
+            if self.released[job] >= t or (pid, self.released[job]) in skip:
+                continue
+            out.task.append(out.task_index(pid))
+            out.released.append(self.released[job])
+            out.deadline.append(self.deadline[job])
+            out.finished.append(self.finished[job])
+            out.executed.append(self.executed[job])
+            out.missed.append(self.missed[job])
+            out.pending.append(0)
+        return out
+
+    def retime(self, retime):
+        """
+        Move completion times with `retime(pid, t)` (see OverheadModel.charge)
+        and re-judge the finished jobs against their deadlines.
+        """
+        for job in range(len(self.task)):
+            finish = self.finished[job]
+            if isnan(finish):
+                continue
+            finish = retime(self.pids[self.task[job]], finish)
+            self.finished[job] = finish
+            self.missed[job]   = 1 if finish > self.deadline[job] else 0
+
+    def record(self, job):
+        """One job as a dict, with response time and lateness."""
+        finish = self.finished[job]
+        done   = not isnan(finish)
+        return {
+            'pid'     : self.pids[self.task[job]],
+            'release' : self.released[job],
+            'deadline': self.deadline[job],
+            'finish'  : finish if done else None,
+            'response': finish - self.released[job] if done else None,
+            'lateness': finish - self.deadline[job] if done else None,
+            'missed'  : bool(self.missed[job]),
+            'pending' : bool(self.pending[job]),
+        }
+
+    def summary(self):
+        """pid → TaskSummary, in one pass over the arrays."""
+        out = {pid: TaskSummary(pid) for pid in self.pids}
+        for job in range(len(self.task)):
+            if self.pending[job]:
+                continue
+            s = out[self.pids[self.task[job]]]
+            s.jobs   += 1
+            s.missed += self.missed[job]
+            finish = self.finished[job]
+            if isnan(finish):
+                continue
+            response = finish - self.released[job]
+            lateness = finish - self.deadline[job]
+            if s.worst_response is None or response > s.worst_response:
+                s.worst_response = response
+            if s.best_response is None or response < s.best_response:
+                s.best_response = response
+            if s.max_lateness is None or lateness > s.max_lateness:
+                s.max_lateness = lateness
+        return out
+
+    def miss_ratio(self):
+        """Overall fraction of decided jobs that missed their deadline."""
+        decided = len(self.task) - sum(self.pending)
+        return sum(self.missed) / decided if decided else 0.0
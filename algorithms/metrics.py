@@ -0,0 +1,226 @@
+class ProcessMetrics:
+    """
+    Per-process results derived from a timeline.
+
+    Attributes:
+        first_start  – start of the first segment
+        completion   – end of the last segment
+        response     – first_start - arrival
+        turnaround   – completion - arrival
+        waiting      – turnaround - burst
+        service      – total CPU time received
+        segments     – number of (merged) execution segments
+        preemptions  – times the process stopped with work left and resumed later
+    """
+    __slots__ = ("pid", "arrival", "burst", "first_start", "completion", "response",
+                 "turnaround", "waiting", "service", "segments", "preemptions")
+
+    def __init__(self, pid, arrival, burst):
+        self.pid         = pid
+        self.arrival     = arrival
+        self.burst       = burst
+        self.first_start = None
+        self.completion  = None
+        self.response    = None
+        self.turnaround  = None
+        self.waiting     = None
+        self.service     = 0
+        self.segments    = 0
+        self.preemptions = 0
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (f"ProcessMetrics(pid={self.pid}, completion={self.completion}, "
+                f"response={self.response}, waiting={self.waiting}, "
+                f"turnaround={self.turnaround}, preemptions={self.preemptions})")
+
+
+class Metrics:
+    """
+    Aggregate results of one schedule.
+
+    Attributes:
+        per_process      – pid → ProcessMetrics
+        start, end       – time span covered (first arrival/segment → last segment)
+        busy_time        – CPU time spent running processes, summed over cores
+        cores            – number of cores the timeline covers
+        cpu_utilization  – busy_time / (cores * makespan)
+        throughput       – completed processes per time unit
+        context_switches – changes of running process on a core
+        preemptions      – total over all processes
+        overhead_time    – time spent in scheduling-overhead segments (not
+                           part of busy_time), summed over cores
+        overhead_ratio   – overhead_time / (cores * makespan)
+        avg_waiting, avg_turnaround, avg_response
+    """
+    def __init__(self, per_process, start, end, busy_time, cores, context_switches, overhead_time=0):
+        self.per_process      = per_process
+        self.start            = start
+        self.end              = end
+        self.busy_time        = busy_time
+        self.cores            = cores
+        self.context_switches = context_switches
+        self.overhead_time    = overhead_time
+        # per-process sums behind the aggregates, kept for updated()
+        self._totals = [0, 0, 0, 0, 0]
+        self._add(per_process.values(), 1)
+        self._derive()
+
+    def _add(self, values, sign):
+        totals = self._totals
+        for m in values:
+            # like Scheduler.average_*: processes that never ran count as 0
+            totals[0] += sign * m.preemptions
+            totals[1] += sign * (m.completion is not None)
+            totals[2] += sign * (m.waiting or 0)
+            totals[3] += sign * (m.turnaround or 0)
+            totals[4] += sign * (m.response or 0)
+
+    def _derive(self):
+        preemptions, completed, waiting, turnaround, response = self._totals
+        makespan = self.end - self.start
+        self.preemptions     = preemptions
+        self.makespan        = makespan
+        self.completed       = completed
+        self.cpu_utilization = self.busy_time / (self.cores * makespan) if makespan > 0 else 0.0
+        self.overhead_ratio  = self.overhead_time / (self.cores * makespan) if makespan > 0 else 0.0
+        self.throughput      = completed / makespan if makespan > 0 else 0.0
+
+        n = len(self.per_process) or 1
+        self.avg_waiting    = waiting / n
+        self.avg_turnaround = turnaround / n
+        self.avg_response   = response / n
+
+    def updated(self, changed, removed=(), start=None, end=None, busy_delta=0, switch_delta=0):
+        """
+        Metrics after an incremental re-schedule, at a cost that depends on
+        the processes touched rather than on all of them. Returns a new
+        Metrics; this one may be shared (e.g. by a ResultCache) and is left
+        as it is.
+
+        changed       – pid → new ProcessMetrics (new pids are added)
+        removed       – pids no longer in the workload
+        start, end    – new time span (unchanged if None)
+        busy_delta, switch_delta – change in busy_time / context_switches
+        """
+        m = object.__new__(Metrics)
+        m.__dict__.update(self.__dict__)
+        m.per_process = per_process = dict(self.per_process)
+        m._totals     = list(self._totals)
+        m._add([per_process[pid] for pid in (*changed, *removed) if pid in per_process], -1)
+        for pid in removed:
+            per_process.pop(pid, None)
+        per_process.update(changed)
+        m._add(changed.values(), 1)
+        if start is not None:
+            m.start = start
+        if end is not None:
+            m.end = end
+        m.busy_time        += busy_delta
+        m.context_switches += switch_delta
+        m._derive()
+        return m
+
+    SUMMARY = ("start", "end", "makespan", "busy_time", "cores", "completed",
+               "cpu_utilization", "throughput", "context_switches", "preemptions",
+               "overhead_time", "overhead_ratio", "avg_waiting", "avg_turnaround", "avg_response")
+
+    def as_dict(self):
+        """Plain (JSON-serialisable) form: the aggregates plus a per-process list."""
+        out = {name: getattr(self, name) for name in self.SUMMARY}
+        out["per_process"] = [m.as_dict() for m in self.per_process.values()]
+        return out
+
+    def __repr__(self):
+        return (f"Metrics(avg_waiting={self.avg_waiting:.2f}, "
+                f"avg_turnaround={self.avg_turnaround:.2f}, "
+                f"avg_response={self.avg_response:.2f}, "
+                f"utilization={self.cpu_utilization:.2f}, "
+                f"throughput={self.throughput:.3f}, "
+                f"context_switches={self.context_switches}, "
+                f"preemptions={self.preemptions})")
+
+
+# pid of the scheduling-overhead segments charged by algorithms.overhead
+OVERHEAD = "overhead"
+
+
+def _is_idle(pid):
+    return pid is None or pid == ""
+
+
+def compute_metrics(timeline, processes, lanes=None):
+    """
+    Derive per-process and aggregate metrics in a single pass over the timeline.
+
+    timeline  – list of (pid, start, end), sorted by start; idle segments
+                (pid "" or None) are ignored, overhead segments (pid
+                OVERHEAD) only add to overhead_time
+    processes – the scheduled Process objects (for arrival/burst)
+    lanes     – optional per-core timelines; context switches are counted
+                per lane, otherwise over `timeline` as one core
+
+    Adjacent segments of the same process are treated as one segment. A
+    process is preempted when it stops with part of its burst (or, for
+    periodic tasks, of its current job) left and resumes later.
+    """
+    per_process = {p.pid: ProcessMetrics(p.pid, p.arrival_time, p.burst_time) for p in processes}
+    last_end    = {}  # pid → end of its latest segment
+    busy_time   = 0
+    overhead    = 0
+    first       = min((p.arrival_time for p in processes), default=0)
+    last        = first
+
+    # 1) One pass over the merged timeline
+    for pid, start, end in timeline:
+        if _is_idle(pid):
+            continue
+        if pid == OVERHEAD:
+            overhead += end - start
+            continue
+        m = per_process.get(pid)
+        if m is None:
+            continue
+        busy_time += end - start
+        if start < first:
+            first = start
+        if end > last:
+            last = end
+
+        prev_end = last_end.get(pid)
+        if prev_end is None:
+            m.first_start = start
+            m.segments    = 1
+        elif start > prev_end:
+            m.segments += 1
+            # stopped mid-burst (mid-job for periodic tasks) → preempted
+            left = m.service % m.burst if m.burst else 0
+            if 1e-9 < left < m.burst - 1e-9:
+                m.preemptions += 1
+        m.service += end - start
+        last_end[pid] = max(end, prev_end) if prev_end is not None else end
+
+    # 2) Derived per-process values
+    for pid, m in per_process.items():
+        if pid not in last_end:
+            continue
+        m.completion = last_end[pid]
+        m.response   = m.first_start - m.arrival
+        m.turnaround = m.completion - m.arrival
+        m.waiting    = m.turnaround - m.burst
+
+    # 3) Context switches: running process changes on a core
+    switches = 0
+    for lane in (lanes or [timeline]):
+        prev = None
+        for pid, _, _ in lane:
+            if _is_idle(pid) or pid == OVERHEAD:
+                continue
+            if prev is not None and pid != prev:
+                switches += 1
+            prev = pid
+
+    cores = len(lanes) if lanes else 1
+    return Metrics(per_process, first, last, busy_time, cores, switches, overhead)
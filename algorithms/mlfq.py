@@ -0,0 +1,135 @@
+from collections import deque
+from algorithms.scheduler import Scheduler
+
+class MultilevelFeedbackQueueScheduler(Scheduler):
+    """
+    Multilevel Feedback Queue scheduling.
+
+    Rules:
+      - new processes enter the top queue (level 0)
+      - the highest non-empty queue runs, round robin within the level
+      - a process that uses up its level's quantum is demoted one level
+      - a process preempted by a new arrival (or a boost) keeps its place
+        and the quantum it has already used
+      - every `boost_interval` time units all processes return to level 0
+
+    Queues are deques and a bitmask tracks the non-empty levels, so picking
+    the next process and moving it between levels are O(1); a boost is
+    linear in the number of queued processes.
+
+    Parameters:
+        quanta         – time quantum per level, top level first
+        boost_interval – period of the priority boost (None → never)
+    """
+    def __init__(self, quanta=(2, 4, 8), boost_interval=50):
+        super().__init__()
+        if not quanta:
+            raise ValueError("MLFQ needs at least one level")
+        self.quanta         = tuple(quanta)
+        self.boost_interval = boost_interval
+        self.demotions      = 0
+        self.boosts         = 0
+
+    def schedule(self):
+        self.demotions = 0
+        self.boosts    = 0
+        if not self.processes:
+            return
+
+        levels    = len(self.quanta)
+        queues    = [deque() for _ in range(levels)]
+        mask      = 0  # bit i set ⇔ queues[i] is non-empty
+        order     = sorted(self.processes, key=lambda p: p.arrival_time)
+        remaining = {p.pid: p.burst_time for p in order}
+        used      = {}  # pid → quantum used at the current level
+        index     = 0
+
+        current_time = order[0].arrival_time
+        next_boost   = self.boost_interval if self.boost_interval else None
+        while next_boost is not None and next_boost <= current_time:
+            next_boost += self.boost_interval
+
+        def push(p, lvl, front=False):
+            nonlocal mask
+            if front:
+                queues[lvl].appendleft(p)
+            else:
+                queues[lvl].append(p)
+            mask |= 1 << lvl
+
+        def pop(lvl):
+            nonlocal mask
+            p = queues[lvl].popleft()
+            if not queues[lvl]:
+                mask &= ~(1 << lvl)
+            return p
+
+        def admit(t):
+            nonlocal index
+            while index < len(order) and order[index].arrival_time <= t:
+                p = order[index]
+                used[p.pid] = 0
+                push(p, 0)
+                index += 1
+
+        def boost():
+            nonlocal mask
+            for lvl in range(1, levels):
+                while queues[lvl]:
+                    p = queues[lvl].popleft()
+                    used[p.pid] = 0
+                    push(p, 0)
+                mask &= ~(1 << lvl)
+            for p in queues[0]:
+                used[p.pid] = 0
+            self.boosts += 1
+
+        while mask or index < len(order):
+            admit(current_time)
+            if not mask:
+                # idle until the next arrival; boosts in between are no-ops
+                current_time = order[index].arrival_time
+                while next_boost is not None and next_boost <= current_time:
+                    next_boost += self.boost_interval
+                continue
+
+            lvl  = (mask & -mask).bit_length() - 1
+            proc = pop(lvl)
+
+            # run until quantum expiry, completion, a boost, or — below the
+            # top level — the next arrival, which would preempt us
+            run = min(self.quanta[lvl] - used[proc.pid], remaining[proc.pid])
+            if next_boost is not None:
+                run = min(run, next_boost - current_time)
+            if lvl > 0 and index < len(order):
+                run = min(run, order[index].arrival_time - current_time)
+
+            start = current_time
+            current_time += run
+            self._append_segment(proc.pid, start, current_time)
+            remaining[proc.pid] -= run
+            used[proc.pid]      += run
+
+            admit(current_time)
+            boosting = next_boost is not None and current_time >= next_boost
+
+            # a finished process is simply not queued again
+            if remaining[proc.pid] > 0:
+                if used[proc.pid] >= self.quanta[lvl]:
+                    # quantum used up → demote (the bottom level just rotates)
+                    used[proc.pid] = 0
+                    if lvl + 1 < levels:
+                        self.demotions += 1
+                        push(proc, lvl + 1)
+                    else:
+                        push(proc, lvl)
+                else:
+                    # preempted → resume first at the same level
+                    push(proc, lvl, front=True)
+
+            if boosting:
+                boost()
+                next_boost += self.boost_interval
+
+        self.update_metrics()
+        return self.result
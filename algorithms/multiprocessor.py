@@ -0,0 +1,285 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.scheduler import Scheduler
+from algorithms.process import Process
+from algorithms.rms import RateMonotonicScheduler
+from algorithms.dfs import DeadlineFirstScheduler
+from algorithms.utils import hyperperiod
+from algorithms.jobs import JobLog
+
+
+class GlobalScheduler(Scheduler):
+    """
+    Base class for global (migrating) scheduling on M identical cores.
+
+    At every tick the M highest-priority ready tasks run, one per core.
+    A task that keeps running stays on the core it used in the previous
+    tick; newcomers take the lowest-numbered free core.
+
+    Attributes (besides Scheduler's):
+        cores          – number of identical cores
+        core_timelines – one (pid, start, end) list per core
+        migrations     – how often a task resumed on a different core
+        jobs           – JobLog with one record per job release
+    """
+    def __init__(self, cores=2, horizon=None):
+        super().__init__()
+        if cores < 1:
+            raise ValueError("cores must be at least 1")
+        self.cores          = cores
+        self.horizon        = horizon
+        self.core_timelines = []
+        self.migrations     = 0
+        self.jobs           = JobLog()
+
+    def priority(self, info):
+        """Sort key for a ready task; smaller runs first."""
+        raise NotImplementedError
+
+    def schedule(self):
+        self.core_timelines = [[] for _ in range(self.cores)]
+        self.migrations     = 0
+        if not self.processes:
+            return
+
+        # 1) Validate
+        name = type(self).__name__
+        for p in self.processes:
+            if p.period is None:
+                raise ValueError(f"{name} requires a period for Process {p.pid}")
+
+        # 2) Horizon = hyperperiod unless overridden
+        hyper = hyperperiod(int(p.period) for p in self.processes)
+        if self.horizon is not None:
+            hyper = int(self.horizon)
+
+        # 3) Runtime state, same shape as the uniprocessor schedulers
+        RT = {}
+        for p in self.processes:
+            deadline = p.deadline if p.deadline is not None else p.period
+            RT[p.pid] = {
+                'orig_period'     : int(p.period),
+                'orig_capacity'   : int(p.burst_time),
+                'orig_deadline'   : int(deadline),
+                'current_capacity': int(p.burst_time),
+                'current_deadline': int(deadline),
+            }
+
+        # every task releases its first job at t=0
+        self.jobs = JobLog()
+        for pid, info in RT.items():
+            self.jobs.release(pid, 0, info['current_deadline'])
+
+        last_core = {}  # pid → core it last ran on
+        prev      = {}  # pid → core it ran on in the previous tick
+
+        # 4) Tick-by-tick simulation
+        for t in range(hyper):
+            ready  = [pid for pid, info in RT.items() if info['current_capacity'] > 0]
+            chosen = heapq.nsmallest(self.cores, ready, key=lambda i: self.priority(RT[i]))
+
+            # a) keep running tasks on their core, place the rest on free cores
+            placed = {pid: prev[pid] for pid in chosen if pid in prev}
+            free   = sorted(set(range(self.cores)) - set(placed.values()))
+            for pid in chosen:
+                if pid not in placed:
+                    placed[pid] = free.pop(0)
+
+            for pid, core in placed.items():
+                if pid in last_core and last_core[pid] != core:
+                    self.migrations += 1
+                last_core[pid] = core
+                RT[pid]['current_capacity'] -= 1
+                self.jobs.run(pid, 1)
+                if RT[pid]['current_capacity'] == 0:
+                    self.jobs.complete(pid, t + 1)
+
+                lane = self.core_timelines[core]
+                if lane and lane[-1][0] == pid and lane[-1][2] == t:
+                    lane[-1][2] = t + 1
+                else:
+                    lane.append([pid, t, t + 1])
+            prev = placed
+
+            # b) reload every task whose period ends with this tick
+            for pid, info in RT.items():
+                if (t + 1) % info['orig_period'] == 0:
+                    info['current_capacity'] = info['orig_capacity']
+                    info['current_deadline'] = (t + 1) + info['orig_deadline']
+                    if t + 1 < hyper:
+                        self.jobs.release(pid, t + 1, info['current_deadline'])
+        self.jobs.close(hyper)
+
+        # 5) Freeze lanes and build the combined (overlapping) timeline
+        self.core_timelines = [[tuple(seg) for seg in lane] for lane in self.core_timelines]
+        self.timeline = sorted(
+            (seg for lane in self.core_timelines for seg in lane),
+            key=lambda seg: seg[1]
+        )
+
+        # 6) Metrics, same convention as RM/EDF: last segment end is completion
+        self.update_metrics()
+        return self.result
+
+
+class GlobalDeadlineFirstScheduler(GlobalScheduler):
+    """Global EDF: the M jobs with the earliest absolute deadlines run."""
+    def priority(self, info):
+        return info['current_deadline']
+
+
+class GlobalRateMonotonicScheduler(GlobalScheduler):
+    """Global RM: the M tasks with the shortest periods run."""
+    def priority(self, info):
+        return info['orig_period']
+
+
+# ─── Partitioned scheduling ──────────────────────────────────────────────────
+
+HEURISTICS = ("first_fit", "best_fit", "worst_fit")
+
+
+def utilization(p):
+    """Per-task load used for packing: C / min(D, T)."""
+    window = p.period
+    if p.deadline is not None:
+        window = min(window, p.deadline)
+    return p.burst_time / window
+
+
+def fits(policy, loads):
+    """Uniprocessor admission test for a list of per-task utilizations."""
+    total = sum(loads)
+    if policy == "EDF":
+        return total <= 1.0
+    n = len(loads)
+    return total <= n * (2 ** (1 / n) - 1)  # Liu & Layland
+
+
+def partition(processes, cores, policy="EDF", heuristic="first_fit"):
+    """
+    Assign tasks to cores with a decreasing-utilization bin-packing heuristic.
+
+    Returns (bins, unassigned): bins is one list of Processes per core,
+    unassigned holds the tasks that fit on no core.
+    """
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic {heuristic!r}; expected one of {HEURISTICS}")
+
+    bins       = [[] for _ in range(cores)]
+    loads      = [[] for _ in range(cores)]
+    unassigned = []
+    for p in sorted(processes, key=utilization, reverse=True):
+        u = utilization(p)
+        candidates = [c for c in range(cores) if fits(policy, loads[c] + [u])]
+        if not candidates:
+            unassigned.append(p)
+            continue
+        if heuristic == "first_fit":
+            core = candidates[0]
+        elif heuristic == "best_fit":
+            core = max(candidates, key=lambda c: sum(loads[c]))
+        else:
+            core = min(candidates, key=lambda c: sum(loads[c]))
+        bins[core].append(p)
+        loads[core].append(u)
+    return bins, unassigned
+
+
+def _simulate_partition(policy, horizon, tasks):
+    """Worker entry point: run one core's task set and return its timeline and jobs."""
+    sched = RateMonotonicScheduler(horizon) if policy == "RM" else DeadlineFirstScheduler(horizon)
+    for pid, arrival, burst, deadline, period in tasks:
+        sched.add_process(Process(pid, arrival, burst, deadline=deadline, period=period))
+    sched.schedule()
+    return sched.timeline, sched.jobs
+
+
+class PartitionedScheduler(Scheduler):
+    """
+    Partitioned RM/EDF on M identical cores.
+
+    Tasks are packed onto cores (first-, best- or worst-fit decreasing) and
+    each core is then simulated on its own by the uniprocessor scheduler,
+    in parallel worker processes, over the global hyperperiod.
+
+    Parameters:
+        cores     – number of identical cores
+        policy    – "RM" or "EDF"
+        heuristic – "first_fit", "best_fit" or "worst_fit"
+        workers   – size of the process pool (None → one per partition,
+                    0 → simulate in this process)
+
+    Tasks without a deadline get an implicit one at the end of their
+    period. Tasks that fit on no core are kept in `unassigned`; they never
+    run, so they appear in the metrics as unfinished and every job they
+    release is recorded in `jobs` as a miss (pending at the horizon if its
+    deadline lies beyond it).
+    """
+    def __init__(self, cores=2, policy="EDF", heuristic="first_fit", workers=None):
+        super().__init__()
+        if policy not in ("RM", "EDF"):
+            raise ValueError(f"Unknown policy {policy!r}; expected 'RM' or 'EDF'")
+        self.cores          = cores
+        self.policy         = policy
+        self.heuristic      = heuristic
+        self.workers        = workers
+        self.partitions     = []
+        self.unassigned     = []
+        self.core_timelines = []
+        self.jobs           = JobLog()
+
+    def schedule(self):
+        self.core_timelines = [[] for _ in range(self.cores)]
+        self.jobs           = JobLog()
+        if not self.processes:
+            return
+        for p in self.processes:
+            if p.period is None:
+                raise ValueError(f"Partitioned {self.policy} requires a period for Process {p.pid}")
+
+        # 1) Pack tasks onto cores
+        self.partitions, self.unassigned = partition(
+            self.processes, self.cores, self.policy, self.heuristic
+        )
+
+        # 2) Simulate every non-empty partition over the common horizon
+        horizon = hyperperiod(int(p.period) for p in self.processes)
+        jobs = [
+            # as in GlobalScheduler, a task without a deadline has an implicit one
+            (core, [(p.pid, p.arrival_time, p.burst_time,
+                     p.deadline if p.deadline is not None else p.period, p.period) for p in tasks])
+            for core, tasks in enumerate(self.partitions) if tasks
+        ]
+        if self.workers == 0 or len(jobs) <= 1:
+            outputs = [_simulate_partition(self.policy, horizon, tasks) for _, tasks in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers or len(jobs)) as pool:
+                outputs = list(pool.map(
+                    _simulate_partition,
+                    [self.policy] * len(jobs),
+                    [horizon] * len(jobs),
+                    [tasks for _, tasks in jobs]
+                ))
+
+        # 3) Collect per-core timelines and jobs, derive metrics across cores
+        for (core, _), (timeline, core_jobs) in zip(jobs, outputs):
+            self.core_timelines[core] = timeline
+            self.jobs.merge(core_jobs)
+
+        # 4) Tasks that fit no core never run: every job they release misses
+        dropped = JobLog()
+        for p in self.unassigned:
+            period   = int(p.period)
+            deadline = int(p.deadline if p.deadline is not None else p.period)
+            for t in range(0, horizon, period):
+                dropped.release(p.pid, t, t + deadline)
+        dropped.close(horizon)
+        self.jobs.merge(dropped)
+        self.timeline = sorted(
+            (seg for lane in self.core_timelines for seg in lane),
+            key=lambda seg: seg[1]
+        )
+        self.update_metrics()
+        return self.result
@@ -0,0 +1,264 @@
+"""
+Scheduling-overhead cost model.
+
+The schedulers treat dispatching as free. An OverheadModel charges, at
+every dispatch, i.e. whenever a core starts a process after idle time or
+after another process:
+
+    decision       – decision + per_ready × (processes with pending work):
+                     the scheduler picking the next process
+    context_switch – when the core last ran a different process
+    cache_reload   – when the process resumes in the middle of a burst (or,
+                     for periodic tasks, a job) after being preempted
+
+Each charge becomes an explicit segment with pid OVERHEAD on the core's
+timeline. The scheduling decisions stay those of the overhead-free run;
+execution is retimed around the charges, so a charge delays everything
+after it on that core until idle time absorbs the delay, and a process
+never runs on two cores at once. Metrics count overhead segments in
+`overhead_time`, not as busy time, so cpu_utilization, throughput and
+the per-process times show what switching costs.
+
+    sched.overhead = OverheadModel(context_switch=0.2, decision=0.05, cache_reload=0.5)
+    sched.schedule()
+    sched.metrics.overhead_time, sched.overhead_stats
+
+compare_overhead() runs several schedulers with and without a model and
+reports the throughput each one loses.
+"""
+import bisect
+import heapq
+
+from algorithms.metrics import OVERHEAD, _is_idle
+
+_EPS = 1e-9
+
+
+class OverheadModel:
+    """
+    context_switch – fixed cost of switching a core to a different process
+    decision       – fixed cost of every scheduling decision (dispatch)
+    per_ready      – extra decision cost per other process with pending work
+    cache_reload   – penalty when a preempted process resumes
+    """
+    def __init__(self, context_switch=0, decision=0, per_ready=0, cache_reload=0):
+        for name, value in (("context_switch", context_switch), ("decision", decision),
+                            ("per_ready", per_ready), ("cache_reload", cache_reload)):
+            if value < 0:
+                raise ValueError(f"{name} cost must be non-negative, got {value}")
+        self.context_switch = context_switch
+        self.decision       = decision
+        self.per_ready      = per_ready
+        self.cache_reload   = cache_reload
+
+    def params(self):
+        return {
+            "context_switch": self.context_switch,
+            "decision"      : self.decision,
+            "per_ready"     : self.per_ready,
+            "cache_reload"  : self.cache_reload,
+        }
+
+    def __repr__(self):
+        return "OverheadModel(" + ", ".join(f"{k}={v}" for k, v in self.params().items()) + ")"
+
+    def charge(self, timeline, processes, lanes=None):
+        """
+        Retime a schedule with this model's costs.
+
+        timeline  – list of (pid, start, end); with `lanes`, the merged
+                    timeline of the per-core lanes
+        processes – the scheduled Process objects (arrival, burst, period)
+
+        Returns (timeline, lanes, stats, retime): the charged timeline, the
+        charged lanes (None without `lanes`), totals per cost kind and a
+        function mapping a time inside a process's original execution to
+        the same point of its charged execution.
+        """
+        lanes_in = lanes or [timeline]
+        procs    = {}
+        for p in processes:
+            procs.setdefault(p.pid, p)
+        horizon  = max((seg[2] for lane in lanes_in for seg in lane), default=0)
+
+        # processes with pending work at each dispatch, kept up to date from
+        # releases (periodic tasks release a job every period) and from the
+        # ends of segments, after which a process with work left waits again
+        events   = [(p.arrival_time, 1, pid) for pid, p in procs.items()]  # (time, kind, pid)
+        heapq.heapify(events)
+        released = dict.fromkeys(procs, 0)
+        service  = dict.fromkeys(procs, 0)
+        running  = dict.fromkeys(procs, 0)  # cores the process is on
+        pending  = set()
+
+        def advance(t):
+            while events and events[0][0] <= t:
+                at, kind, pid = heapq.heappop(events)
+                p = procs[pid]
+                if kind == 0:
+                    running[pid] -= 1
+                else:
+                    released[pid] += 1
+                    if p.period and at + p.period < horizon:
+                        heapq.heappush(events, (at + p.period, 1, pid))
+                if not running[pid] and released[pid] * p.burst_time > service[pid] + _EPS:
+                    pending.add(pid)
+
+        # every segment in order of its original start, ties by core
+        order = sorted((seg[1], core, k) for core, lane in enumerate(lanes_in) for k, seg in enumerate(lane))
+
+        stats   = self.new_stats()
+        out     = [[] for _ in lanes_in]
+        cursor  = [None] * len(lanes_in)  # charged end of the core's last segment
+        last    = [None] * len(lanes_in)  # (pid, original end) of the core's last busy segment
+        pid_end = {}                      # charged end of each process's latest segment
+        moved   = {}                      # pid → ([original starts], [charged starts])
+
+        for start, core, k in order:
+            pid, _, end = lanes_in[core][k]
+            if pid == OVERHEAD:
+                continue
+            now = start if cursor[core] is None else max(start, cursor[core])
+            if _is_idle(pid) or pid not in procs:
+                # idle time absorbs the delay; unknown pids just move along
+                if _is_idle(pid) and end <= now:
+                    continue
+                seg_end = end if _is_idle(pid) or now == start else now + end - start
+                out[core].append((pid, now, seg_end))
+                cursor[core] = seg_end
+                continue
+
+            advance(start)
+            prev = last[core]
+            cost = 0
+            if prev is None or prev[0] != pid or prev[1] < start - _EPS:
+                p    = procs[pid]
+                done = service[pid] % p.burst_time if p.burst_time else 0
+                cost = self.dispatch(stats,
+                                     switch  = prev is not None and prev[0] != pid,
+                                     ready   = len(pending) - (pid in pending),
+                                     resumed = _EPS < done < p.burst_time - _EPS)
+            if cost > 0:
+                out[core].append((OVERHEAD, now, now + cost))
+                now += cost
+            now     = max(now, pid_end.get(pid, now))
+            seg_end = end if now == start else now + end - start
+            out[core].append((pid, now, seg_end))
+            starts, charged = moved.setdefault(pid, ([], []))
+            starts.append(start)
+            charged.append(now)
+
+            cursor[core]  = pid_end[pid] = seg_end
+            last[core]    = (pid, end)
+            service[pid] += end - start
+            running[pid] += 1
+            pending.discard(pid)
+            heapq.heappush(events, (end, 0, pid))
+
+        def retime(pid, t):
+            entry = moved.get(pid)
+            if entry is None:
+                return t
+            starts, charged = entry
+            i = bisect.bisect_left(starts, t) - 1
+            if i < 0 or charged[i] == starts[i]:
+                return t
+            return charged[i] + (t - starts[i])
+
+        if lanes is None:
+            return out[0], None, stats, retime
+        merged = sorted((seg for lane in out for seg in lane), key=lambda seg: seg[1])
+        return merged, out, stats, retime
+
+    def new_stats(self):
+        return {"dispatches": 0, "decision": 0, "context_switch": 0, "cache_reload": 0, "total": 0}
+
+    def dispatch(self, stats, switch, ready, resumed):
+        """
+        Cost of one dispatch, added to `stats` (see new_stats).
+
+        switch  – the core last ran a different process
+        ready   – other processes with pending work
+        resumed – the process continues a preempted burst or job
+        """
+        decision = self.decision + self.per_ready * ready
+        switch   = self.context_switch if switch else 0
+        reload   = self.cache_reload if resumed else 0
+        stats["dispatches"]     += 1
+        stats["decision"]       += decision
+        stats["context_switch"] += switch
+        stats["cache_reload"]   += reload
+        stats["total"]          += decision + switch + reload
+        return decision + switch + reload
+
+
+def compare_overhead(processes, model, algorithms=("FCFS", "SJN", "RR", "MLFQ", "RM", "DF"), params=None):
+    """
+    Run every algorithm on `processes` without and with `model`; one row
+    per algorithm with both throughputs, the fraction of throughput lost,
+    the overhead time by kind and, for periodic schedulers, deadline misses
+    (without, with).
+
+    params – algorithm name → constructor arguments (RR defaults to quantum 2)
+    """
+    from algorithms import registry
+
+    params = {"RR": {"time_quantum": 2}, **(params or {})}
+    rows   = []
+    for name in algorithms:
+        runs = []
+        for overhead in (None, model):
+            sched = registry.create(name, **params.get(name, {}))
+            sched.overhead = overhead
+            for p in processes:
+                sched.add_process(p)
+            sched.schedule()
+            runs.append(sched)
+        ideal, charged = runs
+        jobs = getattr(charged, "jobs", None)
+        rows.append({
+            "algorithm"       : name,
+            "throughput_ideal": ideal.metrics.throughput,
+            "throughput"      : charged.metrics.throughput,
+            "lost"            : 1 - charged.metrics.throughput / ideal.metrics.throughput
+                                if ideal.metrics.throughput else 0.0,
+            "overhead_time"   : charged.metrics.overhead_time,
+            "overhead_ratio"  : charged.metrics.overhead_ratio,
+            "context_switches": charged.metrics.context_switches,
+            "overhead"        : charged.overhead_stats,
+            "misses"          : (sum(ideal.jobs.missed), sum(jobs.missed)) if jobs is not None else None,
+        })
+    return rows
+
+
+def main(argv=None):
+    import argparse
+
+    from algorithms.utils import generate_random_processes
+
+    parser = argparse.ArgumentParser(description="Throughput lost to scheduling overhead, per algorithm")
+    parser.add_argument("-n", type=int, default=8, help="random periodic tasks")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--switch", type=float, default=0.1, help="context-switch cost")
+    parser.add_argument("--decision", type=float, default=0.02, help="cost per scheduling decision")
+    parser.add_argument("--per-ready", type=float, default=0.005, help="decision cost per ready process")
+    parser.add_argument("--reload", type=float, default=0.2, help="cache-reload penalty after preemption")
+    args = parser.parse_args(argv)
+
+    import random
+    random.seed(args.seed)
+    processes = generate_random_processes(args.n, include_period=True, include_deadline=True)
+    model     = OverheadModel(args.switch, args.decision, args.per_ready, args.reload)
+    print(model)
+    print(f"{'algorithm':9s} {'ideal':>8s} {'charged':>8s} {'lost':>6s} {'overhead':>9s} "
+          f"{'switch':>7s} {'decide':>7s} {'reload':>7s} {'misses':>10s}")
+    for r in compare_overhead(processes, model):
+        o      = r["overhead"]
+        misses = "{}→{}".format(*r["misses"]) if r["misses"] is not None else "-"
+        print(f"{r['algorithm']:9s} {r['throughput_ideal']:8.4f} {r['throughput']:8.4f} {r['lost']:6.1%} "
+              f"{r['overhead_ratio']:9.1%} {o['context_switch']:7.2f} {o['decision']:7.2f} "
+              f"{o['cache_reload']:7.2f} {misses:>10s}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""
+Cost model and engine selection.
+
+plan() predicts, for a workload and an algorithm, how long each available
+engine would take and how much memory its results would need, then picks
+the cheapest engine that fits a Budget. If nothing fits it downgrades to
+analysis only (periodic task sets, where schedulability can be judged
+without simulating) or refuses, and the returned Plan says why.
+
+    p = plan("RM", processes, budget=Budget(max_seconds=1))
+    print(p)                     # decision, engine, estimates, reason
+    sched_or_analysis = p.execute(processes)
+
+Engines:
+    tick       – RM/DF/global schedulers: one step per time unit of the
+                 hyperperiod, cost ~ hyperperiod × tasks
+    event      – RM/DF: one step per release or completion, cost ~ jobs × tasks
+    loop       – the plain scheduler (FCFS's sequential loop, SJN, RR, ...)
+    vectorized – FCFS with numpy
+    analytic   – no simulation; utilization-based schedulability only
+"""
+import math
+import time
+
+from algorithms import registry
+from algorithms.utils import hyperperiod
+
+PERIODIC = ("RM", "DF", "GEDF", "GRM", "PART")
+
+
+class Budget:
+    """Limits for a single run; None disables a limit."""
+    def __init__(self, max_seconds=5.0, max_bytes=512 * 2**20, max_segments=None):
+        self.max_seconds  = max_seconds
+        self.max_bytes    = max_bytes
+        self.max_segments = max_segments
+
+    def violations(self, estimate):
+        """Human-readable reasons `estimate` does not fit, empty if it does."""
+        out = []
+        if self.max_seconds is not None and estimate.seconds > self.max_seconds:
+            out.append(f"~{estimate.seconds:.3g}s > {self.max_seconds:g}s")
+        if self.max_bytes is not None and estimate.bytes > self.max_bytes:
+            out.append(f"~{estimate.bytes / 2**20:.3g} MiB > {self.max_bytes / 2**20:g} MiB")
+        if self.max_segments is not None and estimate.segments > self.max_segments:
+            out.append(f"~{estimate.segments:.0f} segments > {self.max_segments}")
+        return out
+
+
+class Estimate:
+    """Predicted cost of running one engine."""
+    def __init__(self, engine, seconds, bytes, segments=0):
+        self.engine   = engine
+        self.seconds  = seconds
+        self.bytes    = bytes
+        self.segments = segments
+
+    def __repr__(self):
+        return (f"Estimate({self.engine}: {self.seconds:.3g}s, "
+                f"{self.bytes / 2**20:.3g} MiB, {self.segments:.0f} segments)")
+
+
+class CostModel:
+    """
+    Per-operation costs in seconds (and bytes), measured on a typical
+    machine with ~10⁵ processes; estimates are good to about a factor of
+    two. calibrate() re-measures the engine constants on this one.
+    """
+    def __init__(self):
+        self.tick_task    = 1.1e-6   # one task checked in one tick
+        self.event_task   = 1.4e-6   # one task checked at one event
+        self.segment      = 2.0e-6   # recording + deriving metrics for one segment
+        self.process      = 4.0e-6   # sorting + per-process metrics
+        self.loop_process = 1.0e-6   # FCFS loop, per process
+        self.vector_fixed = 2e-4     # numpy set-up
+        self.vector_process = 0.8e-6 # numpy FCFS, per process (attribute access dominates)
+        self.heap_op      = 0.2e-6   # one heap push/pop
+        self.boost_process = 0.3e-6  # MLFQ, one queued process moved by a boost
+        self.bytes_segment = 100
+        self.bytes_job     = 45
+        self.bytes_process = 400
+
+    def calibrate(self):
+        """
+        Re-time the RM/DF tick and event engines, whose relative cost
+        decides between them. The per-segment and per-process costs depend
+        on the working set more than on the machine and keep their defaults.
+        """
+        from algorithms.process import Process
+
+        def timed(algorithm, procs, **params):
+            sched = registry.create(algorithm, **params)
+            for p in procs:
+                sched.add_process(p)
+            t = time.perf_counter()
+            sched.schedule()
+            return time.perf_counter() - t, sched
+
+        tasks = [Process(i, 0, 1 + i % 3, deadline=p, period=p) for i, p in enumerate((7, 11, 13, 17))]
+        hyper = hyperperiod(p.period for p in tasks)
+        secs, sched = timed("DF", tasks, engine="tick")
+        segs = len(sched.timeline)
+        self.tick_task = max(secs - segs * self.segment, secs / 2) / (hyper * len(tasks))
+        secs, sched = timed("DF", tasks, engine="event")
+        self.event_task = max(secs - segs * self.segment, secs / 2) / (2 * len(sched.jobs) * len(tasks))
+        return self
+
+    # ─── per-algorithm estimates ─────────────────────────────────────────────
+
+    def estimates(self, algorithm, processes, **params):
+        """Estimate for every engine that can run `algorithm` (analytic included)."""
+        algorithm = algorithm.upper()
+        n = len(processes)
+        base = self.bytes_process * n
+        out  = []
+
+        if algorithm in PERIODIC:
+            stats = periodic_stats(processes, params.get("horizon"))
+            H, J  = stats["hyperperiod"], stats["jobs"]
+            S     = min(2 * J, H)
+            mem   = base + self.bytes_segment * S + self.bytes_job * J
+            if algorithm in ("RM", "DF"):
+                out.append(Estimate("tick",  self.tick_task * H * n + self.segment * S, mem, S))
+                out.append(Estimate("event", self.event_task * 2 * J * n + self.segment * S, mem, S))
+            elif algorithm == "PART":
+                cores = params.get("cores", 2)
+                out.append(Estimate("tick", self.tick_task * H * n / cores + self.segment * S, mem, S))
+            else:
+                cores = params.get("cores", 2)
+                log = math.log2(max(n, 2))
+                out.append(Estimate("tick", self.tick_task * H * n * log + self.segment * S * cores, mem, S))
+            out.append(Estimate("analytic", 1e-6 * n, base))
+            return out
+
+        work  = sum(p.burst_time for p in processes)
+        fixed = self.process * n
+        if algorithm == "FCFS":
+            S = n
+            out.append(Estimate("loop", fixed + (self.loop_process + self.segment) * n,
+                                base + self.bytes_segment * S, S))
+            out.append(Estimate("vectorized", fixed + self.vector_fixed + (self.vector_process + self.segment) * n,
+                                base + self.bytes_segment * S + 24 * n, S))
+        elif algorithm == "SJN":
+            S = 2 * n
+            cost = fixed + 2 * self.heap_op * math.log2(max(n, 2)) * n + self.segment * S
+            out.append(Estimate("loop", cost,
+                                base + self.bytes_segment * S, S))
+        elif algorithm == "RR":
+            q = params.get("time_quantum", 2)
+            S = sum(math.ceil(p.burst_time / q) for p in processes) + n
+            out.append(Estimate("loop", fixed + self.segment * 2 * S, base + self.bytes_segment * S, S))
+        elif algorithm == "MLFQ":
+            quanta = params.get("quanta", (2, 4, 8))
+            S = sum(_mlfq_slices(p.burst_time, quanta) for p in processes) + n
+            # each boost walks the lower queues; under overload they hold the
+            # share of the work that arrives faster than it can be served
+            boost  = params.get("boost_interval", 50)
+            boosts = work / boost if boost else 0
+            backlog = n * max(0.0, 1 - _arrival_span(processes) / work) if work else 0
+            cost = fixed + self.segment * 2 * S + self.boost_process * boosts * backlog / 2
+            out.append(Estimate("loop", cost, base + self.bytes_segment * S, S))
+        else:
+            # proportional share (STRIDE, CFS): one heap round trip per slice
+            slice_ = params.get("time_quantum", params.get("min_granularity", 1)) or 1
+            S = work / slice_ + n
+            cost = fixed + (2 * self.heap_op * math.log2(max(n, 2)) + self.segment) * S
+            out.append(Estimate("loop", cost, base + self.bytes_segment * S, S))
+        return out
+
+
+def _arrival_span(processes):
+    arrivals = [p.arrival_time for p in processes]
+    return max(arrivals) - min(arrivals)
+
+
+def _mlfq_slices(burst, quanta):
+    """Slices a process of length `burst` needs going down the levels (no boosts)."""
+    slices, left = 0, burst
+    for q in quanta:
+        if left <= 0:
+            return slices
+        slices += 1
+        left   -= q
+    return slices + max(0, math.ceil(left / quanta[-1]))
+
+
+def periodic_stats(processes, horizon=None):
+    """Hyperperiod (or horizon), job count, utilization and density of a task set."""
+    for p in processes:
+        if p.period is None:
+            raise ValueError(f"Process {p.pid} has no period")
+    periods = [int(p.period) for p in processes]
+    H = int(horizon) if horizon is not None else hyperperiod(periods)
+    util    = [p.burst_time / p.period for p in processes]
+    density = [p.burst_time / min(p.period, p.deadline if p.deadline is not None else p.period)
+               for p in processes]
+    return {
+        "hyperperiod": H,
+        "jobs"       : sum(math.ceil(H / T) for T in periods),
+        "utilization": sum(util),
+        "max_utilization": max(util, default=0),
+        "density"    : sum(density),
+    }
+
+
+def analyze(algorithm, processes, **params):
+    """
+    Schedulability verdict without simulating: "schedulable" when a
+    sufficient test passes, "unschedulable" when a necessary one fails,
+    otherwise "unknown".
+    """
+    algorithm = algorithm.upper()
+    if algorithm not in PERIODIC:
+        raise ValueError(f"No analytic model for {algorithm}")
+    stats = periodic_stats(processes, params.get("horizon"))
+    n, U  = len(processes), stats["utilization"]
+    cores = params.get("cores", 2) if algorithm in ("GEDF", "GRM", "PART") else 1
+    tests = {}
+
+    if not n:
+        # nothing to schedule; the bounds below divide by n
+        return dict(stats, algorithm=algorithm, cores=cores, tests=tests, verdict="schedulable")
+    if U > cores:
+        verdict = "unschedulable"
+        tests["utilization <= cores"] = False
+    elif algorithm in ("DF", "RM") or (algorithm == "PART" and cores == 1):
+        if algorithm == "DF":
+            tests["density <= 1"] = stats["density"] <= 1
+        else:
+            tests["Liu-Layland bound"] = U <= n * (2 ** (1 / n) - 1)
+            tests["hyperbolic bound"]  = math.prod(p.burst_time / p.period + 1 for p in processes) <= 2
+        verdict = "schedulable" if any(tests.values()) else "unknown"
+    elif algorithm == "GEDF":
+        # Goossens, Funk & Baruah bound for implicit deadlines
+        tests["GFB bound"] = U <= cores - (cores - 1) * stats["max_utilization"]
+        verdict = "schedulable" if tests["GFB bound"] else "unknown"
+    else:
+        verdict = "unknown"
+    return dict(stats, algorithm=algorithm, cores=cores, tests=tests, verdict=verdict)
+
+
+class Plan:
+    """
+    Outcome of plan().
+
+    decision  – "run", "analyze" or "refuse"
+    engine    – chosen engine ("analytic" when analyzing, None when refused)
+    estimate  – Estimate for the chosen engine
+    estimates – every engine considered
+    reason    – one-line explanation
+    """
+    def __init__(self, algorithm, params, decision, engine, estimate, estimates, reason):
+        self.algorithm = algorithm
+        self.params    = params
+        self.decision  = decision
+        self.engine    = engine
+        self.estimate  = estimate
+        self.estimates = estimates
+        self.reason    = reason
+
+    def build(self):
+        """Scheduler configured for the chosen engine."""
+        if self.decision != "run":
+            raise ValueError(f"Plan for {self.algorithm} is {self.decision!r}: {self.reason}")
+        params = dict(self.params)
+        cls = registry.ALGORITHMS[self.algorithm]
+        if self.engine in getattr(cls, "ENGINES", ()):
+            params["engine"] = self.engine
+        return cls(**params)
+
+    def execute(self, processes):
+        """Scheduled scheduler for "run", analyze() result for "analyze"; raises when refused."""
+        if self.decision == "analyze":
+            return analyze(self.algorithm, processes, **self.params)
+        sched = self.build()
+        for p in processes:
+            sched.add_process(p)
+        sched.schedule()
+        return sched
+
+    def __repr__(self):
+        return (f"Plan({self.algorithm}: {self.decision} with {self.engine}, "
+                f"{self.estimate}; {self.reason})")
+
+
+def plan(algorithm, processes, budget=None, model=None, **params):
+    """Pick the cheapest engine within `budget` for running `algorithm` on `processes`."""
+    algorithm = algorithm.upper()
+    if algorithm not in registry.ALGORITHMS:
+        raise ValueError(f"Unknown algorithm {algorithm!r}; expected one of {sorted(registry.ALGORITHMS)}")
+    budget = budget or Budget()
+    model  = model or CostModel()
+    estimates = model.estimates(algorithm, processes, **params)
+    runnable  = sorted((e for e in estimates if e.engine != "analytic"), key=lambda e: e.seconds)
+    analytic  = next((e for e in estimates if e.engine == "analytic"), None)
+
+    for e in runnable:
+        if not budget.violations(e):
+            return Plan(algorithm, params, "run", e.engine, e, estimates,
+                        f"{e.engine} engine is the cheapest within budget")
+    cheapest = runnable[0]
+    why = ", ".join(budget.violations(cheapest))
+    if analytic is not None:
+        return Plan(algorithm, params, "analyze", "analytic", analytic, estimates,
+                    f"simulation over budget ({cheapest.engine}: {why}); analysis only")
+    return Plan(algorithm, params, "refuse", None, cheapest, estimates,
+                f"simulation over budget ({cheapest.engine}: {why})")
@@ -0,0 +1,129 @@
+"""
+Matplotlib rendering of scheduling timelines.
+
+matplotlib is imported lazily: nothing here is loaded until a chart is
+drawn, and when a chart is only saved to a file the figure is rendered
+through the Agg canvas without pyplot, so no display is needed.
+"""
+from algorithms.metrics import OVERHEAD, _is_idle
+
+OVERHEAD_COLOR = "dimgray"
+
+
+def _lanes_by_pid(timeline):
+    """
+    pid → ([starts], [ends]), in order of each pid's first segment;
+    scheduling overhead (see OverheadModel) gets one lane, last.
+    """
+    lanes = {}
+    for pid, start, end in timeline:
+        if _is_idle(pid) or end <= start:
+            continue
+        starts, ends = lanes.setdefault(pid, ([], []))
+        starts.append(start)
+        ends.append(end)
+    if OVERHEAD in lanes:
+        lanes[OVERHEAD] = lanes.pop(OVERHEAD)
+    return lanes
+
+
+def _lane_label(pid):
+    return "overhead" if pid == OVERHEAD else f"P{pid}"
+
+
+def plot_timeline(timeline, title="Gantt Chart", path=None, ax=None,
+                  min_label_width=0.02, max_labels=200, rasterize_above=2000, dpi=100):
+    """
+    Draw `timeline` as one swimlane per process, plus a neutral
+    "overhead" lane when the run was charged scheduling overhead.
+
+    Every process's segments are a single PolyCollection, so the cost is
+    one artist per process rather than one per segment. Labels are culled:
+    only segments at least `min_label_width` of the visible span wide get
+    one, at most `max_labels` of them (widest first). Timelines with more
+    than `rasterize_above` segments are rasterized so vector output (SVG,
+    PDF) stays small.
+
+    path – save to this file (format from the extension, e.g. .png or .svg)
+           using the Agg canvas; without a path the chart is shown with pyplot
+    ax   – draw into an existing Axes instead of creating a figure
+
+    Returns the Figure.
+    """
+    import numpy as np
+    from matplotlib.collections import PolyCollection
+
+    show = ax is None and path is None
+    if ax is None:
+        if show:
+            import matplotlib.pyplot as plt
+            fig, ax = plt.subplots()
+        else:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            fig = Figure()
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+    fig = ax.figure
+
+    lanes = _lanes_by_pid(timeline)
+    if not lanes:
+        return fig
+    t_min = min(min(starts) for starts, _ in lanes.values())
+    t_max = max(max(ends) for _, ends in lanes.values())
+    span  = max(t_max - t_min, 1)
+
+    raster = sum(len(starts) for starts, _ in lanes.values()) > rasterize_above
+    labels = []  # (width, x, y, text)
+    for row, (pid, (starts, ends)) in enumerate(lanes.items()):
+        s = np.asarray(starts, dtype=float)
+        e = np.asarray(ends, dtype=float)
+        y0, y1 = row - 0.4, row + 0.4
+        verts = np.empty((len(s), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = s
+        verts[:, 2, 0] = verts[:, 3, 0] = e
+        verts[:, 0, 1] = verts[:, 3, 1] = y0
+        verts[:, 1, 1] = verts[:, 2, 1] = y1
+        color = OVERHEAD_COLOR if pid == OVERHEAD else _color(row)
+        ax.add_collection(PolyCollection(
+            verts,
+            facecolors=color,
+            edgecolors="white",
+            linewidths=0 if raster else 0.5,
+            rasterized=raster
+        ))
+
+        if pid == OVERHEAD:
+            # dispatch costs are thin; the lane label is enough
+            continue
+        wide = np.nonzero(e - s >= min_label_width * span)[0]
+        labels.extend((e[i] - s[i], (s[i] + e[i]) / 2, row, f"P{pid}") for i in wide)
+
+    labels.sort(key=lambda lbl: -lbl[0])
+    for _, x, y, text in labels[:max_labels]:
+        ax.text(x, y, text, ha="center", va="center", color="white", fontsize=8)
+
+    ax.set_xlim(t_min, t_min + span)
+    ax.set_ylim(-0.6, len(lanes) - 0.4)
+    ax.set_yticks(range(len(lanes)))
+    ax.set_yticklabels([_lane_label(pid) for pid in lanes])
+    ax.invert_yaxis()
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Process")
+    ax.set_title(title)
+
+    if path is not None:
+        fig.savefig(path, dpi=dpi, bbox_inches="tight")
+    elif show:
+        plt.show()
+    return fig
+
+
+_PALETTE = (
+    "tab:blue", "tab:orange", "tab:green", "tab:red", "tab:purple",
+    "tab:brown", "tab:pink", "tab:gray", "tab:olive", "tab:cyan",
+)
+
+
+def _color(row):
+    return _PALETTE[row % len(_PALETTE)]
@@ -8,29 +8,38 @@ class Process:
         burst_time: CPU time required.
         deadline: (optional) absolute deadline.
         period:   (optional) periodic interval.
+        weight:   (optional) CPU share for proportional-share schedulers.
+        bursts:   (optional) alternating CPU and I/O bursts as (device, length)
+                  pairs, device "cpu" for CPU bursts, e.g.
+                  [("cpu", 4), ("disk", 6), ("cpu", 2)]; burst_time is
+                  then the total of the CPU bursts and may be passed as None.
+                  Only IOAwareScheduler simulates the I/O; the others run
+                  burst_time as one CPU burst.
     """
     def __init__(self,
                  pid,
                  arrival_time,
                  burst_time,
                  deadline=None,
-                 period=None):
-        self.pid            = pid
-        self.arrival_time   = arrival_time
-        self.burst_time     = burst_time
-        self.remaining_time = burst_time
+                 period=None,
+                 weight=1,
+                 bursts=None):
+        self.pid          = pid
+        self.arrival_time = arrival_time
+        self.bursts       = tuple((device, length) for device, length in bursts) if bursts else None
+        if self.bursts:
+            burst_time = sum(length for device, length in self.bursts if device == "cpu")
+        self.burst_time   = burst_time
 
         # store both, exactly as passed
         self.deadline = deadline
         self.period   = period
+        self.weight   = weight
 
-        # will be set during scheduling
-        self.start_time      = None
-        self.completion_time = None
-        self.waiting_time    = None
-        self.turnaround_time = None
+        # results are not stored here: schedule() returns a ScheduleResult
 
     def __repr__(self):
         return (f"Process(pid={self.pid}, arrival={self.arrival_time}, "
                 f"burst={self.burst_time}, deadline={self.deadline}, "
-                f"period={self.period})")
+                f"period={self.period}"
+                + (f", bursts={list(self.bursts)})" if self.bursts else ")"))
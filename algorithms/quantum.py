@@ -0,0 +1,148 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+def rr_kernel(arrivals, bursts, quantum, switch_cost=0):
+    """
+    Round Robin on plain arrays, without building a timeline.
+
+    arrivals, bursts – per-process values, already sorted by arrival
+    quantum          – time slice
+    switch_cost      – time charged whenever the CPU moves from one process
+                       to a different one (0 reproduces RoundRobinScheduler)
+
+    Returns (first_start, completion, switches), the first two indexed like
+    the inputs.
+    """
+    n          = len(arrivals)
+    remaining  = list(bursts)
+    first      = [None] * n
+    completion = [None] * n
+    queue      = deque()
+    index      = 0
+    t          = arrivals[0] if n else 0
+    last       = None
+    switches   = 0
+
+    while queue or index < n:
+        while index < n and arrivals[index] <= t:
+            queue.append(index)
+            index += 1
+        if not queue:
+            t = arrivals[index]
+            continue
+        i = queue.popleft()
+        if last is not None and i != last:
+            switches += 1
+            t += switch_cost
+        if first[i] is None:
+            first[i] = t
+        run = min(quantum, remaining[i])
+        t += run
+        remaining[i] -= run
+        while index < n and arrivals[index] <= t:
+            queue.append(index)
+            index += 1
+        if remaining[i] > 0:
+            queue.append(i)
+        else:
+            completion[i] = t
+        last = i
+    return first, completion, switches
+
+
+def _evaluate(arrivals, bursts, quanta, switch_cost):
+    """Worker entry point: averages for each quantum of one chunk."""
+    n   = len(arrivals)
+    out = []
+    for q in quanta:
+        first, completion, switches = rr_kernel(arrivals, bursts, q, switch_cost)
+        turnaround = sum(c - a for c, a in zip(completion, arrivals))
+        response   = sum(f - a for f, a in zip(first, arrivals))
+        out.append((
+            (turnaround - sum(bursts)) / n,
+            turnaround / n,
+            response / n,
+            switches,
+        ))
+    return out
+
+
+class QuantumSweep:
+    """
+    Round Robin metrics as a function of the time quantum.
+
+    Attributes (parallel lists, one entry per quantum):
+        quanta, waiting, turnaround, response – averages over all processes
+        switches                              – context switches per run
+    """
+    METRICS = ("waiting", "turnaround", "response")
+
+    def __init__(self, quanta, rows, switch_cost=0):
+        self.quanta      = list(quanta)
+        self.switch_cost = switch_cost
+        self.waiting     = [r[0] for r in rows]
+        self.turnaround  = [r[1] for r in rows]
+        self.response    = [r[2] for r in rows]
+        self.switches    = [r[3] for r in rows]
+
+    def curve(self, metric="turnaround"):
+        """[(quantum, value)] for one metric."""
+        if metric not in self.METRICS:
+            raise ValueError(f"Unknown metric {metric!r}; expected one of {self.METRICS}")
+        return list(zip(self.quanta, getattr(self, metric)))
+
+    def best(self, metric="turnaround"):
+        """
+        Quantum minimising `metric`. Once the quantum exceeds every burst RR
+        degenerates to FCFS and the curve goes flat, so ties go to the
+        smallest quantum.
+        """
+        return min(self.curve(metric), key=lambda qv: (qv[1], qv[0]))[0]
+
+    def __repr__(self):
+        return (f"QuantumSweep(quanta={self.quanta[0]}..{self.quanta[-1]}, "
+                f"best_waiting={self.best('waiting')}, "
+                f"best_turnaround={self.best('turnaround')}, "
+                f"best_response={self.best('response')})")
+
+
+def sweep_quanta(processes, quanta=None, switch_cost=0, workers=None):
+    """
+    Evaluate Round Robin on `processes` for every quantum in `quanta`
+    (default 1 … longest burst).
+
+    Arrivals and bursts are sorted once and shared by every run. The
+    quanta are split into chunks evaluated in a process pool of `workers`
+    processes (None → CPU count); workers=0 runs them in this process,
+    which is faster for small sweeps that would not repay starting a pool.
+    """
+    if quanta is None:
+        longest = max((int(p.burst_time) for p in processes), default=1)
+        quanta  = range(1, max(longest, 1) + 1)
+    quanta = list(quanta)
+    for q in quanta:
+        if q <= 0:
+            raise ValueError(f"time quantum must be positive, got {q}")
+
+    ordered  = sorted(processes, key=lambda p: p.arrival_time)
+    arrivals = [p.arrival_time for p in ordered]
+    bursts   = [p.burst_time for p in ordered]
+    if not ordered:
+        return QuantumSweep(quanta, [(0, 0, 0, 0)] * len(quanta), switch_cost)
+
+    if workers == 0 or len(quanta) <= 1:
+        rows = _evaluate(arrivals, bursts, quanta, switch_cost)
+    else:
+        size   = -(-len(quanta) // (workers or os.cpu_count() or 1))
+        chunks = [quanta[i:i + size] for i in range(0, len(quanta), size)]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            rows = [row for part in pool.map(
+                _evaluate,
+                [arrivals] * len(chunks),
+                [bursts] * len(chunks),
+                chunks,
+                [switch_cost] * len(chunks)
+            ) for row in part]
+    return QuantumSweep(quanta, rows, switch_cost)
@@ -0,0 +1,234 @@
+"""
+Reference implementations of RM, EDF, RR, SJN and FCFS for differential
+testing.
+
+These are the original straightforward engines, frozen: RM and EDF step
+one time unit at a time over the hyperperiod, RR and SJN rescan their
+queues at every decision, FCFS serves processes one by one in arrival
+order. They are slow on purpose and share no code
+with the schedulers, so a faster engine (the RM/EDF event engines, the
+incremental updates, or anything that replaces them) can be checked
+against them segment by segment:
+
+    expected = canonical(reference("RM", processes))
+    actual   = canonical(RateMonotonicScheduler(engine="event")...timeline)
+    first_difference(expected, actual)   # None when they agree
+
+Do not optimize this module; its value is that it is obviously right.
+Pids must be unique, as in the schedulers.
+"""
+from math import gcd
+
+
+def _hyperperiod(processes, horizon):
+    if horizon is not None:
+        return int(horizon)
+    h = 1
+    for p in processes:
+        h = h * int(p.period) // gcd(h, int(p.period))
+    return h
+
+
+def _run(timeline, pid, start, end):
+    # one more time unit of `pid`, merged with its previous unit
+    if timeline and timeline[-1][0] == pid and timeline[-1][2] == start:
+        timeline[-1] = (pid, timeline[-1][1], end)
+    else:
+        timeline.append((pid, start, end))
+
+
+def rm_timeline(processes, horizon=None):
+    """
+    Rate-monotonic over the hyperperiod (or `horizon` ticks). Every task
+    releases a job at 0 and every period after; each tick runs the ready
+    task with the least time left until its next release, ties to the
+    task listed first.
+    """
+    for p in processes:
+        if p.period is None:
+            raise ValueError(f"RM requires a period for Process {p.pid}")
+    if not processes:
+        return []
+    end   = _hyperperiod(processes, horizon)
+    # [pid, ticks to next release, work left in the job, period, burst]
+    tasks = [[p.pid, int(p.period), int(p.burst_time), int(p.period), int(p.burst_time)]
+             for p in processes]
+    timeline = []
+    for t in range(end):
+        ready = [task for task in tasks if task[2] > 0]
+        if ready:
+            best = ready[0]
+            for task in ready[1:]:
+                if task[1] < best[1]:
+                    best = task
+            _run(timeline, best[0], t, t + 1)
+            best[2] -= 1
+        for task in tasks:
+            task[1] -= 1
+            if task[1] == 0:
+                task[1] = task[3]
+                task[2] = task[4]
+    return timeline
+
+
+def edf_timeline(processes, horizon=None):
+    """
+    Earliest-deadline-first over the hyperperiod (or `horizon` ticks). A
+    task releases a job at every multiple of its period with an absolute
+    deadline `deadline` later; each tick runs the ready job with the
+    earliest absolute deadline, ties to the task listed first.
+    """
+    for p in processes:
+        if p.period is None or p.deadline is None:
+            raise ValueError(f"EDF requires both period and deadline for P{p.pid}")
+    if not processes:
+        return []
+    end   = _hyperperiod(processes, horizon)
+    # [pid, absolute deadline, work left in the job, period, burst, relative deadline]
+    tasks = [[p.pid, int(p.deadline), int(p.burst_time), int(p.period), int(p.burst_time), int(p.deadline)]
+             for p in processes]
+    timeline = []
+    for t in range(end):
+        ready = [task for task in tasks if task[2] > 0]
+        if ready:
+            best = ready[0]
+            for task in ready[1:]:
+                if task[1] < best[1]:
+                    best = task
+            _run(timeline, best[0], t, t + 1)
+            best[2] -= 1
+        for task in tasks:
+            if (t + 1) % task[3] == 0:
+                task[1] = t + 1 + task[5]
+                task[2] = task[4]
+    return timeline
+
+
+def _by_arrival(processes):
+    # stable: simultaneous arrivals keep the order they were listed in
+    return sorted(processes, key=lambda p: p.arrival_time)
+
+
+def rr_timeline(processes, time_quantum):
+    """
+    Round robin from the first arrival on. A process whose quantum
+    expires goes to the back of the queue behind everything that arrived
+    up to that instant; the CPU idles (without an idle segment) until the
+    next arrival when the queue is empty. One segment per quantum.
+    """
+    if not processes:
+        return []
+    pending  = _by_arrival(processes)
+    left     = {p.pid: p.burst_time for p in processes}
+    queue    = []
+    now      = pending[0].arrival_time
+    timeline = []
+
+    def admit():
+        while pending and pending[0].arrival_time <= now:
+            queue.append(pending.pop(0))
+
+    while queue or pending:
+        admit()
+        if not queue:
+            now = pending[0].arrival_time
+            continue
+        p   = queue.pop(0)
+        run = min(time_quantum, left[p.pid])
+        timeline.append((p.pid, now, now + run))
+        now += run
+        left[p.pid] -= run
+        admit()
+        if left[p.pid] > 0:
+            queue.append(p)
+    return timeline
+
+
+def sjn_timeline(processes):
+    """
+    Non-preemptive shortest job next from time 0: when the CPU is free it
+    runs the arrived process with the smallest burst, ties to the process
+    listed first, and records idle spans (pid "") until the next arrival.
+    """
+    waiting  = list(processes)
+    now      = 0
+    timeline = []
+    while waiting:
+        arrived = [p for p in waiting if p.arrival_time <= now]
+        if not arrived:
+            nxt = min(p.arrival_time for p in waiting)
+            timeline.append(("", now, nxt))
+            now = nxt
+            continue
+        best = arrived[0]
+        for p in arrived[1:]:
+            if p.burst_time < best.burst_time:
+                best = p
+        waiting.remove(best)
+        timeline.append((best.pid, now, now + best.burst_time))
+        now += best.burst_time
+    return timeline
+
+
+def fcfs_timeline(processes):
+    """
+    First-come-first-served: processes run to completion in arrival
+    order, ties to the process listed first, each starting when it has
+    arrived and the previous one has finished.
+    """
+    now      = 0
+    timeline = []
+    for p in _by_arrival(processes):
+        start = max(now, p.arrival_time)
+        timeline.append((p.pid, start, start + p.burst_time))
+        now = start + p.burst_time
+    return timeline
+
+
+# algorithm short name (as in registry.ALGORITHMS) → reference
+REFERENCES = {
+    "RM"  : rm_timeline,
+    "DF"  : edf_timeline,
+    "RR"  : rr_timeline,
+    "SJN" : sjn_timeline,
+    "FCFS": fcfs_timeline,
+}
+
+
+def reference(algorithm, processes, **params):
+    """Reference timeline of `algorithm` (a REFERENCES key) with the scheduler's parameters."""
+    name = algorithm.upper()
+    if name not in REFERENCES:
+        raise ValueError(f"No reference for {algorithm!r}; expected one of {sorted(REFERENCES)}")
+    if name in ("RM", "DF"):
+        return REFERENCES[name](processes, params.get("horizon"))
+    if name == "RR":
+        return rr_timeline(processes, params["time_quantum"])
+    return REFERENCES[name](processes)
+
+
+def canonical(timeline):
+    """
+    The schedule a timeline describes, independent of how an engine
+    splits it: idle and empty segments dropped, back-to-back segments of
+    the same pid merged.
+    """
+    out = []
+    for pid, start, end in timeline:
+        if pid is None or pid == "" or end <= start:
+            continue
+        if out and out[-1][0] == pid and out[-1][2] == start:
+            out[-1] = (pid, out[-1][1], end)
+        else:
+            out.append((pid, start, end))
+    return out
+
+
+def first_difference(expected, actual):
+    """(index, expected segment, actual segment) of the first mismatch, or None; a missing segment is None."""
+    for k in range(max(len(expected), len(actual))):
+        a = expected[k] if k < len(expected) else None
+        b = actual[k] if k < len(actual) else None
+        if a != b:
+            return k, a, b
+    return None
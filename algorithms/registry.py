@@ -0,0 +1,76 @@
+from algorithms.process import Process
+from algorithms.fcfs import FCFS_Scheduler
+from algorithms.sjns import ShortestJobNextScheduler
+from algorithms.rrs import RoundRobinScheduler
+from algorithms.rms import RateMonotonicScheduler
+from algorithms.dfs import DeadlineFirstScheduler
+from algorithms.mlfq import MultilevelFeedbackQueueScheduler
+from algorithms.stride import StrideScheduler
+from algorithms.cfs import CompletelyFairScheduler
+from algorithms.io_aware import IOAwareScheduler
+from algorithms.multiprocessor import (
+    GlobalDeadlineFirstScheduler,
+    GlobalRateMonotonicScheduler,
+    PartitionedScheduler,
+)
+
+# Short name → scheduler class, as used by the UI labels and the service
+ALGORITHMS = {
+    "FCFS"  : FCFS_Scheduler,
+    "SJN"   : ShortestJobNextScheduler,
+    "RR"    : RoundRobinScheduler,
+    "RM"    : RateMonotonicScheduler,
+    "DF"    : DeadlineFirstScheduler,
+    "MLFQ"  : MultilevelFeedbackQueueScheduler,
+    "STRIDE": StrideScheduler,
+    "CFS"   : CompletelyFairScheduler,
+    "GEDF"  : GlobalDeadlineFirstScheduler,
+    "GRM"   : GlobalRateMonotonicScheduler,
+    "PART"  : PartitionedScheduler,
+    "IO"    : IOAwareScheduler,
+}
+
+
+def create(name, **params):
+    """Scheduler instance for a short algorithm name."""
+    try:
+        cls = ALGORITHMS[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm {name!r}; expected one of {sorted(ALGORITHMS)}")
+    return cls(**params)
+
+
+def process_from_dict(d):
+    """Process from {pid, arrival, burst[, deadline, period, weight, bursts]}; burst may be left out with bursts."""
+    return Process(
+        pid          = d["pid"],
+        arrival_time = d["arrival"],
+        burst_time   = d.get("burst") if "bursts" in d else d["burst"],
+        deadline     = d.get("deadline"),
+        period       = d.get("period"),
+        weight       = d.get("weight", 1),
+        bursts       = d.get("bursts"),
+    )
+
+
+def process_to_dict(p):
+    d = {
+        "pid"     : p.pid,
+        "arrival" : p.arrival_time,
+        "burst"   : p.burst_time,
+        "deadline": p.deadline,
+        "period"  : p.period,
+        "weight"  : p.weight,
+    }
+    if getattr(p, "bursts", None):
+        d["bursts"] = [list(b) for b in p.bursts]
+    return d
+
+
+def run(name, processes, **params):
+    """Build, load and schedule in one call; returns the scheduler."""
+    sched = create(name, **params)
+    for p in processes:
+        sched.add_process(p if isinstance(p, Process) else process_from_dict(p))
+    sched.schedule()
+    return sched
@@ -1,16 +1,44 @@
-from math import gcd
+from math import gcd, ceil
 from copy import deepcopy
 from algorithms.scheduler import Scheduler
+from algorithms.jobs import JobLog
 
 class RateMonotonicScheduler(Scheduler):
     """
     Preemptive, periodic RM over the LCM(hyperperiod) of all task periods.
+
+    horizon             – optional number of ticks to simulate instead of the hyperperiod
+    checkpoint_interval – optional; snapshot the state every this many ticks
+    engine              – "tick" steps one time unit at a time; "event" jumps
+                          straight to the next release or completion, which
+                          produces the same schedule in time proportional to
+                          the number of jobs instead of the hyperperiod
+
+    Every release is recorded in `jobs` (a JobLog) with an implicit
+    deadline at the end of its period.
     """
+    ENGINES = ("tick", "event")
+
+    def __init__(self, horizon=None, checkpoint_interval=None, engine="tick"):
+        super().__init__()
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {self.ENGINES}")
+        self.horizon = horizon
+        self.engine  = engine
+        self.jobs    = JobLog()
+        self.checkpoint_interval = checkpoint_interval
 
     def schedule(self):
         if not self.processes:
             return
+        self.timeline    = []
+        self.checkpoints = []
+        self._next_checkpoint = 0
+        self.jobs        = JobLog()
+        self._continue(self._initial_state())
+        return self.result
 
+    def _initial_state(self):
         # 1) Make sure every Process has a period
         for p in self.processes:
             if p.period is None:
@@ -21,28 +49,62 @@ class RateMonotonicScheduler(Scheduler):
         hyper = periods[0]
         for P in periods[1:]:
             hyper = hyper * P // gcd(hyper, P)
+        if self.horizon is not None:
+            hyper = int(self.horizon)
 
         # 3) Prepare a dynamic copy of each task
-        RT = {}  # pid → { period, remaining, orig_period, orig_wc }
+        RT = []  # [pid, { period, remaining, orig_period, orig_wc }]
         for p in self.processes:
-            RT[p.pid] = {
+            RT.append([p.pid, {
                 'period'      : int(p.period),
                 'remaining'   : int(p.burst_time),
                 'orig_period' : int(p.period),
                 'orig_wc'     : int(p.burst_time)
-            }
+            }])
+
+        # every task releases its first job at t=0
+        jobs = [[pid, 0, info['orig_period'], 0] for pid, info in RT]
+        return {'t': 0, 'end': hyper, 'tasks': RT, 'jobs': jobs}
+
+    def _continue(self, state):
+        # self.jobs holds the jobs closed before `state` (see Scheduler.resume)
+        for job in state['jobs']:
+            self.jobs.reopen(*job)
 
         # 4) Simulate tick-by-tick
-        for t in range(hyper):
+        self._advance(state, state['end'], self.timeline, self.jobs, checkpoints=True)
+        self.jobs.close(state['end'])
+
+        # 5) Compute final metrics: we treat the last completion of each
+        # instance as the “completion_time” for that PID
+        self.update_metrics()
+
+    def _advance(self, state, stop, timeline, jobs=None, checkpoints=False):
+        if self.engine == "event":
+            return self._advance_events(state, stop, timeline, jobs, checkpoints)
+        RT    = dict(state['tasks'])  # shares the per-task dicts with `state`
+        hyper = state['end']
+        stop  = min(ceil(stop), hyper)
+        for t in range(state['t'], stop):
+            if checkpoints and self._checkpoint_due(t):
+                state['t'] = t
+                if jobs is not None:
+                    state['jobs'] = jobs.open_jobs()
+                self._save_checkpoint(t, state)
+
             # collect ready tasks
             ready = [pid for pid,info in RT.items() if info['remaining'] > 0]
             if ready:
                 # pick the one with smallest current period
                 pid = min(ready, key=lambda i: RT[i]['period'])
-                # record this 1‐unit slice
-                self.timeline.append((pid, t, t+1))
+                # record this 1‐unit slice, merged with the previous one
+                self._append_segment(pid, t, t+1, timeline)
                 # consume one unit
                 RT[pid]['remaining'] -= 1
+                if jobs is not None:
+                    jobs.run(pid, 1)
+                    if RT[pid]['remaining'] == 0:
+                        jobs.complete(pid, t+1)
             # else: CPU idle for this tick (we simply skip)
 
             # decrement everyone’s period counter
@@ -54,30 +116,50 @@ class RateMonotonicScheduler(Scheduler):
                 if info['period'] == 0:
                     info['period']    = info['orig_period']
                     info['remaining'] = info['orig_wc']
+                    if jobs is not None and t+1 < hyper:
+                        jobs.release(pid, t+1, t+1 + info['orig_period'])
+        state['t'] = max(state['t'], stop)
 
-        # 5) Merge adjacent segments
-        self._merge_timeline_segments()
+    def _advance_events(self, state, stop, timeline, jobs=None, checkpoints=False):
+        """
+        Same schedule as the tick loop, one iteration per event: priorities
+        (the period counters) all fall at the same rate, so the running task
+        only changes at a release or a completion.
+        """
+        RT    = dict(state['tasks'])
+        hyper = state['end']
+        stop  = min(ceil(stop), hyper)
+        t     = state['t']
+        while t < stop:
+            if checkpoints and self._checkpoint_due(t):
+                state['t'] = t
+                if jobs is not None:
+                    state['jobs'] = jobs.open_jobs()
+                self._save_checkpoint(t, state)
 
-        # 6) Compute final metrics: we treat the last completion of each
-        # instance as the “completion_time” for that PID
-        for p in self.processes:
-            segs = [seg for seg in self.timeline if seg[0] == p.pid]
-            if segs:
-                last_end = segs[-1][2]
-                p.completion_time  = last_end
-                p.turnaround_time  = last_end - p.arrival_time
-                p.waiting_time     = p.turnaround_time - p.burst_time
-
-    def _merge_timeline_segments(self):
-        merged = []
-        if not self.timeline:
-            return
-        curr = self.timeline[0]
-        for seg in self.timeline[1:]:
-            if seg[0] == curr[0] and seg[1] == curr[2]:
-                curr = (curr[0], curr[1], seg[2])
-            else:
-                merged.append(curr)
-                curr = seg
-        merged.append(curr)
-        self.timeline = merged
+            # next release, and the ready task with the smallest period counter
+            step, pid = stop - t, None
+            for i, info in RT.items():
+                step = min(step, info['period'])
+                if info['remaining'] > 0 and (pid is None or info['period'] < RT[pid]['period']):
+                    pid = i
+            if checkpoints and self.checkpoint_interval is not None:
+                step = min(step, self._next_checkpoint - t)
+            if pid is not None:
+                step = min(step, RT[pid]['remaining'])
+                self._append_segment(pid, t, t+step, timeline)
+                RT[pid]['remaining'] -= step
+                if jobs is not None:
+                    jobs.run(pid, step)
+                    if RT[pid]['remaining'] == 0:
+                        jobs.complete(pid, t+step)
+
+            t += step
+            for i, info in RT.items():
+                info['period'] -= step
+                if info['period'] == 0:
+                    info['period']    = info['orig_period']
+                    info['remaining'] = info['orig_wc']
+                    if jobs is not None and t < hyper:
+                        jobs.release(i, t, t + info['orig_period'])
+        state['t'] = max(state['t'], stop)
@@ -1,47 +1,88 @@
+from collections import deque
 from algorithms.scheduler import Scheduler
 
 class RoundRobinScheduler(Scheduler):
-    """Round Robin scheduling."""
-    def __init__(self, time_quantum):
+    """
+    Round Robin scheduling.
+
+    time_quantum        – CPU time a process gets before going to the back of the queue
+    checkpoint_interval – optional; snapshot the state every this many time units
+    """
+    INCREMENTAL = True
+
+    def __init__(self, time_quantum, checkpoint_interval=None):
         super().__init__()
         self.time_quantum = time_quantum
+        self.checkpoint_interval = checkpoint_interval
 
     def schedule(self):
         if not self.processes:
             return
-        self.processes.sort(key=lambda p: p.arrival_time)
-        current_time = self.processes[0].arrival_time
-        ready_queue = []
-        index = 0
-        while ready_queue or index < len(self.processes):
-            while index < len(self.processes) and self.processes[index].arrival_time <= current_time:
-                ready_queue.append(self.processes[index])
+        self.timeline    = []
+        self.checkpoints = []
+        self._next_checkpoint = 0
+        self._continue(self._initial_state())
+        return self.result
+
+    def _initial_state(self):
+        first = min(p.arrival_time for p in self.processes)
+        return self._idle_state(first, 0)
+
+    def _idle_state(self, time, index):
+        return {
+            'time'     : time,
+            'index'    : index,  # next process, in arrival order, not yet admitted
+            'ready'    : [],     # pids in queue order
+            'remaining': [],     # [pid, work left] of admitted, unfinished processes
+        }
+
+    def _continue(self, state):
+        self._advance(state, float('inf'), self.timeline, checkpoints=True)
+        self.update_metrics()
+
+    def _advance(self, state, stop, timeline, jobs=None, checkpoints=False, converge=None):
+        w            = self.workload
+        processes    = w.processes
+        order        = w.order
+        remaining    = dict(state['remaining'])
+        ready_queue  = deque(processes[w.index(pid)] for pid in state['ready'])
+        index        = state['index']
+        current_time = state['time']
+
+        def admit():
+            nonlocal index
+            while index < len(order) and w.arrival[order[index]] <= current_time:
+                process = processes[order[index]]
+                ready_queue.append(process)
+                remaining.setdefault(process.pid, process.burst_time)
                 index += 1
+
+        def save():
+            state['time']      = current_time
+            state['index']     = index
+            state['ready']     = [p.pid for p in ready_queue]
+            state['remaining'] = [[pid, rem] for pid, rem in remaining.items()]
+
+        while (ready_queue or index < len(order)) and current_time < stop:
+            if checkpoints and self._checkpoint_due(current_time):
+                save()
+                self._save_checkpoint(current_time, state)
+            admit()
             if not ready_queue:
-                current_time = self.processes[index].arrival_time
+                if converge is not None and converge(current_time):
+                    break
+                current_time = w.arrival[order[index]]
                 continue
-            process = ready_queue.pop(0)
-            exec_time = min(self.time_quantum, process.remaining_time)
+            process = ready_queue.popleft()
+            exec_time = min(self.time_quantum, remaining[process.pid])
             start_time = current_time
             current_time += exec_time
             end_time = current_time
-            self.timeline.append((process.pid, start_time, end_time))
-            process.remaining_time -= exec_time
-            while index < len(self.processes) and self.processes[index].arrival_time <= current_time:
-                ready_queue.append(self.processes[index])
-                index += 1
-            if process.remaining_time > 0:
+            timeline.append((process.pid, start_time, end_time))
+            remaining[process.pid] -= exec_time
+            admit()
+            if remaining[process.pid] > 0:
                 ready_queue.append(process)
-
-        for p in self.processes:
-            # collect all segments for this process
-            segments = [seg for seg in self.timeline if seg[0] == p.pid]
-            if not segments:
-                continue
-            # the end of the last segment is the completion time
-            p.completion_time = segments[-1][2]
-            p.turnaround_time = p.completion_time - p.arrival_time
-            p.waiting_time    = p.turnaround_time - p.burst_time
-
-
-
+            else:
+                del remaining[process.pid]
+        save()
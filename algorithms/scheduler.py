@@ -1,76 +1,494 @@
-import matplotlib.pyplot as plt
 import abc
+import bisect
+import copy
+import inspect
+import operator
+from algorithms.metrics import OVERHEAD, compute_metrics, _is_idle
+from algorithms.streaming import LatencyStats
+from algorithms.interval_index import index_for, invalidate
+from algorithms.jobs import JobLog
+from algorithms.plotting import plot_timeline
+from algorithms.terminal import render_timeline
+from algorithms.trace_events import TraceEventWriter
+from algorithms.workload import Workload, ScheduleResult
+
+
+def clip_timeline(timeline, t0=None, t1=None):
+    """Segments of `timeline` overlapping [t0, t1), cut to that window."""
+    out = []
+    for pid, start, end in timeline:
+        if t0 is not None:
+            if end <= t0:
+                continue
+            start = max(start, t0)
+        if t1 is not None:
+            if start >= t1:
+                continue
+            end = min(end, t1)
+        out.append((pid, start, end))
+    return out
+
+
+_start    = operator.itemgetter(1)
+_TIME_EPS = 1e-9
+
+
+def _busy(segments):
+    return sum(end - start for pid, start, end in segments if not _is_idle(pid))
+
+
+def _last_busy(timeline, k):
+    """Pid of the last non-idle segment at or before index k (or None)."""
+    while k >= 0 and _is_idle(timeline[k][0]):
+        k -= 1
+    return timeline[k][0] if k >= 0 else None
+
+
+def _first_busy(timeline, k):
+    """Pid of the first non-idle segment at or after index k (or None)."""
+    while k < len(timeline) and _is_idle(timeline[k][0]):
+        k += 1
+    return timeline[k][0] if k < len(timeline) else None
+
+
+def _busy_end(timeline):
+    k = len(timeline) - 1
+    while k >= 0 and _is_idle(timeline[k][0]):
+        k -= 1
+    return timeline[k][2] if k >= 0 else float('-inf')
+
+
+def _switches(before, segments, after):
+    """Context switches along `segments` between the pids running before and after them."""
+    count, prev = 0, before
+    for pid in [seg[0] for seg in segments if not _is_idle(seg[0])] + [after]:
+        if pid is None:
+            continue
+        if prev is not None and pid != prev:
+            count += 1
+        prev = pid
+    return count
+
+
+def _forget(state, pid):
+    """Drop a process that has not run yet from an incremental scheduler's state."""
+    if pid in state.get('ready', ()):
+        state['ready'].remove(pid)
+        state['index'] -= 1
+    if 'remaining' in state:
+        state['remaining'] = [r for r in state['remaining'] if r[0] != pid]
+
 
 class Scheduler(abc.ABC):
     """
     Abstract base class for all scheduling algorithms.
     
     Attributes:
-        processes: A list of Process instances.
+        processes: A list of Process instances. Schedulers only read them.
+        workload: The processes as a read-only Workload.
         timeline: A list of tuples recording execution segments:
                   (process id, start time, end time)
+        metrics: Metrics derived from the timeline once schedule() has run.
+        result: ScheduleResult of the latest run, also returned by schedule().
+        checkpoint_interval: if set, schedulers that support it snapshot their
+                  state every this many time units into `checkpoints`.
+        overhead: optional OverheadModel; dispatch costs are then charged as
+                  overhead segments of the timeline (see algorithms.overhead).
+        overhead_stats: totals per overhead kind of the latest run, or None.
     """
     def __init__(self):
         self.processes = []
         self.timeline = []
+        self.metrics = None
+        self.result = None
+        self._workload = None
+        self.checkpoint_interval = None
+        self.checkpoints = []
+        self._next_checkpoint = 0
+        self.overhead = None
+        self.overhead_stats = None
+
+    # Schedulers that can update a finished run in place (see add_process)
+    INCREMENTAL = False
 
     def add_process(self, process):
+        """
+        Add a process. Once scheduled, the timeline, metrics and result are
+        updated at once: from the process's arrival on, for INCREMENTAL
+        schedulers, otherwise by running schedule() again.
+        """
         self.processes.append(process)
+        if self.result is None:
+            self._workload = None
+            return
+        self._update(self.result.workload.with_process(process), added=process)
+
+    def remove_process(self, pid):
+        """Remove the process with this pid, updating a finished run like add_process."""
+        if self.result is None:
+            for i, p in enumerate(self.processes):
+                if p.pid == pid:
+                    del self.processes[i]
+                    self._workload = None
+                    return
+            raise ValueError(f"No process with pid {pid!r}")
+        w = self.result.workload
+        i = w.index(pid)
+        del self.processes[i]
+        self._update(w.without(i), removed=i)
+
+    def load(self, workload):
+        """Schedule `workload` (a Workload, shared without copying); returns self."""
+        if not isinstance(workload, Workload):
+            workload = Workload(workload)
+        self.processes = list(workload.processes)
+        self._workload = workload
+        return self
+
+    @property
+    def workload(self):
+        w = self._workload
+        if w is None or len(w) != len(self.processes):
+            w = self._workload = Workload(self.processes)
+        return w
+
+    def _append_segment(self, pid, start, end, timeline=None):
+        """Record an execution slice, extending the last segment if it continues it."""
+        if timeline is None:
+            timeline = self.timeline
+        if timeline and timeline[-1][0] == pid and timeline[-1][2] == start:
+            timeline[-1] = (pid, timeline[-1][1], end)
+        else:
+            timeline.append((pid, start, end))
+
+    # ─── Checkpoints ──────────────────────────────────────────────────────────
+    #
+    # Schedulers that support checkpoints implement
+    #   _initial_state()  → JSON-serializable state at the start of a run
+    #   _continue(state)  → run from `state` to the end, appending to
+    #                       self.timeline and finishing metrics
+    #   _advance(state, stop, timeline, jobs=None, checkpoints=False)
+    #                     → simulate until time `stop`, recording segments
+    # and call _checkpoint_due / _save_checkpoint from their main loop.
+
+    def _checkpoint_due(self, t):
+        return self.checkpoint_interval is not None and t >= self._next_checkpoint
+
+    def _save_checkpoint(self, t, state):
+        self.checkpoints.append({
+            'algorithm': type(self).__name__,
+            'time'     : t,
+            'state'    : copy.deepcopy(state),
+        })
+        self._next_checkpoint = (t // self.checkpoint_interval + 1) * self.checkpoint_interval
+
+    def nearest_checkpoint(self, t):
+        """Latest checkpoint taken at or before time t, or None."""
+        times = [c['time'] for c in self.checkpoints]
+        i = bisect.bisect_right(times, t) - 1
+        return self.checkpoints[i] if i >= 0 else None
+
+    def resume(self, snapshot):
+        """
+        Continue a run from a snapshot (e.g. one reloaded from disk after an
+        interruption). Timeline segments already present before the snapshot
+        time are kept, and so are the jobs closed before it; everything after
+        it is re-simulated.
+        """
+        if snapshot['algorithm'] != type(self).__name__:
+            raise ValueError(f"Snapshot is for {snapshot['algorithm']}, not {type(self).__name__}")
+        t = snapshot['time']
+        self.timeline    = clip_timeline(self.timeline, None, t)
+        if 'jobs' in snapshot['state']:
+            # a fresh instance (snapshot reloaded from disk) has no earlier jobs to keep
+            jobs      = getattr(self, "jobs", None) or JobLog()
+            self.jobs = jobs.clip(t, snapshot['state']['jobs'])
+        self.checkpoints = [c for c in self.checkpoints if c['time'] < t]
+        self._next_checkpoint = t
+        self._continue(copy.deepcopy(snapshot['state']))
+
+    def simulate_window(self, t0, t1):
+        """
+        Segments in [t0, t1) only, simulated from the nearest checkpoint at
+        or before t0 (from the start if there is none). Leaves the
+        scheduler's own timeline and metrics untouched.
+        """
+        snap  = self.nearest_checkpoint(t0)
+        state = copy.deepcopy(snap['state']) if snap else self._initial_state()
+        segments = []
+        self._advance(state, t1, segments)
+        return clip_timeline(segments, t0, t1)
+
+    def _initial_state(self):
+        raise NotImplementedError(f"{type(self).__name__} does not support checkpoints")
+
+    def _continue(self, state):
+        raise NotImplementedError(f"{type(self).__name__} does not support checkpoints")
+
+    def _advance(self, state, stop, timeline, jobs=None, checkpoints=False, converge=None):
+        raise NotImplementedError(f"{type(self).__name__} does not support checkpoints")
+
+    # ─── Incremental updates ─────────────────────────────────────────────────
+    #
+    # INCREMENTAL schedulers implement the checkpoint methods above, with a
+    # state holding 'time' and 'index' (processes admitted, in arrival order),
+    # plus 'ready' pids and 'remaining' [pid, work] pairs where they queue;
+    #   _idle_state(time, index) → state at an instant when nothing is pending
+    # and _advance takes converge(t, pid=None), called when the CPU goes idle
+    # at t (pid None) or, for FCFS, before pid starts at t; it returns True
+    # once the old timeline continues unchanged from there.
+    #
+    # A change at time t re-simulates from the latest idle instant (or
+    # checkpoint) before t until the new run goes idle where the old one was
+    # idle too, with every changed process done: from then on both runs see
+    # the same arrivals from the same empty state. Only that stretch of the
+    # timeline, and the metrics of the processes in it, are recomputed.
+
+    def _update(self, workload, added=None, removed=None):
+        old_workload  = self.result.workload
+        self._workload = workload
+        # an overhead model retimes the whole run, so no stretch stays unchanged
+        if not self.INCREMENTAL or self.overhead is not None or not len(workload):
+            self.timeline, self.checkpoints = [], []
+            self.metrics = self.result = None
+            self.schedule()
+            return
+
+        old = self.timeline
+        if added is not None:
+            t = threshold = added.arrival_time
+            pid, delta = added.pid, 1
+        else:
+            pid, delta = old_workload.pids[removed], -1
+            t, threshold = self.result.start[removed], self.result.completion[removed]
+        if t is None:  # removed process never ran
+            self.metrics = self.metrics.updated({}, removed=[pid])
+            self.result  = self.result._refreshed(workload, self.metrics, self.timeline, removed=removed)
+            return
+
+        state, cut = self._resume_point(t, old, None if added else pid)
+        hit = []  # (time, index of the old segment to continue with, bridge)
+
+        def converge(x, run_pid=None):
+            if x < threshold:
+                return False
+            if run_pid is not None:
+                j = bisect.bisect_left(old, x, lo=cut, key=_start)
+                while j < len(old) and old[j][1] == x and old[j][0] != run_pid:
+                    j += 1
+                if j == len(old) or old[j][1] != x:
+                    return False
+                hit.append((x, j, []))
+                return True
+            j = bisect.bisect_right(old, x, lo=cut, key=_start) - 1
+            if j < cut or old[j][2] <= x:
+                hit.append((x, j + 1 if j >= cut else cut, []))
+                return True
+            if _is_idle(old[j][0]):  # inside an idle segment: keep its rest
+                hit.append((x, j + 1, [(old[j][0], x, old[j][2])]))
+                return True
+            return False
+
+        resumed  = state['time']
+        later    = [c for c in self.checkpoints if c['time'] > resumed]
+        self.checkpoints      = [c for c in self.checkpoints if c['time'] < min(resumed, t)]
+        if removed is not None:
+            for c in self.checkpoints:
+                _forget(c['state'], pid)
+        self._next_checkpoint = resumed
+        segments = []
+        self._advance(state, float('inf'), segments, checkpoints=True, converge=converge)
+        tail = len(old)
+        if hit:
+            x, tail, bridge = hit[0]
+            segments += bridge
+            # old checkpoints past that point still hold, with one process more or less admitted
+            for c in later:
+                if c['time'] > x:
+                    c['state']['index'] += delta
+                    self.checkpoints.append(c)
+        if (cut and segments and _is_idle(segments[0][0]) and _is_idle(old[cut - 1][0])
+                and old[cut - 1][2] == segments[0][1]):
+            # resumed inside an idle span: continue its segment
+            cut -= 1
+            segments[0] = (segments[0][0], old[cut][1], segments[0][2])
+        self.timeline = old[:cut] + segments + old[tail:]
+        invalidate(old)
+        self._patch_metrics(old[cut:tail], segments, cut, workload, pid if removed is not None else None)
+
+    def _resume_point(self, t, old, removed_pid=None):
+        """
+        State and timeline index to re-simulate from for a change at time t:
+        the latest idle instant at or before t, or a later checkpoint.
+        """
+        w = self.workload
+        # an added process must arrive after the idle instant, so that it is
+        # not counted among the processes already done there
+        limit = t if removed_pid is not None else t - _TIME_EPS
+        cut   = bisect.bisect_left(old, t, key=_start)
+        # walk back to a segment followed by idle time (or an idle segment)
+        k = cut - 1
+        while k >= 0:
+            pid, start, end = old[k]
+            if _is_idle(pid) and start <= limit:
+                idle, cut = start, k
+                break
+            if end <= limit and (k + 1 == len(old) or old[k + 1][1] > end):
+                idle, cut = end, k + 1
+                break
+            k -= 1
+        else:
+            idle, cut = None, 0
+        if idle is None:
+            state = self._initial_state()
+        else:
+            done  = bisect.bisect_right(w.order, idle, key=w.arrival.__getitem__)
+            state = self._idle_state(idle, done)
+
+        # strictly before t: a checkpoint at t may already have admitted
+        # (or even run) whatever arrives at t
+        snap = self.nearest_checkpoint(t - _TIME_EPS)
+        if snap is not None and snap['time'] > state['time']:
+            k = bisect.bisect_left(old, snap['time'], key=_start)
+            # inside an idle span the idle decision itself may change
+            if not (k and _is_idle(old[k - 1][0])):
+                state, cut = copy.deepcopy(snap['state']), k
+                if removed_pid is not None:
+                    _forget(state, removed_pid)
+        return state, cut
+
+    def _idle_state(self, time, index):
+        raise NotImplementedError(f"{type(self).__name__} does not support incremental updates")
+
+    def _patch_metrics(self, old_segments, new_segments, cut, workload, removed_pid):
+        """Bring metrics and result up to date after segments were replaced at `cut`."""
+        timeline = self.timeline
+        touched  = {seg[0] for seg in old_segments + new_segments if not _is_idle(seg[0])}
+        touched.discard(removed_pid)
+        if len(workload) > len(self.result.workload):
+            touched.add(workload.pids[-1])
+        indices = [workload.index(pid) for pid in touched]
+
+        # every segment of a touched process lies between its first start and
+        # the end of the replaced stretch
+        first = cut
+        per_process = self.metrics.per_process
+        for pid in touched:
+            m = per_process.get(pid)
+            if m is not None and m.first_start is not None:
+                first = min(first, bisect.bisect_left(timeline, m.first_start, hi=cut, key=_start))
+        window  = timeline[first:cut + len(new_segments)]
+        changed = compute_metrics(window, [workload.processes[i] for i in indices]).per_process
+
+        before = _last_busy(timeline, cut - 1)
+        after  = _first_busy(timeline, cut + len(new_segments))
+        if removed_pid is None:
+            start = min(self.metrics.start, workload.arrival[-1])
+        elif self.metrics.per_process[removed_pid].arrival <= self.metrics.start:
+            start = min(workload.arrival)
+        else:
+            start = self.metrics.start
+        # new objects: the old ones may be shared, e.g. by a ResultCache
+        self.metrics = self.metrics.updated(
+            changed,
+            removed=[removed_pid] if removed_pid is not None else (),
+            start=start,
+            end=max(start, _busy_end(timeline)),
+            busy_delta=_busy(new_segments) - _busy(old_segments),
+            switch_delta=(_switches(before, new_segments, after) -
+                          _switches(before, old_segments, after)),
+        )
+        removed = self.result.workload.index(removed_pid) if removed_pid is not None else None
+        self.result = self.result._refreshed(workload, self.metrics, timeline, indices, removed)
+
+    def update_metrics(self):
+        """Derive all metrics from the timeline in one pass and build the result."""
+        if self.overhead is not None:
+            self._charge_overhead()
+        lanes = getattr(self, "core_timelines", None) or None
+        self.apply_metrics(compute_metrics(self.timeline, self.processes, lanes=lanes))
+        return self.metrics
+
+    def _charge_overhead(self):
+        """Retime the run with the overhead model's dispatch costs (once per run)."""
+        if any(seg[0] == OVERHEAD for seg in self.timeline):
+            return
+        lanes = getattr(self, "core_timelines", None) or None
+        self.timeline, lanes, self.overhead_stats, retime = self.overhead.charge(
+            self.timeline, self.processes, lanes)
+        if lanes is not None:
+            self.core_timelines = lanes
+        if getattr(self, "jobs", None) is not None:
+            self.jobs.retime(retime)
+
+    def apply_metrics(self, metrics):
+        """Adopt `metrics` and build `result` from them and the timeline."""
+        # engines fill self.timeline in place; drop any index built mid-run
+        invalidate(self.timeline)
+        self.metrics = metrics
+        self.result  = ScheduleResult(self.workload, self.timeline, metrics)
+
+    def params(self):
+        """Constructor arguments of this scheduler, read back from its attributes."""
+        names = inspect.signature(type(self).__init__).parameters
+        return {n: getattr(self, n) for n in names if n != "self" and hasattr(self, n)}
+
+    def latency_stats(self, **kwargs):
+        """Percentile-capable waiting/response/turnaround stats (see LatencyStats)."""
+        return LatencyStats.from_metrics(self.metrics or self.update_metrics(), **kwargs)
+
+    def running_at(self, t):
+        """Timeline segments covering time t (one per busy core on multicore runs)."""
+        return index_for(self.timeline).at(t)
+
+    def segments_between(self, t0, t1):
+        """Timeline segments overlapping [t0, t1), ordered by start."""
+        return index_for(self.timeline).overlapping_range(t0, t1)
 
     @abc.abstractmethod
     def schedule(self):
-        """Perform the scheduling algorithm."""
+        """Perform the scheduling algorithm; returns the ScheduleResult (None without processes)."""
         pass
 
-    def print_timeline(self):
-        """Prints an ASCII Gantt chart for the timeline."""
+    def print_timeline(self, width=None, t0=None, t1=None, lanes=False, file=None):
+        """
+        Prints a text Gantt chart of the timeline, bounded to `width` columns
+        (default: the terminal width). t0/t1 select a time window; lanes=True
+        gives every process its own row. See algorithms.terminal.
+        """
         if not self.timeline:
-            print("No scheduling timeline to display.")
+            print("No scheduling timeline to display.", file=file)
             return
+        for line in render_timeline(self.timeline, width, t0, t1, lanes):
+            print(line, file=file)
 
-        chart = ""
-        time_markers = f"{self.timeline[0][1]:<3}"
-        for segment in self.timeline:
-            pid, start, end = segment
-            width = max(4, int((end - start) * 2))
-            block = f" P{pid} ".center(width, '-')
-            chart += f"|{block}"
-            time_markers += " " * width + f"{end:<3}"
-        chart += "|"
-        print("Gantt Chart:")
-        print(chart)
-        print(time_markers)
-
-    def plot_gantt_chart(self, title="Gantt Chart"):
-        """Plots the timeline using matplotlib."""
+    def plot_gantt_chart(self, title="Gantt Chart", path=None, **kwargs):
+        """
+        Plots the timeline with matplotlib, one swimlane per process.
+        With `path` the chart is saved (PNG, SVG, ...) without a display;
+        see plot_timeline for the remaining options.
+        """
         if not self.timeline:
             print("No timeline data available for plotting.")
             return
+        return plot_timeline(self.timeline, title=title, path=path, **kwargs)
 
-        fig, ax = plt.subplots()
-        y_labels = []
-        for index, segment in enumerate(self.timeline):
-            pid, start, end = segment
-            duration = end - start
-            ax.broken_barh([(start, duration)], (index * 10, 9), facecolors='tab:blue')
-            y_labels.append(f"P{pid}")
-            ax.text(start + duration/2, index * 10 + 4.5, f"P{pid}",
-                    ha='center', va='center', color='white', fontsize=8)
-        ax.set_xlabel("Time")
-        ax.set_ylabel("Execution Segments")
-        ax.set_title(title)
-        ax.set_yticks([i * 10 + 4.5 for i in range(len(self.timeline))])
-        ax.set_yticklabels(y_labels)
-        plt.show()
+    def export_trace(self, path, name=None, time_unit=1.0):
+        """
+        Writes the timeline (and, for periodic schedulers, job releases,
+        deadlines and misses) as Chrome trace-event JSON for chrome://tracing
+        or Perfetto. time_unit is trace microseconds per time unit.
+        """
+        with TraceEventWriter(path, time_unit) as w:
+            w.add_schedule(self, name)
+        return w.events
 
     def average_waiting_time(self):
         # Treat any None as 0, so sum never sees a None
-        total_wait = sum((p.waiting_time if p.waiting_time is not None else 0)
-                         for p in self.processes)
-        return total_wait / len(self.processes)
+        waits = self.result.waiting if self.result else []
+        return sum(w or 0 for w in waits) / len(self.processes)
 
     def average_turnaround_time(self):
         # Same for turnaround
-        total_tat = sum((p.turnaround_time if p.turnaround_time is not None else 0)
-                        for p in self.processes)
-        return total_tat / len(self.processes)
\ No newline at end of file
+        tats = self.result.turnaround if self.result else []
+        return sum(t or 0 for t in tats) / len(self.processes)
\ No newline at end of file
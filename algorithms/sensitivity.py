@@ -0,0 +1,256 @@
+"""
+Schedulability sensitivity analysis for periodic task sets.
+
+Instead of simulating a hyperperiod per candidate, every question is
+answered with exact analytic tests, binary-searched where needed:
+
+    RM / DM – fixed priorities (by period / by relative deadline),
+              response-time analysis
+    EDF     – processor-demand criterion, checked with Quick convergence
+              Processor-demand Analysis (QPA, Zhang & Burns)
+
+Tasks are released together at time 0 with deadlines ≤ periods (tasks
+without a deadline get an implicit one); the tests are exact for that
+model. Note that RateMonotonicScheduler ranks tasks by the time left to
+their next release, which makes it behave like EDF with implicit
+deadlines; policy "EDF" describes it, "RM" is textbook rate-monotonic.
+
+    report = analyze(processes, policy="RM")
+    report.schedulable, report.scaling_factor, report.breakdown_utilization
+    report.slack                      # per task, see SensitivityReport
+    scaling_factor(processes, "EDF", task=3)           # one task's burst
+    scaling_factor(processes, "RM", target="period")   # shrink all periods
+"""
+import math
+
+import numpy as np
+
+POLICIES = ("RM", "DM", "EDF")
+EPS = 1e-9
+# constrained-deadline EDF searches stop at this load: the exact test scans a
+# busy period that grows like 1 / (1 − U)
+EDF_MAX_UTILIZATION = 1 - 1e-4
+
+
+def _arrays(processes):
+    """Burst, period and relative deadline arrays of a task set."""
+    C, T, D = [], [], []
+    for p in processes:
+        if p.period is None:
+            raise ValueError(f"Process {p.pid} has no period")
+        C.append(float(p.burst_time))
+        T.append(float(p.period))
+        D.append(float(p.deadline if p.deadline is not None else p.period))
+    C, T, D = np.array(C), np.array(T), np.array(D)
+    if (T <= 0).any() or (C < 0).any():
+        raise ValueError("Periods must be positive and bursts non-negative")
+    if (D > T).any():
+        raise ValueError("Sensitivity analysis needs deadlines <= periods")
+    return C, T, D
+
+
+def _priority_order(T, D, policy):
+    """Task indices from highest to lowest priority (ties by position)."""
+    return np.argsort(D if policy == "DM" else T, kind="stable")
+
+
+# ─── exact tests ─────────────────────────────────────────────────────────────
+
+def response_times(C, T, D, order, stop_at_miss=False):
+    """
+    Worst-case response time of every task under fixed priorities `order`
+    (highest first); inf once a response time exceeds its deadline. With
+    `stop_at_miss`, tasks after the first miss are left at inf.
+    """
+    R = np.full(len(C), np.inf)
+    for rank, i in enumerate(order):
+        hp_C, hp_T = C[order[:rank]], T[order[:rank]]
+        r = C[i] + hp_C.sum()
+        while r <= D[i] + EPS:
+            nxt = C[i] + (np.ceil(r / hp_T - EPS) * hp_C).sum()
+            if nxt <= r + EPS:
+                R[i] = nxt
+                break
+            r = nxt
+        if stop_at_miss and R[i] == np.inf:
+            break
+    return R
+
+
+def _demand(C, T, D, t):
+    """Processor demand h(t): work of all jobs with deadline ≤ t."""
+    return (np.maximum(np.floor((t - D) / T + EPS) + 1, 0) * C).sum()
+
+
+def _last_deadline_before(T, D, t):
+    """Largest absolute deadline strictly below t (or -inf)."""
+    k = np.ceil((t - D) / T - EPS) - 1
+    d = np.where(k >= 0, k * T + D, -np.inf)
+    return d.max()
+
+
+def _busy_period(C, T, limit=math.inf):
+    """Length of the synchronous busy period (U <= 1), or a value past `limit`."""
+    L = C.sum()
+    while L < limit:
+        nxt = (np.ceil(L / T - EPS) * C).sum()
+        if nxt <= L + EPS:
+            break
+        L = nxt
+    return L
+
+
+def edf_schedulable(C, T, D):
+    """Exact EDF test for synchronous constrained-deadline tasks (QPA)."""
+    U = (C / T).sum()
+    if U > 1 + EPS:
+        return False
+    if (D >= T).all():
+        return True
+    # test interval: min of La (for U < 1) and the synchronous busy period,
+    # whose iteration can stop as soon as it passes La
+    La = max(D.max(), ((T - D) * C / T).sum() / (1 - U)) if U < 1 - EPS else math.inf
+    L  = min(_busy_period(C, T, La), La)
+    d_min = D.min()
+    t = _last_deadline_before(T, D, L + EPS)
+    if t < d_min:
+        return True  # the busy period ends before the first deadline
+    while True:
+        h = _demand(C, T, D, t)
+        if h > t + EPS:
+            return False
+        if h <= d_min + EPS:
+            return True
+        t = h if h < t - EPS else _last_deadline_before(T, D, t)
+
+
+def _test(C, T, D, policy):
+    if policy == "EDF":
+        return edf_schedulable(C, T, D)
+    R = response_times(C, T, D, _priority_order(T, D, policy), stop_at_miss=True)
+    return bool(np.isfinite(R).all())
+
+
+def schedulable(processes, policy="EDF"):
+    """Exact schedulability of a task set under `policy`."""
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}; expected one of {POLICIES}")
+    return _test(*_arrays(processes), policy)
+
+
+# ─── sensitivity ─────────────────────────────────────────────────────────────
+
+def _search(ok, lo, hi, tol):
+    """Largest x in [lo, hi] with ok(x), given ok(lo) and monotonicity."""
+    while hi - lo > tol * max(lo, 1.0):
+        mid = (lo + hi) / 2
+        if ok(mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def scaling_factor(processes, policy="EDF", task=None, target="burst", tol=1e-6):
+    """
+    Largest factor λ keeping the set schedulable when
+
+        target="burst"  – bursts are multiplied by λ
+        target="period" – periods are divided by λ (deadlines shrink with
+                          them, staying ≤ the period)
+
+    applied to every task, or only to process index `task`. λ < 1 means
+    the set is unschedulable as given and must shrink by that much. For EDF
+    with constrained deadlines the search ends at EDF_MAX_UTILIZATION.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}; expected one of {POLICIES}")
+    if target not in ("burst", "period"):
+        raise ValueError(f"target must be 'burst' or 'period', got {target!r}")
+    C, T, D = _arrays(processes)
+    mask = np.zeros(len(C), bool)
+    if task is None:
+        mask[:] = True
+    else:
+        mask[task] = True
+    if not (C[mask] > 0).any():
+        return math.inf
+
+    def ok(lam):
+        if target == "burst":
+            return _test(np.where(mask, C * lam, C), T, D, policy)
+        T2 = np.where(mask, T / lam, T)
+        return _test(C, T2, np.minimum(np.where(mask, D / lam, D), T2), policy)
+
+    # λ can never exceed the point where the scaled tasks alone fill the CPU
+    U_in, U_out = (C[mask] / T[mask]).sum(), (C[~mask] / T[~mask]).sum()
+    hi = (1 - U_out) / U_in if U_out < 1 else 0.0
+    if policy == "EDF" and (D < T).any():
+        hi = min(hi, (EDF_MAX_UTILIZATION - U_out) / U_in)
+    if hi <= 0 or not ok(EPS):
+        return 0.0
+    if ok(hi):
+        return hi
+    return _search(ok, EPS, hi, tol)
+
+
+class SensitivityReport:
+    """
+    policy                – "RM", "DM" or "EDF"
+    utilization           – Σ C/T
+    schedulable           – exact test result
+    scaling_factor        – largest common burst multiplier (see scaling_factor)
+    breakdown_utilization – utilization × scaling_factor: the load at which
+                            this set's shape stops being schedulable
+    response_time         – per task (RM/DM; inf if the deadline is missed)
+    slack                 – per task, by process index. RM/DM: D − R, time
+                            to spare before the deadline. EDF: least
+                            t − h(t) over the task's deadlines t in the
+                            synchronous busy period, h being the processor
+                            demand; negative when one of them is missed
+    """
+    def __init__(self, policy, utilization, schedulable, scaling_factor, response_time, slack):
+        self.policy         = policy
+        self.utilization    = utilization
+        self.schedulable    = schedulable
+        self.scaling_factor = scaling_factor
+        self.breakdown_utilization = utilization * scaling_factor
+        self.response_time  = response_time
+        self.slack          = slack
+
+    def __repr__(self):
+        return (f"SensitivityReport({self.policy}: U={self.utilization:.3f}, "
+                f"schedulable={self.schedulable}, scaling={self.scaling_factor:.4f}, "
+                f"breakdown={self.breakdown_utilization:.3f})")
+
+
+def _edf_slack(C, T, D):
+    """Per task: least t − h(t) over its deadlines in the synchronous busy period."""
+    if (C / T).sum() > 1 + EPS:
+        return [-math.inf] * len(C)
+    busy  = _busy_period(C, T)
+    slack = []
+    for i in range(len(C)):
+        t = np.arange(D[i], max(busy, D[i]) + EPS, T[i])
+        h = (np.maximum(np.floor((t[:, None] - D) / T + EPS) + 1, 0) * C).sum(axis=1)
+        slack.append(float((t - h).min()))
+    return slack
+
+
+def analyze(processes, policy="EDF", tol=1e-6):
+    """Schedulability, scaling factor, breakdown utilization and per-task slack."""
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}; expected one of {POLICIES}")
+    C, T, D = _arrays(processes)
+    U = float((C / T).sum())
+    lam = scaling_factor(processes, policy, tol=tol)
+    if policy == "EDF":
+        ok    = edf_schedulable(C, T, D)
+        resp  = None
+        slack = _edf_slack(C, T, D)
+    else:
+        R     = response_times(C, T, D, _priority_order(T, D, policy))
+        ok    = bool(np.isfinite(R).all())
+        resp  = R.tolist()
+        slack = (D - R).tolist()
+    return SensitivityReport(policy, U, ok, lam, resp, slack)
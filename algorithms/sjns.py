@@ -1,3 +1,5 @@
+import heapq
+
 from algorithms.scheduler import Scheduler
 
 class ShortestJobNextScheduler(Scheduler):
@@ -5,37 +7,66 @@ class ShortestJobNextScheduler(Scheduler):
     Non-preemptive Shortest Job Next (SJN) scheduling.
     Inserts an “idle” segment (with empty PID) whenever there's
     a gap between the current time and the next process arrival.
+    Ties go to the process added first.
     """
+    INCREMENTAL = True
+
     def schedule(self):
-        unscheduled  = self.processes.copy()
-        current_time = 0
+        self.timeline    = []
+        self.checkpoints = []
+        self._next_checkpoint = 0
+        self._advance(self._initial_state(), float('inf'), self.timeline, checkpoints=True)
+        self.update_metrics()
+        return self.result
 
-        while unscheduled:
-            # build the ready queue
-            ready_queue = [p for p in unscheduled if p.arrival_time <= current_time]
+    def _initial_state(self):
+        return self._idle_state(0, 0)
 
-            if not ready_queue:
-                # no one is ready → idle until the next arrival
-                next_arrival = min(unscheduled, key=lambda p: p.arrival_time).arrival_time
-                # record an unlabeled idle span
-                self.timeline.append(("", current_time, next_arrival))
-                current_time = next_arrival
-                ready_queue = [p for p in unscheduled if p.arrival_time <= current_time]
+    def _idle_state(self, time, index):
+        return {
+            'time' : time,
+            'index': index,  # next process, in arrival order, not yet arrived
+            'ready': [],     # pids that arrived and have not run
+        }
 
-            # pick the shortest-burst process
-            proc = min(ready_queue, key=lambda p: p.burst_time)
+    def _continue(self, state):
+        self._advance(state, float('inf'), self.timeline, checkpoints=True)
+        self.update_metrics()
 
-            # schedule it
-            start = current_time
-            end   = start + proc.burst_time
+    def _advance(self, state, stop, timeline, jobs=None, checkpoints=False, converge=None):
+        w     = self.workload
+        order = w.order
+        # ready queue as a heap of (burst, process index)
+        ready = [(w.burst[i], i) for i in map(w.index, state['ready'])]
+        heapq.heapify(ready)
+        index        = state['index']
+        current_time = state['time']
 
-            proc.start_time      = start
-            proc.completion_time = end
-            proc.waiting_time    = start - proc.arrival_time
-            proc.turnaround_time = end   - proc.arrival_time
+        def save():
+            state['time']  = current_time
+            state['index'] = index
+            state['ready'] = [w.pids[i] for _, i in ready]
 
-            self.timeline.append((proc.pid, start, end))
+        while (ready or index < len(order)) and current_time < stop:
+            if checkpoints and self._checkpoint_due(current_time):
+                save()
+                self._save_checkpoint(current_time, state)
+            while index < len(order) and w.arrival[order[index]] <= current_time:
+                heapq.heappush(ready, (w.burst[order[index]], order[index]))
+                index += 1
+
+            if not ready:
+                # no one is ready → idle until the next arrival
+                if converge is not None and converge(current_time):
+                    break
+                next_arrival = w.arrival[order[index]]
+                # record an unlabeled idle span
+                timeline.append(("", current_time, next_arrival))
+                current_time = next_arrival
+                continue
 
-            # advance and remove
-            current_time += proc.burst_time
-            unscheduled.remove(proc)
+            # run the shortest-burst process to completion
+            burst, i = heapq.heappop(ready)
+            timeline.append((w.pids[i], current_time, current_time + burst))
+            current_time += burst
+        save()
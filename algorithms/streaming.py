@@ -0,0 +1,176 @@
+import math
+
+
+class RunningStats:
+    """
+    Count, mean, variance, min and max in O(1) memory (Welford's update).
+    Two instances merge exactly (Chan et al.), so parallel runs can be combined.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean  = 0.0
+        self._m2   = 0.0
+        self.min   = None
+        self.max   = None
+
+    def record(self, value):
+        self.count += 1
+        delta      = value - self.mean
+        self.mean += delta / self.count
+        self._m2  += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def variance(self):
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def stddev(self):
+        return math.sqrt(self.variance)
+
+    def merge(self, other):
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2  += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min   = min(self.min, other.min)
+        self.max   = max(self.max, other.max)
+        return self
+
+
+class LogHistogram:
+    """
+    HDR-style histogram with log-spaced buckets.
+
+    Every recorded value lands in a bucket whose width is `precision` times
+    its lower bound, so any percentile is reported within that relative
+    error. Values below `unit` share one bucket. Memory depends only on the
+    value range (roughly log(max/unit) / precision buckets), never on how
+    many values were recorded, and histograms with the same parameters
+    merge exactly by adding bucket counts.
+    """
+    def __init__(self, precision=0.01, unit=1e-3):
+        if precision <= 0:
+            raise ValueError("precision must be positive")
+        self.precision = precision
+        self.unit      = unit
+        self._log_base = math.log1p(precision)
+        self.counts    = {}  # bucket → count, -1 is the "below unit" bucket
+        self.count     = 0
+        self.min       = None
+        self.max       = None
+
+    def _bucket(self, value):
+        if value < self.unit:
+            return -1
+        return int(math.log(value / self.unit) / self._log_base)
+
+    def _midpoint(self, bucket):
+        if bucket < 0:
+            return 0.0
+        low = self.unit * (1 + self.precision) ** bucket
+        return low * (1 + self.precision / 2)
+
+    def record(self, value, n=1):
+        b = self._bucket(value)
+        self.counts[b] = self.counts.get(b, 0) + n
+        self.count += n
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        if (other.precision, other.unit) != (self.precision, self.unit):
+            raise ValueError("Can only merge histograms with the same precision and unit")
+        for b, n in other.counts.items():
+            self.counts[b] = self.counts.get(b, 0) + n
+        self.count += other.count
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, q):
+        """Value at percentile q (0–100), within the histogram's precision."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for b in sorted(self.counts):
+            seen += self.counts[b]
+            if seen >= rank:
+                return min(max(self._midpoint(b), self.min), self.max)
+        return self.max
+
+
+class LatencyStats:
+    """
+    Streaming waiting / response / turnaround statistics.
+
+    observe() is O(1) per completed job and the memory footprint is fixed,
+    so tail latencies of arbitrarily long simulations can be tracked
+    without keeping every job. merge() combines results of parallel runs.
+    """
+    METRICS = ("waiting", "response", "turnaround")
+
+    def __init__(self, precision=0.01, unit=1e-3):
+        self.histograms = {m: LogHistogram(precision, unit) for m in self.METRICS}
+        self.running    = {m: RunningStats() for m in self.METRICS}
+
+    def observe(self, waiting=None, response=None, turnaround=None):
+        for name, value in (("waiting", waiting), ("response", response), ("turnaround", turnaround)):
+            if value is None:
+                continue
+            self.histograms[name].record(value)
+            self.running[name].record(value)
+
+    def merge(self, other):
+        for m in self.METRICS:
+            self.histograms[m].merge(other.histograms[m])
+            self.running[m].merge(other.running[m])
+        return self
+
+    def percentile(self, metric, q):
+        return self.histograms[metric].percentile(q)
+
+    def summary(self, percentiles=(50, 95, 99)):
+        """metric → {count, mean, stddev, max, p50, p95, p99, ...}"""
+        out = {}
+        for m in self.METRICS:
+            run = self.running[m]
+            row = {'count': run.count, 'mean': run.mean, 'stddev': run.stddev, 'max': run.max}
+            for q in percentiles:
+                row[f"p{q:g}"] = self.histograms[m].percentile(q)
+            out[m] = row
+        return out
+
+    @classmethod
+    def from_metrics(cls, metrics, **kwargs):
+        """Feed every completed process of a Metrics object."""
+        stats = cls(**kwargs)
+        for m in metrics.per_process.values():
+            if m.completion is not None:
+                stats.observe(m.waiting, m.response, m.turnaround)
+        return stats
+
+    @classmethod
+    def from_jobs(cls, jobs, **kwargs):
+        """
+        Feed every finished job of a JobLog. A job's real-time response time
+        (finish - release) is recorded as both response and turnaround.
+        """
+        stats = cls(**kwargs)
+        for job in range(len(jobs)):
+            finish = jobs.finished[job]
+            if math.isnan(finish):
+                continue
+            response = finish - jobs.released[job]
+            stats.observe(response - jobs.executed[job], response, response)
+        return stats
@@ -0,0 +1,82 @@
+import heapq
+from algorithms.scheduler import Scheduler
+from algorithms.fairness import ShareTracker
+
+class StrideScheduler(Scheduler):
+    """
+    Stride scheduling (Waldspurger & Weihl).
+
+    Each process holds `weight` tickets and has stride = STRIDE1 / tickets.
+    The runnable process with the smallest pass value runs for one quantum,
+    then its pass advances by its stride. Runnable processes live in a heap,
+    so each decision is O(log n).
+
+    After scheduling:
+        received    – pid → CPU time actually given
+        entitled    – pid → CPU time owed under ideal weighted sharing
+        share_error – pid → received - entitled
+    """
+    STRIDE1 = 1 << 20
+
+    def __init__(self, time_quantum=1):
+        super().__init__()
+        self.time_quantum = time_quantum
+        self.received     = {}
+        self.entitled     = {}
+        self.share_error  = {}
+
+    def schedule(self):
+        if not self.processes:
+            return
+
+        order     = sorted(self.processes, key=lambda p: p.arrival_time)
+        remaining = {p.pid: p.burst_time for p in order}
+        stride    = {p.pid: self.STRIDE1 / p.weight for p in order}
+        tracker   = ShareTracker()
+        self.received = {p.pid: 0 for p in order}
+
+        heap         = []  # (pass, seq, process)
+        seq          = 0
+        global_pass  = 0.0
+        tickets      = 0
+        index        = 0
+        current_time = order[0].arrival_time
+
+        def admit(t):
+            nonlocal index, seq, tickets
+            while index < len(order) and order[index].arrival_time <= t:
+                p = order[index]
+                heapq.heappush(heap, (global_pass + stride[p.pid], seq, p))
+                tracker.join(p.pid, p.weight, p.arrival_time)
+                tickets += p.weight
+                seq   += 1
+                index += 1
+
+        while heap or index < len(order):
+            admit(current_time)
+            if not heap:
+                current_time = order[index].arrival_time
+                continue
+
+            pass_, _, proc = heapq.heappop(heap)
+            run   = min(self.time_quantum, remaining[proc.pid])
+            start = current_time
+            current_time += run
+            self._append_segment(proc.pid, start, current_time)
+            self.received[proc.pid] += run
+            remaining[proc.pid]     -= run
+            global_pass += run * self.STRIDE1 / tickets
+
+            # arrivals during this quantum queue up before the preempted job
+            admit(current_time)
+            if remaining[proc.pid] > 0:
+                heapq.heappush(heap, (pass_ + stride[proc.pid] * run / self.time_quantum, seq, proc))
+                seq += 1
+            else:
+                tracker.leave(proc.pid, current_time)
+                tickets -= proc.weight
+
+        self.entitled    = tracker.entitled
+        self.share_error = tracker.errors(self.received)
+        self.update_metrics()
+        return self.result
@@ -0,0 +1,130 @@
+"""
+Width-bounded text Gantt charts.
+
+The time window is split into as many columns as fit the terminal; every
+segment adds its overlap to the columns it covers, so rendering costs
+O(S + width) and the output size depends only on the width and the number
+of processes, never on the length of the timeline. Lines are yielded one
+at a time so they can be streamed straight to a terminal or a pipe.
+"""
+import math
+import shutil
+
+from algorithms.metrics import _is_idle
+from algorithms.interval_index import index_for
+
+SYMBOLS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+TICK_EVERY = 10  # columns between time labels
+
+
+def _symbols(pids):
+    """pid → one-character symbol; '*' once the alphabet runs out."""
+    return {pid: SYMBOLS[i] if i < len(SYMBOLS) else "*" for i, pid in enumerate(pids)}
+
+
+def _buckets(timeline, t0, t1, columns):
+    """Per column: {pid: time run inside that column}."""
+    cols = [dict() for _ in range(columns)]
+    step = (t1 - t0) / columns
+    for pid, start, end in timeline:
+        if _is_idle(pid):
+            continue
+        start, end = max(start, t0), min(end, t1)
+        if end <= start:
+            continue
+        first = min(int((start - t0) / step), columns - 1)
+        last  = min(int(math.ceil((end - t0) / step)), columns)
+        for c in range(first, last):
+            lo = t0 + c * step
+            overlap = min(end, lo + step) - max(start, lo)
+            if overlap > 0:
+                cols[c][pid] = cols[c].get(pid, 0) + overlap
+    return cols, step
+
+
+def _axis(t0, step, columns, indent):
+    """Tick marks and time labels every TICK_EVERY columns."""
+    marks  = [" "] * (columns + 1)
+    labels = [" "] * (columns + 12)
+    for c in range(0, columns + 1, TICK_EVERY):
+        marks[c] = "|"
+        text = f"{t0 + c * step:.4g}"
+        labels[c:c + len(text)] = text
+    return " " * indent + "".join(marks).rstrip(), " " * indent + "".join(labels).rstrip()
+
+
+def render_timeline(timeline, width=None, t0=None, t1=None, lanes=False):
+    """
+    Yield the lines of a text Gantt chart of `timeline` over [t0, t1)
+    (default: the whole timeline), at most `width` characters wide
+    (default: the terminal width).
+
+    lanes=False – one row; each column shows the process that ran longest in it
+    lanes=True  – one row per process; '#' if it ran at least half the column,
+                  '-' if it ran less, blank if not at all
+    """
+    busy = [seg for seg in timeline if not _is_idle(seg[0])]
+    if not busy:
+        return
+    if t0 is None:
+        t0 = min(seg[1] for seg in busy)
+    if t1 is None:
+        t1 = max(seg[2] for seg in busy)
+    if t1 <= t0:
+        return
+
+    width = width or shutil.get_terminal_size().columns
+    if lanes:
+        # label column wide enough for every pid that runs in the window
+        names  = {seg[0]: f"P{seg[0]}" for seg in busy if seg[1] < t1 and seg[2] > t0}
+        indent = max((len(n) for n in names.values()), default=0) + 1
+    else:
+        indent = 0
+    columns = max(width - indent - 2, 1)
+    cols, step = _buckets(busy, t0, t1, columns)
+
+    yield f"Gantt Chart [{t0:g}, {t1:g}), {step:.3g} per column"
+    if lanes:
+        shown = dict.fromkeys(pid for col in cols for pid in col)
+        for pid in shown:
+            row = []
+            for col in cols:
+                ran = col.get(pid, 0)
+                row.append("#" if ran >= step / 2 else "-" if ran > 0 else " ")
+            yield f"{names[pid]:<{indent}}|{''.join(row)}|"
+    else:
+        dominant = [max(col, key=col.get) if col else None for col in cols]
+        symbol   = _symbols(dict.fromkeys(pid for pid in dominant if pid is not None))
+        yield "|" + "".join(symbol[pid] if pid is not None else "." for pid in dominant) + "|"
+    marks, labels = _axis(t0, step, columns, indent)
+    yield marks
+    yield labels
+    if not lanes:
+        # legend wrapped to the same width; at most one entry per column
+        line = "Legend: .=idle"
+        for pid, sym in symbol.items():
+            entry = f"  {sym}=P{pid}"
+            if len(line) + len(entry) > width:
+                yield line
+                line = "       "
+            line += entry
+        yield line
+
+
+def render_pages(timeline, span, width=None, lanes=False):
+    """
+    Yield one list of lines per consecutive window of `span` time units.
+    Each page only touches the segments in its window (via the interval index).
+    """
+    if span <= 0:
+        raise ValueError(f"span must be positive, got {span}")
+    index = index_for(timeline)
+    if not len(index):
+        return
+    t   = index.segments[0][1]
+    end = max(seg[2] for seg in index.segments)
+    while t < end:
+        window = index.overlapping_range(t, t + span)
+        if window:
+            yield list(render_timeline(window, width, t, min(t + span, end), lanes))
+        t += span
@@ -0,0 +1,158 @@
+"""
+Export schedules as Chrome trace-event JSON, for chrome://tracing and
+ui.perfetto.dev (which open traces far larger than the Gantt views can).
+
+Events are written one by one as they are produced, so memory does not
+grow with the timeline and the input may be any iterable of segments.
+A file can hold several runs, each shown as its own process: simulated
+schedules from different algorithms, and the recorded CPU activity of a
+real trace (see algorithms.traces.switch_segments), side by side.
+
+    with TraceEventWriter("rm_vs_edf.json") as w:
+        w.add_schedule(rm, name="RM")
+        w.add_schedule(edf, name="EDF")
+
+Layout per run:
+    CPU n tracks     – one complete ("X") slice per execution segment
+    P<pid> tracks    – periodic schedulers only: job slices from release to
+                       finish, release and deadline markers, and a
+                       run-wide marker at every deadline miss
+"""
+import gzip
+import json
+import math
+
+from algorithms.metrics import _is_idle
+
+TASK_TID = 1000  # task tracks come after the CPU tracks
+
+
+class TraceEventWriter:
+    """
+    Incremental writer of a trace-event JSON file.
+
+    target    – path (".gz" is compressed) or a text file object
+    time_unit – trace microseconds per simulator time unit
+    """
+    def __init__(self, target, time_unit=1.0):
+        if isinstance(target, str):
+            self.file  = gzip.open(target, "wt") if target.endswith(".gz") else open(target, "w")
+            self._owns = True
+        else:
+            self.file  = target
+            self._owns = False
+        self.time_unit = time_unit
+        self.events    = 0
+        self._runs     = 0
+        self._lanes    = set()  # (run, tid) with a name already written
+        self.file.write('{"displayTimeUnit":"ns","traceEvents":[\n')
+
+    # ─── low level ───────────────────────────────────────────────────────────
+
+    def _emit(self, text):
+        self.file.write(text if not self.events else ",\n" + text)
+        self.events += 1
+
+    def _metadata(self, run, kind, value, tid=None):
+        tid = "" if tid is None else f',"tid":{tid}'
+        self._emit(f'{{"name":"{kind}","ph":"M","pid":{run}{tid},"args":{json.dumps(value)}}}')
+
+    def _lane(self, run, tid, name):
+        if (run, tid) not in self._lanes:
+            self._lanes.add((run, tid))
+            self._metadata(run, "thread_name", {"name": name}, tid)
+            self._metadata(run, "thread_sort_index", {"sort_index": tid}, tid)
+
+    def begin_run(self, name):
+        """New top-level group (a trace "process"); returns its id."""
+        self._runs += 1
+        self._metadata(self._runs, "process_name", {"name": name})
+        self._metadata(self._runs, "process_sort_index", {"sort_index": self._runs})
+        return self._runs
+
+    # ─── content ─────────────────────────────────────────────────────────────
+
+    def add_segments(self, run, segments):
+        """Execution segments (lane, pid, start, end); lane is the CPU index."""
+        scale = self.time_unit
+        names = {}
+        for lane, pid, start, end in segments:
+            if _is_idle(pid):
+                continue
+            self._lane(run, lane, f"CPU {lane}")
+            label = names.get(pid)
+            if label is None:
+                label = names[pid] = json.dumps(f"P{pid}")
+            self._emit(f'{{"name":{label},"cat":"run","ph":"X","ts":{start * scale},'
+                       f'"dur":{(end - start) * scale},"pid":{run},"tid":{lane},'
+                       f'"args":{{"pid":{json.dumps(pid)}}}}}')
+
+    def add_jobs(self, run, jobs):
+        """Releases, job slices, deadlines and misses of a JobLog."""
+        scale = self.time_unit
+        for job in range(len(jobs)):
+            idx      = jobs.task[job]
+            pid      = jobs.pids[idx]
+            tid      = TASK_TID + idx
+            release  = jobs.released[job] * scale
+            deadline = jobs.deadline[job] * scale
+            finished = jobs.finished[job]
+            missed   = bool(jobs.missed[job])
+            self._lane(run, tid, f"P{pid}")
+            label = json.dumps(f"P{pid}")
+            args  = json.dumps({
+                "job": job, "release": jobs.released[job], "deadline": jobs.deadline[job],
+                "finished": None if math.isnan(finished) else finished,
+                "executed": jobs.executed[job], "missed": missed,
+            })
+            self._emit(f'{{"name":"release","cat":"release","ph":"i","s":"t","ts":{release},'
+                       f'"pid":{run},"tid":{tid}}}')
+            self._emit(f'{{"name":"deadline","cat":"deadline","ph":"i","s":"t","ts":{deadline},'
+                       f'"pid":{run},"tid":{tid}}}')
+            # async slices, since a job may outlive its successor's release
+            end = deadline if math.isnan(finished) else finished * scale
+            self._emit(f'{{"name":{label},"cat":"job","ph":"b","id":"{run}.{job}","ts":{release},'
+                       f'"pid":{run},"tid":{tid},"args":{args}}}')
+            self._emit(f'{{"name":{label},"cat":"job","ph":"e","id":"{run}.{job}","ts":{end},'
+                       f'"pid":{run},"tid":{tid}}}')
+            if missed:
+                self._emit(f'{{"name":"deadline miss","cat":"miss","ph":"i","s":"p","ts":{deadline},'
+                           f'"pid":{run},"tid":{tid},"args":{args}}}')
+
+    def add_schedule(self, scheduler, name=None, jobs=True):
+        """A scheduler's timeline (per core when it has core_timelines) and its jobs."""
+        run   = self.begin_run(name or type(scheduler).__name__)
+        lanes = getattr(scheduler, "core_timelines", None) or [scheduler.timeline]
+        for core, lane in enumerate(lanes):
+            self.add_segments(run, ((core, pid, start, end) for pid, start, end in lane))
+        if jobs and getattr(scheduler, "jobs", None) is not None:
+            self.add_jobs(run, scheduler.jobs)
+        return run
+
+    def close(self):
+        self.file.write("\n]}\n")
+        if self._owns:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def export_trace(path, schedulers, time_unit=1.0):
+    """
+    Write one or more schedulers to `path`; `schedulers` is a scheduler,
+    a list of them, or a name → scheduler mapping. Returns the event count.
+    """
+    if isinstance(schedulers, dict):
+        runs = schedulers.items()
+    elif isinstance(schedulers, (list, tuple)):
+        runs = [(None, s) for s in schedulers]
+    else:
+        runs = [(None, schedulers)]
+    with TraceEventWriter(path, time_unit) as w:
+        for name, sched in runs:
+            w.add_schedule(sched, name)
+    return w.events
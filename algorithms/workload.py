@@ -0,0 +1,179 @@
+"""
+Read-only workloads and per-run results.
+
+A Workload is built once from a list of Process objects and can then be
+loaded into any number of schedulers, sequentially or from several threads:
+schedulers only read it. Everything a run produces lives in the
+ScheduleResult returned by schedule(), with per-process values in lists
+indexed like the workload.
+
+    w = Workload(processes)
+    for cls in (FCFS_Scheduler, ShortestJobNextScheduler):
+        result = cls().load(w).schedule()
+        print(result.avg_waiting, result.waiting[0])
+"""
+import bisect
+
+
+class Workload:
+    """
+    Immutable set of processes, in the order given.
+
+    processes – tuple of the Process objects (never written to by schedulers)
+    pids, arrival, burst, deadline, period, weight
+              – tuples of the corresponding attributes, by process index
+    order     – process indices sorted by arrival (stable)
+    """
+    __slots__ = ("processes", "pids", "arrival", "burst", "deadline", "period",
+                 "weight", "order", "_index")
+
+    def __init__(self, processes):
+        procs = tuple(processes)
+        set_  = object.__setattr__
+        set_(self, "processes", procs)
+        set_(self, "pids",     tuple(p.pid for p in procs))
+        set_(self, "arrival",  tuple(p.arrival_time for p in procs))
+        set_(self, "burst",    tuple(p.burst_time for p in procs))
+        set_(self, "deadline", tuple(p.deadline for p in procs))
+        set_(self, "period",   tuple(p.period for p in procs))
+        set_(self, "weight",   tuple(p.weight for p in procs))
+        set_(self, "order",    tuple(sorted(range(len(procs)), key=self.arrival.__getitem__)))
+        set_(self, "_index",   {pid: i for i, pid in reversed(list(enumerate(self.pids)))})
+
+    def with_process(self, process):
+        """New Workload with `process` appended, sharing this one's sorted order."""
+        w    = object.__new__(Workload)
+        set_ = object.__setattr__
+        set_(w, "processes", self.processes + (process,))
+        set_(w, "pids",      self.pids + (process.pid,))
+        set_(w, "arrival",   self.arrival + (process.arrival_time,))
+        set_(w, "burst",     self.burst + (process.burst_time,))
+        set_(w, "deadline",  self.deadline + (process.deadline,))
+        set_(w, "period",    self.period + (process.period,))
+        set_(w, "weight",    self.weight + (process.weight,))
+        # after every earlier process with the same arrival, like a stable sort
+        pos = bisect.bisect_right(self.order, process.arrival_time, key=self.arrival.__getitem__)
+        set_(w, "order",     self.order[:pos] + (len(self),) + self.order[pos:])
+        index = dict(self._index)
+        index.setdefault(process.pid, len(self))
+        set_(w, "_index",    index)
+        return w
+
+    def without(self, i):
+        """New Workload without the process at index `i`."""
+        w    = object.__new__(Workload)
+        set_ = object.__setattr__
+        for name in ("processes", "pids", "arrival", "burst", "deadline", "period", "weight"):
+            column = getattr(self, name)
+            set_(w, name, column[:i] + column[i + 1:])
+        set_(w, "order", tuple([j - (j > i) for j in self.order if j != i]))
+        if len(self._index) == len(self):
+            # unique pids: only the ones after i move
+            index = dict(self._index)
+            del index[self.pids[i]]
+            index.update(zip(w.pids[i:], range(i, len(w.pids))))
+        else:
+            index = {pid: k for k, pid in reversed(list(enumerate(w.pids)))}
+        set_(w, "_index", index)
+        return w
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Workload is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("Workload is read-only")
+
+    def __len__(self):
+        return len(self.processes)
+
+    def __iter__(self):
+        return iter(self.processes)
+
+    def __getitem__(self, i):
+        return self.processes[i]
+
+    def index(self, pid):
+        """Index of the (first) process with this pid."""
+        try:
+            return self._index[pid]
+        except KeyError:
+            raise ValueError(f"No process with pid {pid!r} in workload")
+
+    def __repr__(self):
+        return f"Workload({len(self)} processes)"
+
+
+class ScheduleResult:
+    """
+    Output of one schedule() call.
+
+    workload  – the Workload that was scheduled
+    timeline  – list of (pid, start, end)
+    metrics   – Metrics derived from the timeline
+    start, completion, response, turnaround, waiting
+              – lists by process index; None for processes that never ran
+    """
+    def __init__(self, workload, timeline, metrics):
+        self.workload = workload
+        self.timeline = timeline
+        self.metrics  = metrics
+
+        per_process = [metrics.per_process.get(pid) for pid in workload.pids]
+        self.start      = [m.first_start if m else None for m in per_process]
+        self.completion = [m.completion if m else None for m in per_process]
+        self.response   = [m.response if m else None for m in per_process]
+        self.turnaround = [m.turnaround if m else None for m in per_process]
+        self.waiting    = [m.waiting if m else None for m in per_process]
+
+    def _refreshed(self, workload, metrics, timeline, changed=(), removed=None):
+        """
+        New result following an incremental update of the schedule: for
+        `workload`, `metrics` and `timeline`, without row `removed` (of the
+        old workload), with rows for appended processes and the `changed`
+        indices re-read from the metrics. This result is left as it is.
+        """
+        r = object.__new__(ScheduleResult)
+        r.workload = workload
+        r.timeline = timeline
+        r.metrics  = metrics
+        columns = []
+        for column in (self.start, self.completion, self.response, self.turnaround, self.waiting):
+            column = list(column)
+            if removed is not None:
+                del column[removed]
+            column.extend([None] * (len(workload) - len(column)))
+            columns.append(column)
+        r.start, r.completion, r.response, r.turnaround, r.waiting = columns
+        for i in changed:
+            m = metrics.per_process.get(workload.pids[i])
+            r.start[i]      = m.first_start if m else None
+            r.completion[i] = m.completion if m else None
+            r.response[i]   = m.response if m else None
+            r.turnaround[i] = m.turnaround if m else None
+            r.waiting[i]    = m.waiting if m else None
+        return r
+
+    @property
+    def avg_waiting(self):
+        # processes that never ran count as 0, like Metrics
+        return sum(w or 0 for w in self.waiting) / (len(self.waiting) or 1)
+
+    @property
+    def avg_turnaround(self):
+        return sum(t or 0 for t in self.turnaround) / (len(self.turnaround) or 1)
+
+    def of(self, pid):
+        """Per-process values of `pid` as a dict."""
+        i = self.workload.index(pid)
+        return {
+            "pid"       : pid,
+            "start"     : self.start[i],
+            "completion": self.completion[i],
+            "response"  : self.response[i],
+            "turnaround": self.turnaround[i],
+            "waiting"   : self.waiting[i],
+        }
+
+    def __repr__(self):
+        return (f"ScheduleResult({len(self.workload)} processes, "
+                f"avg_waiting={self.avg_waiting:.2f}, avg_turnaround={self.avg_turnaround:.2f})")
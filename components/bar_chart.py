@@ -12,7 +12,8 @@ class BarChart:
         height,
         bar_colors=((254, 90, 90), (90, 180, 254)),
         marker_count=0,
-        zoomed=False
+        zoomed=False,
+        zoom_count=3
     ):
         """
         labels       – list of algorithm names
@@ -23,7 +24,8 @@ class BarChart:
         height       – bar area height (excluding space for labels)
         bar_colors   – tuple of two RGB tuples: (waiting_color, turnaround_color)
         marker_count – number of Y-axis grid lines (0 = none)
-        zoomed       – if True, scale bars by the max of the first three algos only
+        zoomed       – if True, scale bars by the max of the first `zoom_count` algos only
+        zoom_count   – how many leading algorithms the zoomed scale covers
         """
         self.labels       = labels
         self.wait_times   = wait_times
@@ -35,6 +37,7 @@ class BarChart:
         self.wait_col, self.turn_col = bar_colors
         self.marker_count = marker_count
         self.zoomed       = zoomed
+        self.zoom_count   = zoom_count
 
         # space below bars for algorithm labels
         self._label_space  = 30
@@ -81,10 +84,10 @@ class BarChart:
                 max(self.turn_times, default=0),
                 1
             )
-            # compute zoomed max over first 3 algos
+            # compute zoomed max over the first zoom_count algos
             subset_max = max(
-                max(self.wait_times[:3], default=0),
-                max(self.turn_times[:3], default=0),
+                max(self.wait_times[:self.zoom_count], default=0),
+                max(self.turn_times[:self.zoom_count], default=0),
                 1
             )
             max_val = subset_max if self.zoomed else global_max
@@ -119,8 +122,8 @@ class BarChart:
             1
         )
         subset_max = max(
-            max(self.wait_times[:3], default=0),
-            max(self.turn_times[:3], default=0),
+            max(self.wait_times[:self.zoom_count], default=0),
+            max(self.turn_times[:self.zoom_count], default=0),
             1
         )
         max_val = subset_max if self.zoomed else global_max
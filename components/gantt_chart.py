@@ -1,13 +1,19 @@
 import pygame
+from algorithms.interval_index import index_for
+from algorithms.metrics import OVERHEAD, _is_idle
+
+OVERHEAD_COLOR = (60,60,60)
 
 class GanttChart:
-    def __init__(self, x, y, width, height, timeline, process_colors, marker_count=6):
+    def __init__(self, x, y, width, height, timeline, process_colors, marker_count=6, lanes=None, metrics=None):
         """
         x, y             — top‐left of the chart area
         width, height    — dimensions of the bar area (not including labels)
         timeline         — list of (pid, start_time, end_time)
         process_colors   — dict mapping pid → (r,g,b)
         marker_count     — number of intervals on the time axis
+        lanes            — optional per-core timelines; each gets its own row
+        metrics          — optional Metrics; shown in the hover tooltip
         """
         self.x              = x
         self.y              = y
@@ -16,6 +22,8 @@ class GanttChart:
         self.timeline       = timeline
         self.process_colors = process_colors
         self.marker_count   = marker_count
+        self.lanes          = lanes
+        self.metrics        = metrics
         # reserve extra space below bars for labels
         self._label_space   = 20  
 
@@ -24,9 +32,7 @@ class GanttChart:
             return
 
         # Compute time range
-        start = min(seg[1] for seg in self.timeline)
-        end   = max(seg[2] for seg in self.timeline)
-        total = max(end - start, 1)
+        start, total = self._span()
 
         # Draw x-axis
         axis_y = self.y + self.height
@@ -34,20 +40,32 @@ class GanttChart:
                          (self.x, axis_y),
                          (self.x + self.width, axis_y), 2)
 
-        # Draw bars
-        for pid, s, e in self.timeline:
-            norm_s = (s - start) / total
-            norm_e = (e - start) / total
-            px     = self.x + norm_s * self.width
-            pw     = (norm_e - norm_s) * self.width
-            rect   = pygame.Rect(px, self.y, pw, self.height)
-            color  = self.process_colors.get(pid, (100,180,100))
-            pygame.draw.rect(screen, color, rect)
-            pygame.draw.line(screen, (0,0,0),
-                             (px + pw, self.y),
-                             (px + pw, self.y + self.height), 2)
-            lbl = font.load().render(f"P{pid}", True, (255,255,255))
-            screen.blit(lbl, rect.move(5,5))
+        # Draw bars, one row per lane (a single row for uniprocessor timelines)
+        lanes  = self.lanes or [self.timeline]
+        lane_h = self.height / len(lanes)
+        for row, lane in enumerate(lanes):
+            top = self.y + row * lane_h
+            for pid, s, e in lane:
+                norm_s = (s - start) / total
+                norm_e = (e - start) / total
+                px     = self.x + norm_s * self.width
+                pw     = (norm_e - norm_s) * self.width
+                rect   = pygame.Rect(px, top, pw, lane_h)
+                if pid == OVERHEAD:
+                    # scheduling overhead: a thin unlabelled dark bar
+                    pygame.draw.rect(screen, OVERHEAD_COLOR, rect)
+                    continue
+                color  = self.process_colors.get(pid, (100,180,100))
+                pygame.draw.rect(screen, color, rect)
+                pygame.draw.line(screen, (0,0,0),
+                                 (px + pw, top),
+                                 (px + pw, top + lane_h), 2)
+                lbl = font.load().render(f"P{pid}", True, (255,255,255))
+                screen.blit(lbl, rect.move(5,5))
+            if self.lanes:
+                core_lbl = font.load().render(f"CPU{row}", True, (0,0,0))
+                screen.blit(core_lbl, (self.x - core_lbl.get_width() - 5,
+                                       top + (lane_h - core_lbl.get_height()) / 2))
 
         # Draw time markers and labels
         for i in range(self.marker_count + 1):
@@ -61,6 +79,50 @@ class GanttChart:
             txt = font.load().render(f"{t:.1f}", True, (0,0,0))
             screen.blit(txt, (mx - txt.get_width()/2, axis_y + 5))
 
+    def _span(self):
+        """(start, length) of the time axis, from the timeline's cached index."""
+        index = index_for(self.timeline)
+        if index.start is None:  # only empty segments
+            return 0, 1
+        return index.start, max(index.end - index.start, 1)
+
+    def segment_at(self, pos):
+        """(pid, start, end) under screen position `pos`, or None (also over idle time)."""
+        mx, my = pos
+        if not (self.x <= mx < self.x + self.width and self.y <= my < self.y + self.height):
+            return None
+        start, total = self._span()
+        lanes = self.lanes or [self.timeline]
+        row   = min(int((my - self.y) / (self.height / len(lanes))), len(lanes) - 1)
+        t     = start + (mx - self.x) / self.width * total
+        hits  = [seg for seg in index_for(lanes[row]).at(t) if not _is_idle(seg[0])]
+        return hits[0] if hits else None
+
+    def draw_hover(self, screen, font, pos):
+        """Tooltip for the segment under `pos`; call after everything else is drawn."""
+        seg = self.segment_at(pos)
+        if seg is None:
+            return
+        pid, s, e = seg
+        lines = ["overhead" if pid == OVERHEAD else f"P{pid}", f"[{s:g}, {e:g})"]
+        m = self.metrics.per_process.get(pid) if self.metrics else None
+        if m is not None and m.completion is not None:
+            lines.append(f"response {m.response:g}  waiting {m.waiting:g}")
+            lines.append(f"turnaround {m.turnaround:g}")
+
+        surfs = [font.load().render(line, True, (255,255,255)) for line in lines]
+        pad   = 6
+        w     = max(sf.get_width() for sf in surfs) + 2 * pad
+        h     = sum(sf.get_height() for sf in surfs) + 2 * pad
+        # keep the box on screen
+        bx = min(pos[0] + 12, screen.get_width() - w)
+        by = min(pos[1] + 12, screen.get_height() - h)
+        pygame.draw.rect(screen, (40,40,40), (bx, by, w, h), border_radius=4)
+        ty = by + pad
+        for sf in surfs:
+            screen.blit(sf, (bx + pad, ty))
+            ty += sf.get_height()
+
     def get_width(self):
         """Total width of the chart area."""
         return self.width
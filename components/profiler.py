@@ -0,0 +1,225 @@
+"""
+Frame-time profiler overlay for the pygame UI.
+
+F3 toggles the overlay: FPS, frame-time percentiles, a rolling frame-time
+graph and the time spent per phase (event handling, each component's
+draw, display.flip, ...). F4 dumps the recorded frames to CSV.
+
+The timing hooks are installed only while the overlay is on, by wrapping
+the hooked methods, and removed again when it is turned off, so the
+UI runs its plain methods the rest of the time.
+
+    profiler = FrameProfiler(font, hooks=[(app, "handle_events", "events"),
+                                          (Table, "draw", "Table.draw")],
+                             present=(app, "present"))
+
+Phase times are inclusive: a component that loads fonts counts that time
+in its own phase and in "Font.load".
+"""
+import csv
+import functools
+import time
+from collections import deque
+
+import pygame
+
+GRAPH_FRAMES = 120      # frames shown in the graph, percentiles and phase averages
+HISTORY      = 36_000   # frames kept for the CSV dump (20 minutes at 30 FPS)
+_MISSING     = object()
+
+
+class FrameProfiler:
+    def __init__(self, font, hooks, present, target_fps=30, history=HISTORY):
+        """
+        font       – ui.fonts.Font used for the overlay text
+        hooks      – list of (owner, attribute, label): a class or instance
+                     and the name of the method to time under `label`
+        present    – (owner, attribute) of the method that flips the display;
+                     it ends a frame, and the overlay is drawn right before it
+        target_fps – frame rate the UI aims for; drawn as a line on the graph
+        history    – frames kept for dump_csv
+        """
+        self.font       = font
+        self.hooks      = hooks
+        self.present    = present
+        self.target_fps = target_fps
+        self.labels     = [label for _, _, label in hooks] + ["flip", "overlay"]
+        self.frames     = deque(maxlen=history)   # (time, frame_ms, {label: ms})
+        self.enabled    = False
+        self.message    = None
+        self._current   = {}
+        self._saved     = []
+        self._last      = None
+        self._text      = None
+
+    # ─── toggling ───────────────────────────────────────────────────────────
+    def handle_event(self, event):
+        """F3 toggles the overlay, F4 dumps the frames; True if the key was used."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == pygame.K_F3:
+            self.toggle()
+            return True
+        if event.key == pygame.K_F4 and self.enabled:
+            path = time.strftime("frame_profile_%Y%m%d-%H%M%S.csv")
+            self.dump_csv(path)
+            self.message = f"saved {len(self.frames)} frames to {path}"
+            return True
+        return False
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def enable(self):
+        if self.enabled:
+            return
+        if self._text is None:
+            self._text = self.font.load()
+        self.frames.clear()
+        self._current.clear()
+        self._last   = None
+        self.message = None
+        for owner, name, label in self.hooks:
+            self._patch(owner, name, self._timed(getattr(owner, name), label))
+        owner, name = self.present
+        self._patch(owner, name, self._presenter(getattr(owner, name)))
+        self.enabled = True
+
+    def disable(self):
+        # restore in reverse, in case one attribute was hooked twice
+        for owner, name, original in reversed(self._saved):
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._saved.clear()
+        self.enabled = False
+
+    def _patch(self, owner, name, wrapper):
+        # instance hooks shadow the class method; class hooks replace it
+        self._saved.append((owner, name, vars(owner).get(name, _MISSING)))
+        setattr(owner, name, wrapper)
+
+    # ─── timing ─────────────────────────────────────────────────────────────
+    def _timed(self, fn, label):
+        current = self._current
+        clock   = time.perf_counter
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            t = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                current[label] = current.get(label, 0.0) + clock() - t
+        return timed
+
+    def _presenter(self, flip):
+        clock = time.perf_counter
+
+        @functools.wraps(flip)
+        def present(*args, **kwargs):
+            t = clock()
+            self.draw(pygame.display.get_surface())
+            t_flip = clock()
+            try:
+                return flip(*args, **kwargs)
+            finally:
+                now = clock()
+                self._current["overlay"] = t_flip - t
+                self._current["flip"]    = now - t_flip
+                self._end_frame(now)
+        return present
+
+    def _end_frame(self, now):
+        # the frame time is the wall time between two flips, including the
+        # frame-rate cap, so a stutter shows up exactly as the user sees it
+        if self._last is not None:
+            phases = {label: ms * 1000 for label, ms in self._current.items()}
+            self.frames.append((now, (now - self._last) * 1000, phases))
+        self._last = now
+        self._current.clear()
+
+    # ─── statistics ─────────────────────────────────────────────────────────
+    def recent(self, n=GRAPH_FRAMES):
+        """The last `n` recorded frames."""
+        start = max(len(self.frames) - n, 0)
+        return [self.frames[i] for i in range(start, len(self.frames))]
+
+    def percentiles(self, qs=(50, 95, 99), n=GRAPH_FRAMES):
+        """Frame-time percentiles (ms) over the last `n` frames, nearest rank."""
+        times = sorted(ms for _, ms, _ in self.recent(n))
+        if not times:
+            return {q: 0.0 for q in qs}
+        return {q: times[min(int(q / 100 * len(times)), len(times) - 1)] for q in qs}
+
+    def fps(self, n=GRAPH_FRAMES):
+        frames = self.recent(n)
+        total  = sum(ms for _, ms, _ in frames)
+        return len(frames) * 1000 / total if total else 0.0
+
+    def phase_means(self, n=GRAPH_FRAMES):
+        """Mean ms per frame of every phase over the last `n` frames, largest first."""
+        frames = self.recent(n)
+        sums   = dict.fromkeys(self.labels, 0.0)
+        for _, _, phases in frames:
+            for label, ms in phases.items():
+                sums[label] = sums.get(label, 0.0) + ms
+        means = [(label, total / (len(frames) or 1)) for label, total in sums.items()]
+        return sorted(means, key=lambda item: -item[1])
+
+    def dump_csv(self, path):
+        """Write one row per recorded frame: time, frame_ms and ms per phase."""
+        t0 = self.frames[0][0] if self.frames else 0.0
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "time_s", "frame_ms"] + [f"{label}_ms" for label in self.labels])
+            for i, (t, ms, phases) in enumerate(self.frames):
+                writer.writerow([i, f"{t - t0:.6f}", f"{ms:.3f}"]
+                                + [f"{phases.get(label, 0.0):.3f}" for label in self.labels])
+
+    # ─── overlay ────────────────────────────────────────────────────────────
+    def draw(self, screen, width=300, graph_h=60, pad=8):
+        p      = self.percentiles()
+        header = f"FPS {self.fps():5.1f}   frame p50 {p[50]:.1f}  p95 {p[95]:.1f}  p99 {p[99]:.1f} ms"
+        # phases that did not run on this screen are left out
+        rows   = [(label, f"{ms:.2f} ms") for label, ms in self.phase_means() if ms > 0]
+        render = lambda text: self._text.render(text, True, (255,255,255))
+        lines  = [render(header)] + ([render(self.message)] if self.message else [])
+        cells  = [(render(label), render(value)) for label, value in rows]
+        line_h = self._text.get_linesize()
+        width  = max([width] + [s.get_width() + 2 * pad for s in lines]
+                     + [l.get_width() + v.get_width() + 4 * pad for l, v in cells])
+        height = 3 * pad + graph_h + line_h * (len(lines) + len(cells))
+        x, y   = screen.get_width() - width - pad, pad
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((20,20,20,200))
+        screen.blit(panel, (x, y))
+
+        # rolling frame-time graph, scaled so the frame budget sits at half height
+        budget = 1000 / self.target_fps
+        scale  = graph_h / (2 * budget)
+        gx, gy = x + pad, y + pad
+        gw     = width - 2 * pad
+        bar_w  = gw / GRAPH_FRAMES
+        for i, (_, ms, _) in enumerate(self.recent()):
+            h     = min(ms * scale, graph_h)
+            color = (90,200,90) if ms <= budget * 1.1 else (230,80,80)
+            pygame.draw.rect(screen, color, (gx + i * bar_w, gy + graph_h - h, max(bar_w - 1, 1), h))
+        budget_y = gy + graph_h - budget * scale
+        pygame.draw.line(screen, (255,255,255), (gx, budget_y), (gx + gw, budget_y))
+
+        ty = gy + graph_h + pad
+        screen.blit(lines[0], (x + pad, ty))
+        ty += line_h
+        for label, value in cells:
+            screen.blit(label, (x + pad, ty))
+            screen.blit(value, (x + width - pad - value.get_width(), ty))
+            ty += line_h
+        for s in lines[1:]:
+            screen.blit(s, (x + pad, ty))
+            ty += line_h
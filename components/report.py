@@ -0,0 +1,323 @@
+"""
+Headless batch rendering of PNG scheduling reports.
+
+Every scenario is scheduled and drawn with the same components as the
+interactive app (GanttChart, Table, BarChart, Container) onto an offscreen
+pygame.Surface, under the SDL dummy video driver, so no display is needed.
+Scenarios are spread over a pool of worker processes; each worker sets up
+pygame and loads its fonts once.
+
+A scenario is a request as the scheduling service takes it, plus a name
+and the algorithms to compare in the bar chart:
+
+    {"name": "rr-small", "algorithm": "RR", "params": {"time_quantum": 2},
+     "processes": [{"pid": 1, "arrival": 0, "burst": 5}, ...],
+     "compare": ["FCFS", "SJN", "RR"]}
+
+    python -m components.report scenarios.jsonl --out reports/
+    python -m components.report --random 500 --out reports/     # synthetic sweep
+
+The output directory gets one PNG per scenario plus index.json (one entry
+per scenario: image, summary metrics or the error) and index.html.
+"""
+import html
+import json
+import os
+import re
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+from algorithms import registry
+from components.bar_chart import BarChart
+from components.container import Container
+from components.gantt_chart import GanttChart
+from components.table import Table
+from ui.fonts import Font
+
+# bar chart algorithms when a scenario does not name its own; the ones a
+# workload does not fit (RM/DF without periods) are left out
+COMPARE = ("FCFS", "SJN", "RR", "MLFQ", "RM", "DF")
+# their parameters unless the scenario's own algorithm is compared
+COMPARE_PARAMS = {"RR": {"time_quantum": 2}}
+
+_worker = None
+
+
+class _FontCache:
+    """Font whose load() is memoized: the components call it for every label."""
+    def __init__(self, font):
+        self.font    = font
+        self._loaded = {}
+
+    def load(self, size="sm", type="Regular"):
+        key = (size, type)
+        if key not in self._loaded:
+            self._loaded[key] = self.font.load(size=size, type=type)
+        return self._loaded[key]
+
+
+def _init_worker(width, max_rows, out_dir):
+    global _worker
+    if not pygame.display.get_init():
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.init()
+    pygame.font.init()
+    _worker = {
+        "font"    : _FontCache(Font(path="Inter")),
+        "width"   : width,
+        "max_rows": max_rows,
+        "out_dir" : out_dir,
+    }
+
+
+def _slug(name):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", str(name)).strip("-")[:60] or "scenario"
+
+
+def _colors(pids):
+    """Stable colour per pid, independent of the worker and of hash seeds."""
+    colors = {}
+    for pid in pids:
+        h = zlib.crc32(str(pid).encode())
+        colors[pid] = (50 + (h & 0xFF) % 150, 50 + (h >> 8 & 0xFF) % 150, 50 + (h >> 16) % 150)
+    return colors
+
+
+def _compare(scenario, processes):
+    """(labels, avg waiting, avg turnaround) for the bar chart."""
+    labels, wait, turn = [], [], []
+    for name in scenario.get("compare") or COMPARE:
+        if name.upper() == scenario["algorithm"].upper():
+            params = scenario.get("params") or {}
+        else:
+            params = COMPARE_PARAMS.get(name.upper(), {})
+        try:
+            sched = registry.run(name, processes, **params)
+        except (ValueError, TypeError):
+            continue
+        labels.append(name)
+        wait.append(sched.average_waiting_time())
+        turn.append(sched.average_turnaround_time())
+    return labels, wait, turn
+
+
+def draw_report(scenario, font, width=900, max_rows=10):
+    """
+    Surface with the report of one scenario: title, Gantt chart, summary,
+    process table (first `max_rows` rows) and comparison bar chart.
+    Returns (surface, scheduler).
+    """
+    processes = [registry.process_from_dict(d) for d in scenario["processes"]]
+    params    = dict(scenario.get("params") or {})
+    if scenario["algorithm"].upper() == "PART":
+        # pool workers cannot start pools of their own
+        params.setdefault("workers", 0)
+    sched     = registry.run(scenario["algorithm"], processes, **params)
+    labels, wait, turn = _compare(scenario, processes)
+
+    margin   = 50
+    chart_w  = width - 2 * margin
+    lanes    = getattr(sched, "core_timelines", None)
+    gantt_h  = 100 if not lanes else 40 * len(lanes)
+    rows     = processes[:max_rows]
+    cols     = ["PID", "Arrival", "Burst"]
+    if any(p.period is not None for p in processes):
+        cols.append("Period")
+    if any(p.deadline is not None for p in processes):
+        cols.append("Deadline")
+
+    # ─── layout ─────────────────────────────────────────────────────────────
+    gantt_y  = 70
+    text_y   = gantt_y + gantt_h + 50
+    table_y  = text_y + 90
+    bars_y   = table_y + 30 * (len(rows) + 1) + (30 if len(rows) < len(processes) else 0) + 60
+    height   = bars_y + 200 + 60 if labels else bars_y
+
+    surface = pygame.Surface((width, height))
+    surface.fill((240,240,240))
+
+    title = f"{scenario.get('name', '')} – {scenario['algorithm'].upper()}".strip(" –")
+    surface.blit(font.load(size="md", type="Black").render(title, True, (0,0,0)), (margin, 15))
+
+    GanttChart(
+        x              = margin,
+        y              = gantt_y,
+        width          = chart_w,
+        height         = gantt_h,
+        timeline       = sched.timeline,
+        process_colors = _colors(p.pid for p in processes),
+        lanes          = lanes,
+        metrics        = sched.metrics,
+    ).draw(surface, font)
+
+    m   = sched.metrics
+    ctr = Container(font, direction="col", spacing=5)
+    ctr.add_text(f"Avg waiting time: {sched.average_waiting_time():.2f}    "
+                 f"Avg turnaround time: {sched.average_turnaround_time():.2f}")
+    if m is not None:
+        ctr.add_text(f"Makespan: {m.makespan:g}    CPU utilization: {m.cpu_utilization:.1%}    "
+                     f"Context switches: {m.context_switches}")
+    ctr.draw(surface, margin, text_y)
+
+    Table(width, height, font).draw(
+        screen    = surface,
+        x         = margin,
+        y         = table_y,
+        cols      = cols,
+        processes = rows,
+        spacing   = 30,
+        truncate  = None,
+    )
+    if len(rows) < len(processes):
+        more = font.load().render(f"… {len(processes) - len(rows)} more processes", True, (0,0,0))
+        surface.blit(more, (margin, table_y + 30 * (len(rows) + 1) + 5))
+
+    if labels:
+        BarChart(
+            labels       = labels,
+            wait_times   = wait,
+            turn_times   = turn,
+            x            = margin,
+            y            = bars_y,
+            width        = chart_w,
+            height       = 200,
+            marker_count = 5,
+        ).draw(surface, font)
+    return surface, sched
+
+
+def _render(job):
+    """Worker entry point: render scenario `i` to a PNG; returns its index entry."""
+    i, scenario = job
+    name  = scenario.get("name", f"scenario-{i}")
+    entry = {"name": name, "algorithm": scenario.get("algorithm"), "params": scenario.get("params") or {}}
+    t = time.perf_counter()
+    try:
+        surface, sched = draw_report(scenario, _worker["font"], _worker["width"], _worker["max_rows"])
+        image = f"{i:05d}-{_slug(name)}.png"
+        pygame.image.save(surface, os.path.join(_worker["out_dir"], image))
+        m = sched.metrics
+        entry.update({
+            "ok"       : True,
+            "image"    : image,
+            "processes": len(scenario["processes"]),
+            "metrics"  : {k: getattr(m, k) for k in m.SUMMARY} if m is not None else None,
+        })
+    except Exception as e:
+        entry.update({"ok": False, "error": f"{type(e).__name__}: {e}"})
+    entry["render_ms"] = (time.perf_counter() - t) * 1000
+    return entry
+
+
+def _write_index(out_dir, entries):
+    with open(os.path.join(out_dir, "index.json"), "w") as f:
+        json.dump(entries, f, indent=1, default=repr)
+
+    rows = []
+    for e in entries:
+        name = html.escape(str(e["name"]))
+        algo = html.escape(str(e["algorithm"]))
+        if e["ok"]:
+            m    = e["metrics"] or {}
+            cell = f'<a href="{e["image"]}"><img src="{e["image"]}" width="300"></a>'
+            info = (f'{m.get("avg_waiting", 0):.2f}</td><td>{m.get("avg_turnaround", 0):.2f}'
+                    f'</td><td>{e["processes"]}')
+        else:
+            cell = html.escape(e["error"])
+            info = "</td><td></td><td>"
+        rows.append(f"<tr><td>{name}</td><td>{algo}</td><td>{info}</td><td>{cell}</td></tr>")
+    with open(os.path.join(out_dir, "index.html"), "w") as f:
+        f.write("<!doctype html>\n<meta charset=\"utf-8\">\n<title>Scheduling reports</title>\n"
+                "<table border=\"1\" cellpadding=\"4\">\n"
+                "<tr><th>Scenario</th><th>Algorithm</th><th>Avg waiting</th>"
+                "<th>Avg turnaround</th><th>Processes</th><th>Report</th></tr>\n")
+        f.write("\n".join(rows))
+        f.write("\n</table>\n")
+
+
+def render_reports(scenarios, out_dir, workers=None, width=900, max_rows=10):
+    """
+    Render every scenario to `out_dir` and write the index files.
+
+    workers  – worker processes (None → CPU count, 0 → render in this process)
+    width    – image width in pixels; the height follows the content
+    max_rows – process table rows shown per report
+
+    Returns the index entries, in scenario order. A scenario that fails to
+    schedule or draw gets an entry with "ok": false and the error.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = list(enumerate(scenarios))
+    init = (width, max_rows, out_dir)
+    if workers == 0 or len(jobs) <= 1:
+        _init_worker(*init)
+        entries = [_render(job) for job in jobs]
+    else:
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init) as pool:
+            entries = list(pool.map(_render, jobs, chunksize=max(1, len(jobs) // (workers * 8))))
+    _write_index(out_dir, entries)
+    return entries
+
+
+def random_scenarios(n, seed=0, processes=(3, 8)):
+    """`n` synthetic scenarios cycling through the UI's algorithms and process counts, seeded."""
+    import random
+
+    from algorithms.utils import generate_random_processes
+
+    algorithms = ("FCFS", "SJN", "RR", "RM", "DF")
+    rng_state  = random.getstate()
+    try:
+        out = []
+        for i in range(n):
+            random.seed(seed * 1_000_003 + i)
+            algo  = algorithms[i % len(algorithms)]
+            procs = generate_random_processes(random.randint(*processes),
+                                              include_period=algo in ("RM", "DF"),
+                                              include_deadline=algo == "DF")
+            out.append({
+                "name"     : f"random-{i}",
+                "algorithm": algo,
+                "params"   : {"time_quantum": 2} if algo == "RR" else {},
+                "processes": [registry.process_to_dict(p) for p in procs],
+            })
+        return out
+    finally:
+        random.setstate(rng_state)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Render PNG scheduling reports without a display")
+    parser.add_argument("scenarios", nargs="?", help="JSON lines file, one scenario per line")
+    parser.add_argument("--out", default="reports")
+    parser.add_argument("--random", type=int, metavar="N", help="render N synthetic scenarios instead")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (0: none)")
+    parser.add_argument("--width", type=int, default=900)
+    parser.add_argument("--max-rows", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.random is not None:
+        scenarios = random_scenarios(args.random, args.seed)
+    elif args.scenarios:
+        with open(args.scenarios) as f:
+            scenarios = [json.loads(line) for line in f if line.strip()]
+    else:
+        parser.error("give a scenarios file or --random N")
+
+    t = time.perf_counter()
+    entries = render_reports(scenarios, args.out, args.workers, args.width, args.max_rows)
+    elapsed = time.perf_counter() - t
+    failed  = sum(not e["ok"] for e in entries)
+    print(f"{len(entries)} reports in {elapsed:.1f}s ({len(entries) / elapsed * 60:.0f}/min), "
+          f"{failed} failed → {os.path.join(args.out, 'index.html')}")
+
+
+if __name__ == "__main__":
+    main()
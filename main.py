@@ -2,20 +2,27 @@ import pygame
 import sys
 
 from algorithms.process import Process
+from algorithms.workload import Workload
 from algorithms.fcfs import FCFS_Scheduler
 from algorithms.sjns import ShortestJobNextScheduler
 from algorithms.rrs import RoundRobinScheduler
 from algorithms.rms import RateMonotonicScheduler
 from algorithms.dfs import DeadlineFirstScheduler
+from algorithms.mlfq import MultilevelFeedbackQueueScheduler
+from algorithms.multiprocessor import GlobalDeadlineFirstScheduler
+from algorithms.cache import ResultCache
+from algorithms.quantum import sweep_quanta
+from algorithms.planner import Budget, plan
 from algorithms.utils import *
 
 from components.bar_chart import BarChart
-from components.gantt_chart import GanttChart
+from components.gantt_chart import GanttChart, OVERHEAD, OVERHEAD_COLOR
 from ui.fonts import Font
 from ui.cards import Card
 
 from components.table import Table
 from components.container import Container
+from components.profiler import FrameProfiler
 
 class TextInputBox:
     def __init__(self, x, y, w, h, text=''):
@@ -95,6 +102,9 @@ class SchedulerApp:
         self.scheduler = None
         self.processes = []
 
+        # Schedule results persist across frames and sessions
+        self.result_cache = ResultCache()
+
         # For custom input using separate boxes.
         self.custom_inputs = []  # list of (arrival, burst, deadline)
         self.arrival_box = TextInputBox(50, 150, 100, 32)
@@ -135,6 +145,10 @@ class SchedulerApp:
             ("Deadline First",
             "Earliest deadline wins\n\npreemptive\nhard real-time\ndynamic priority",
             (3,217,254)),
+
+            ("Multicore EDF",
+            "Global EDF on 2 cores\n\npreemptive\nhard real-time\nmigrating jobs",
+            (160,230,180)),
         ]
         self.card_w, self.card_h   = 240, 260
         padding_x, padding_y = 30, 20
@@ -143,11 +157,9 @@ class SchedulerApp:
         self.algo_buttons = []
         for idx, (title, desc, color) in enumerate(titles):
             # row 0: idx 0,1,2 → cols 0,1,2
-            # row 1: idx 3,4   → cols 0,1
+            # row 1: idx 3,4,5 → cols 0,1,2
             row = idx // 3
             col = idx % 3
-            # on row 1 we only want 2 columns, but since idx runs 3→row1,col0 and 4→row1,col1,
-            # the mod logic works out.
             x = start_x + col * (self.card_w + padding_x)
             y = start_y + row * (self.card_h + padding_y)
             self.algo_buttons.append(
@@ -169,6 +181,7 @@ class SchedulerApp:
             "Round Robin": "RR",
             "Rate Monotonic": "RM",
             "Deadline First": "DF",
+            "Multicore EDF": "GEDF",
         }
 
         # Mode toggle buttons.
@@ -191,46 +204,91 @@ class SchedulerApp:
             "rect": pygame.Rect(self.width-80-self.margin_x, 50, 80, 30)
         }
 
-        self.max_hyperperiod    = 100
+        # Round Robin time quantum, adjustable on the RR simulation screen
+        self.time_quantum  = 2
+        self.quantum_range = (1, 20)
+        self.quantum_buttons = [
+            {"label": "-",    "step": -1,   "rect": pygame.Rect(200, 60, 30, 30)},
+            {"label": "+",    "step": +1,   "rect": pygame.Rect(240, 60, 30, 30)},
+            {"label": "Best", "step": None, "rect": pygame.Rect(280, 60, 70, 30)},
+        ]
+
+        # Limits for one simulation run; the planner picks an engine that fits,
+        # or the run is turned down with an explanation. max_segments keeps the
+        # Gantt chart readable.
+        self.run_budget         = Budget(max_seconds=2.0, max_bytes=256 * 2**20, max_segments=5000)
+        self.run_plan           = None
+        self.run_analysis       = None   # analyze() result when the plan is "analyze"
         self.hyper_auto_btn     = {"label":"Auto Fix","rect":pygame.Rect(self.width-50-120, self.height-50-40, 120,40)}
         self.hyper_manual_btn   = {"label":"Manual","rect":pygame.Rect(self.width-50-120-10-120, self.height-50-40, 120,40)}
+
+        # Frame-time overlay (F3); its timing hooks only exist while it is shown
+        self.profiler = FrameProfiler(
+            self.font,
+            hooks=[
+                (self, "handle_events", "events"),
+                (self, "draw_state", "draw (all)"),
+                (ResultCache, "run", "scheduling"),
+                (Table, "draw", "Table.draw"),
+                (GanttChart, "draw", "GanttChart.draw"),
+                (GanttChart, "draw_hover", "GanttChart.draw_hover"),
+                (BarChart, "draw", "BarChart.draw"),
+                (Container, "draw", "Container.draw"),
+                (Card, "draw", "Card.draw"),
+                (TextInputBox, "draw", "TextInputBox.draw"),
+                (Font, "load", "Font.load"),
+            ],
+            present=(self, "present"),
+        )
  
 
     def run(self):
         running = True
         while running:
             self.screen.fill((240,240,240))
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    running = False
-                if self.state == "menu":
-                    self.handle_menu_event(event)
-                elif self.state == "input":
-                    self.handle_input_event(event)
-                elif self.state in ("simulation", "replay"):
-                    self.handle_simulation_event(event)
-                elif self.state == "compare":
-                    self.handle_comparison_event(event)  
-                elif self.state == "hyper_warning":
-                    self.handle_hyper_warning_event(event)
+            running = self.handle_events(pygame.event.get())
+            self.draw_state()
+            self.present()
+            self.clock.tick(30)
+        pygame.quit()
+        sys.exit()
+
+    def handle_events(self, events):
+        """Dispatch `events` to the current screen; False once the window is closed."""
+        running = True
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            if self.profiler.handle_event(event):
+                continue
             if self.state == "menu":
-                self.draw_menu()
+                self.handle_menu_event(event)
             elif self.state == "input":
-                self.draw_input_screen()
-            elif self.state == "simulation":
-                self.draw_simulation()
+                self.handle_input_event(event)
+            elif self.state in ("simulation", "replay"):
+                self.handle_simulation_event(event)
             elif self.state == "compare":
-                self.draw_comparison()
+                self.handle_comparison_event(event)  
             elif self.state == "hyper_warning":
-                self.draw_hyper_warning()
-            elif self.state == "replay":
-                self.draw_replay()
-
-            pygame.display.flip()
-            self.clock.tick(30)
-        pygame.quit()
-        sys.exit()
+                self.handle_hyper_warning_event(event)
+        return running
+
+    def draw_state(self):
+        if self.state == "menu":
+            self.draw_menu()
+        elif self.state == "input":
+            self.draw_input_screen()
+        elif self.state == "simulation":
+            self.draw_simulation()
+        elif self.state == "compare":
+            self.draw_comparison()
+        elif self.state == "hyper_warning":
+            self.draw_hyper_warning()
+        elif self.state == "replay":
+            self.draw_replay()
+
+    def present(self):
+        pygame.display.flip()
 
     def handle_comparison_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -269,8 +327,12 @@ class SchedulerApp:
                             include_deadline=True
                         )
                         self.initialize_scheduler()
-                        self.scheduler.schedule()
-                        self.state = "simulation"
+                        if self.scheduler is None:
+                            self.n_custom = len(self.processes)
+                            self.state = "hyper_warning"
+                        else:
+                            self.result_cache.run(self.scheduler)
+                            self.state = "simulation"
                     else:
                         # custom‐input branch
                         self.custom_inputs = []
@@ -305,9 +367,9 @@ class SchedulerApp:
         # Forward events to our text‐boxes
         self.arrival_box.handle_event(event)
         self.burst_box.handle_event(event)
-        if self.selected_algo in ("RM", "DF"):
+        if self.selected_algo in ("RM", "DF", "GEDF"):
             self.period_box.handle_event(event)
-        if self.selected_algo == "DF":
+        if self.selected_algo in ("DF", "GEDF"):
             self.deadline_box.handle_event(event)
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -360,23 +422,6 @@ class SchedulerApp:
 
             # — Start Simulation —
             elif self.start_sim_button["rect"].collidepoint(pos):
-                if self.selected_algo in ("RM","DF"):
-                    # gather all periods
-                    periods = [pr for (_,_,pr,_) in self.custom_inputs]
-                    # simple lcm over list
-                    from math import gcd
-                    def lcm(a,b): return a*b//gcd(a,b)
-                    H = 1
-                    for p in periods:
-                        H = lcm(H, p)
-                    if H > self.max_hyperperiod:
-                        # store for the popup
-                        self.bad_hyper = H
-                        self.n_custom = len(self.custom_inputs)
-                        self.state = "hyper_warning"
-                        return
-
-            # otherwise fall through to original simulation start
                 self.processes = []
                 pid = 1
                 for a, b, pr, dl in self.custom_inputs:
@@ -395,7 +440,12 @@ class SchedulerApp:
                     return
 
                 self.initialize_scheduler()
-                self.scheduler.schedule()
+                if self.scheduler is None:
+                    # over budget: explain the plan in a popup
+                    self.n_custom = len(self.custom_inputs)
+                    self.state = "hyper_warning"
+                    return
+                self.result_cache.run(self.scheduler)
                 self.state = "simulation"
 
             # — Back to Menu —
@@ -416,6 +466,13 @@ class SchedulerApp:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             pos = event.pos
 
+            # Time quantum controls (RR only)
+            if self.state == "simulation" and self.selected_algo == "RR":
+                for btn in self.quantum_buttons:
+                    if btn["rect"].collidepoint(pos):
+                        self.set_time_quantum(btn["step"])
+                        return
+
             # Replay button
             if self.replay_button["rect"].collidepoint(pos):
                 self.state = "replay"
@@ -466,27 +523,22 @@ class SchedulerApp:
         table_h = self.table.get_height()
 
         # ─── Compute metrics ──────────────────────────────────────────────────────
-        labels = ["FCFS","SJN","RR","RM","DF"]
+        labels = ["FCFS","SJN","RR","MLFQ","RM","DF"]
         ctors  = [
             FCFS_Scheduler,
             ShortestJobNextScheduler,
-            lambda: RoundRobinScheduler(time_quantum=2),
+            lambda: RoundRobinScheduler(time_quantum=self.time_quantum),
+            MultilevelFeedbackQueueScheduler,
             RateMonotonicScheduler,
             DeadlineFirstScheduler
         ]
+        # schedulers only read the workload, so all of them share it
+        workload   = Workload(self.processes)
         wait_times = []
         turn_times = []
         for ctor in ctors:
-            sched = ctor()
-            for p in self.processes:
-                sched.add_process(Process(
-                    pid          = p.pid,
-                    arrival_time = p.arrival_time,
-                    burst_time   = p.burst_time,
-                    period       = getattr(p, "period", None),
-                    deadline     = getattr(p, "deadline", None)
-                ))
-            sched.schedule()
+            sched = ctor().load(workload)
+            self.result_cache.run(sched)
             wait_times.append(sched.average_waiting_time())
             turn_times.append(sched.average_turnaround_time())
 
@@ -496,6 +548,7 @@ class SchedulerApp:
             turn_times[ labels.index("FCFS") ],
             turn_times[ labels.index("SJN") ],
             turn_times[ labels.index("RR") ],
+            turn_times[ labels.index("MLFQ") ],
             1
         )
 
@@ -515,7 +568,8 @@ class SchedulerApp:
             height      = chart_h,
             bar_colors  = ((254,90,90),(90,180,254)),
             marker_count= 5,
-           zoomed      = self.comparison_zoomed
+            zoomed      = self.comparison_zoomed,
+            zoom_count  = labels.index("RM")
         )
         bc.draw(self.screen, self.font)
 
@@ -590,14 +644,14 @@ class SchedulerApp:
         self.screen.blit(lbl, (200,120))
         self.burst_box.draw(self.screen, placeholder=burst_ph)
 
-        # ─── Period box (RM & DF) ─────────────────────────────────────────────────────
-        if self.selected_algo in ("RM", "DF"):
+        # ─── Period box (RM, DF & GEDF) ───────────────────────────────────────────────
+        if self.selected_algo in ("RM", "DF", "GEDF"):
             lbl = self.font.load().render("Period:", True, (0,0,0))
             self.screen.blit(lbl, (350,120))
             self.period_box.draw(self.screen, placeholder=period_ph)
 
-        # ─── Deadline box (DF only) ───────────────────────────────────────────────────
-        if self.selected_algo == "DF":
+        # ─── Deadline box (DF & GEDF) ─────────────────────────────────────────────────
+        if self.selected_algo in ("DF", "GEDF"):
             lbl = self.font.load().render("Deadline:", True, (0,0,0))
             self.screen.blit(lbl, (500,120))
             # reposition the input box to sit under the label
@@ -613,9 +667,9 @@ class SchedulerApp:
         from algorithms.process import Process
         table_x, table_y = 50, 220
         cols = ["#", "Arrival", "Burst"]
-        if self.selected_algo in ("RM", "DF"):
+        if self.selected_algo in ("RM", "DF", "GEDF"):
             cols.append("Period")
-        if self.selected_algo == "DF":
+        if self.selected_algo in ("DF", "GEDF"):
             cols.append("Deadline")
 
         rows = []
@@ -624,8 +678,8 @@ class SchedulerApp:
                 pid=a,                
                 arrival_time=a,
                 burst_time=b,
-                period=pr if self.selected_algo in ("RM","DF") else None,
-                deadline=dl if self.selected_algo=="DF" else None
+                period=pr if self.selected_algo in ("RM","DF","GEDF") else None,
+                deadline=dl if self.selected_algo in ("DF","GEDF") else None
             ))
 
         self.table.draw(
@@ -661,7 +715,7 @@ class SchedulerApp:
         # Determine columns based on selected algorithm
         if self.selected_algo == "RM":
             cols = ["PID", "Arrival", "Burst", "Period"]
-        elif self.selected_algo == "DF":
+        elif self.selected_algo in ("DF", "GEDF"):
             cols = ["PID", "Arrival", "Burst", "Period", "Deadline"]
         else:
             cols = ["PID", "Arrival", "Burst"]
@@ -710,9 +764,14 @@ class SchedulerApp:
             width=chart_width,
             height=chart_height,
             timeline=self.scheduler.timeline,
-            process_colors=self.process_colors
+            process_colors=self.process_colors,
+            lanes=getattr(self.scheduler, "core_timelines", None),
+            metrics=self.scheduler.metrics
         )
         gc.draw(self.screen, self.font)
+
+        if self.selected_algo == "RR":
+            self.draw_quantum_controls()
         
         # Draw processes table and metrics
         self.draw_results(processes=self.processes, chart_height=chart_height, chart_top=chart_top)
@@ -740,6 +799,36 @@ class SchedulerApp:
             self.screen.blit(txt, txt.get_rect(center=btn["rect"].center))
             x += btn["rect"].width + spacing
 
+        # Hover tooltip last, so it stays on top
+        gc.draw_hover(self.screen, self.font, pygame.mouse.get_pos())
+
+    def set_time_quantum(self, step):
+        """Step the RR quantum by `step`, or jump to the sweep's optimum when step is None."""
+        lo, hi = self.quantum_range
+        if step is None:
+            # a handful of processes and quanta: a pool would cost more than it saves
+            sweep = sweep_quanta(self.processes, quanta=range(lo, hi + 1), workers=0)
+            quantum = sweep.best("turnaround")
+        else:
+            quantum = min(max(self.time_quantum + step, lo), hi)
+        if quantum == self.time_quantum:
+            return
+        self.time_quantum = quantum
+        self.initialize_scheduler()
+        if self.scheduler is None:
+            self.n_custom = len(self.processes)
+            self.state = "hyper_warning"
+            return
+        self.result_cache.run(self.scheduler)
+
+    def draw_quantum_controls(self):
+        lbl = self.font.load().render(f"Quantum: {self.time_quantum}", True, (0,0,0))
+        self.screen.blit(lbl, (50, 65))
+        for btn in self.quantum_buttons:
+            pygame.draw.rect(self.screen, (100,100,100), btn["rect"])
+            txt = self.font.load().render(btn["label"], True, (255,255,255))
+            self.screen.blit(txt, txt.get_rect(center=btn["rect"].center))
+
     def draw_replay(self):
         if not self.scheduler or not self.scheduler.timeline:
             return
@@ -809,34 +898,42 @@ class SchedulerApp:
         elapsed  = now - self.replay_start_time
         progress = min(elapsed / self.replay_duration, 1.0)
 
-        for pid, seg_start, seg_end in self.scheduler.timeline:
-            norm_start = (seg_start - start_time) / total_time
-            norm_end   = (seg_end   - start_time) / total_time
-
-            if progress >= norm_start:
-                portion = min(
-                    1.0,
-                    (progress - norm_start) /
-                    ((norm_end - norm_start) if norm_end > norm_start else 1)
-                )
-                x0     = chart_left + norm_start * chart_width
-                full_w = (norm_end - norm_start) * chart_width
-                cur_w  = full_w * portion
-
-                rect = pygame.Rect(x0, chart_top, cur_w, chart_height)
-                color = self.process_colors.get(pid, (100,180,100))
-                pygame.draw.rect(self.screen, color, rect)
-
-                if progress >= norm_end:
-                    pygame.draw.line(
-                        self.screen, (0,0,0),
-                        (x0+full_w, chart_top),
-                        (x0+full_w, chart_top+chart_height),
-                        2
+        # multicore schedulers replay one row per core
+        lanes  = getattr(self.scheduler, "core_timelines", None) or [self.scheduler.timeline]
+        lane_h = chart_height / len(lanes)
+        for row, lane in enumerate(lanes):
+            lane_top = chart_top + row * lane_h
+            for pid, seg_start, seg_end in lane:
+                norm_start = (seg_start - start_time) / total_time
+                norm_end   = (seg_end   - start_time) / total_time
+
+                if progress >= norm_start:
+                    portion = min(
+                        1.0,
+                        (progress - norm_start) /
+                        ((norm_end - norm_start) if norm_end > norm_start else 1)
                     )
+                    x0     = chart_left + norm_start * chart_width
+                    full_w = (norm_end - norm_start) * chart_width
+                    cur_w  = full_w * portion
+
+                    rect = pygame.Rect(x0, lane_top, cur_w, lane_h)
+                    if pid == OVERHEAD:
+                        pygame.draw.rect(self.screen, OVERHEAD_COLOR, rect)
+                        continue
+                    color = self.process_colors.get(pid, (100,180,100))
+                    pygame.draw.rect(self.screen, color, rect)
+
+                    if progress >= norm_end:
+                        pygame.draw.line(
+                            self.screen, (0,0,0),
+                            (x0+full_w, lane_top),
+                            (x0+full_w, lane_top+lane_h),
+                            2
+                        )
 
-                label = self.font.load().render(f"P{pid}", True, (255,255,255))
-                self.screen.blit(label, rect.move(5,5))
+                    label = self.font.load().render(f"P{pid}", True, (255,255,255))
+                    self.screen.blit(label, rect.move(5,5))
  
     # ─── hyperperiod warning ─────────────────────────────────────────────────
     def handle_hyper_warning_event(self, event):
@@ -850,7 +947,10 @@ class SchedulerApp:
                     include_deadline=True
                 )
                 self.initialize_scheduler()
-                self.scheduler.schedule()
+                if self.scheduler is None:
+                    # still over budget: stay here with the new plan
+                    return
+                self.result_cache.run(self.scheduler)
                 self.state = "simulation"
                 return
             # Manual → go back to custom input
@@ -870,31 +970,53 @@ class SchedulerApp:
         pygame.draw.rect(self.screen, (245,245,245), (x,y,w,h), border_radius=8)
         pygame.draw.rect(self.screen, (0,0,0), (x,y,w,h), 2, border_radius=8)
 
-        # message
-        msg1 = f"Hyperperiod = {self.bad_hyper} exceeds {self.max_hyperperiod}"
-        msg2 = "Gantt chart for RM/EDF will not render correctly."
-        txt1 = self.font.load().render(msg1, True, (0,0,0))
-        txt2 = self.font.load().render(msg2, True, (0,0,0))
-        self.screen.blit(txt1, (x+20, y+40))
-        self.screen.blit(txt2, (x+20, y+80))
+        # message: why the planner turned the run down, and what analysis says
+        est   = min((e for e in self.run_plan.estimates if e.engine != "analytic"), key=lambda e: e.seconds)
+        lines = [
+            f"{self.run_plan.algorithm} is over the run budget:",
+            f"{est.engine} engine ~{est.seconds:.2g}s, ~{est.segments:.0f} segments",
+        ]
+        if self.run_analysis is not None:
+            a = self.run_analysis
+            lines.append(f"Analysis: U = {a['utilization']:.2f}, {a['verdict']}")
+        for i, msg in enumerate(lines):
+            txt = self.font.load().render(msg, True, (0,0,0))
+            self.screen.blit(txt, (x+20, y+30+i*35))
 
         for btn in (self.hyper_manual_btn, self.hyper_auto_btn):
             pygame.draw.rect(self.screen, (0,0,0), btn["rect"])
             label = self.font.load().render(btn["label"], True, (255,255,255))
             self.screen.blit(label, label.get_rect(center=btn["rect"].center))
 
+    def scheduler_params(self):
+        """Constructor arguments of the selected algorithm, as the planner sees them."""
+        if self.selected_algo == "RR":
+            return {"time_quantum": self.time_quantum}
+        if self.selected_algo == "GEDF":
+            return {"cores": 2}
+        return {}
+
     def initialize_scheduler(self):
-        # Set up the scheduler instance
-        if self.selected_algo == "FCFS":
-            self.scheduler = FCFS_Scheduler()
+        # Plan the run first: the cheapest engine within budget, or no
+        # scheduler at all when simulating would be too expensive
+        self.run_plan = plan(self.selected_algo, self.processes, self.run_budget, **self.scheduler_params())
+        engine = self.run_plan.engine
+        # analysis is cheap but not free: run it once here, not on every frame
+        self.run_analysis = self.run_plan.execute(self.processes) if self.run_plan.decision == "analyze" else None
+        if self.run_plan.decision != "run":
+            self.scheduler = None
+        elif self.selected_algo == "FCFS":
+            self.scheduler = FCFS_Scheduler(engine=engine)
         elif self.selected_algo == "SJN":
             self.scheduler = ShortestJobNextScheduler()
         elif self.selected_algo == "RR":
-            self.scheduler = RoundRobinScheduler(time_quantum=2)
+            self.scheduler = RoundRobinScheduler(time_quantum=self.time_quantum)
         elif self.selected_algo == "RM":
-            self.scheduler = RateMonotonicScheduler()
+            self.scheduler = RateMonotonicScheduler(engine=engine)
         elif self.selected_algo == "DF":
-            self.scheduler = DeadlineFirstScheduler()
+            self.scheduler = DeadlineFirstScheduler(engine=engine)
+        elif self.selected_algo == "GEDF":
+            self.scheduler = GlobalDeadlineFirstScheduler(cores=2)
 
         # Add all processes
         if self.scheduler:
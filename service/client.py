@@ -0,0 +1,126 @@
+"""
+Clients for the scheduling service (see service.server).
+
+    from service.client import Client
+    with Client(port=8765) as c:
+        result = c.schedule("RR", [{"pid": 1, "arrival": 0, "burst": 5}], time_quantum=2)
+        print(result["metrics"]["avg_waiting"])
+
+AsyncClient pipelines many requests over one connection.
+"""
+import asyncio
+import itertools
+import json
+import socket
+
+
+def _request(req_id, algorithm, processes, timeline, params):
+    return {
+        "id"       : req_id,
+        "algorithm": algorithm,
+        "params"   : params,
+        "processes": processes,
+        "timeline" : timeline,
+    }
+
+
+class ServiceError(RuntimeError):
+    """The service answered a request with ok=false."""
+
+
+class Client:
+    """Blocking client: one request at a time over a persistent connection."""
+    def __init__(self, host="127.0.0.1", port=8765, unix=None, timeout=30):
+        if unix:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(unix)
+        else:
+            self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.file = self.sock.makefile("rwb")
+        self._ids = itertools.count(1)
+
+    def call(self, req):
+        self.file.write(json.dumps(req).encode() + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("service closed the connection")
+        return json.loads(line)
+
+    def schedule(self, algorithm, processes, timeline=True, **params):
+        """Response body for one workload; raises ServiceError on failure."""
+        resp = self.call(_request(next(self._ids), algorithm, processes, timeline, params))
+        if not resp.get("ok"):
+            raise ServiceError(resp.get("error"))
+        return resp
+
+    def stats(self):
+        return self.call({"op": "stats", "id": next(self._ids)})
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncClient:
+    """asyncio client; concurrent schedule() calls share one pipelined connection."""
+    def __init__(self, host="127.0.0.1", port=8765, unix=None):
+        self.host, self.port, self.unix = host, port, unix
+        self._ids     = itertools.count(1)
+        self._waiting = {}  # id → future
+
+    async def connect(self):
+        if self.unix:
+            self.reader, self.writer = await asyncio.open_unix_connection(self.unix)
+        else:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self._listener = asyncio.ensure_future(self._listen())
+        return self
+
+    async def _listen(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            resp = json.loads(line)
+            fut  = self._waiting.pop(resp.get("id"), None)
+            if fut is not None and not fut.done():
+                fut.set_result(resp)
+        for fut in self._waiting.values():
+            if not fut.done():
+                fut.set_exception(ConnectionError("service closed the connection"))
+
+    async def call(self, req):
+        req["id"] = next(self._ids)
+        fut = asyncio.get_running_loop().create_future()
+        self._waiting[req["id"]] = fut
+        self.writer.write(json.dumps(req).encode() + b"\n")
+        await self.writer.drain()
+        return await fut
+
+    async def schedule(self, algorithm, processes, timeline=True, **params):
+        resp = await self.call(_request(None, algorithm, processes, timeline, params))
+        if not resp.get("ok"):
+            raise ServiceError(resp.get("error"))
+        return resp
+
+    async def stats(self):
+        return await self.call({"op": "stats"})
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self._listener.cancel()
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc):
+        await self.close()
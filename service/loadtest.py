@@ -0,0 +1,114 @@
+"""
+Load test for the scheduling service.
+
+Opens `--connections` connections that each keep `--depth` requests in
+flight until `--requests` requests have been answered in total. Workloads
+are drawn from a pool of `--distinct` random workloads, so the share of
+cache hits can be tuned. Prints throughput and latency percentiles.
+
+    python -m service.server --port 8765 &
+    python -m service.loadtest --port 8765 --requests 5000 --connections 8
+    python -m service.loadtest --spawn      # starts an in-process server first
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from algorithms.registry import process_to_dict
+from algorithms.streaming import LogHistogram
+from algorithms.utils import generate_random_processes
+from service.client import AsyncClient
+from service.server import SchedulingService
+
+ALGORITHMS = (
+    ("FCFS", {}),
+    ("SJN", {}),
+    ("RR", {"time_quantum": 2}),
+    ("MLFQ", {}),
+    ("RM", {}),
+    ("DF", {}),
+)
+
+
+def make_workloads(distinct, size, seed=0):
+    random.seed(seed)
+    out = []
+    for i in range(distinct):
+        algorithm, params = ALGORITHMS[i % len(ALGORITHMS)]
+        periodic = algorithm in ("RM", "DF")
+        # periodic task sets are resampled until their hyperperiod is small,
+        # which only stays cheap for a handful of tasks
+        procs = generate_random_processes(
+            min(size, 5) if periodic else size,
+            include_period=periodic,
+            include_deadline=periodic
+        )
+        out.append((algorithm, params, [process_to_dict(p) for p in procs]))
+    return out
+
+
+async def _worker(client, workloads, budget, depth, latency, errors):
+    async def one():
+        algorithm, params, procs = random.choice(workloads)
+        t = time.perf_counter()
+        try:
+            await client.schedule(algorithm, procs, timeline=False, **params)
+        except Exception:
+            errors.append(1)
+        latency.record((time.perf_counter() - t) * 1000)
+
+    running = set()
+    while budget[0] > 0 or running:
+        while budget[0] > 0 and len(running) < depth:
+            budget[0] -= 1
+            running.add(asyncio.ensure_future(one()))
+        done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+
+async def run(args):
+    service = None
+    if args.spawn:
+        service = SchedulingService(workers=args.workers)
+        await service.start(args.host, args.port, args.unix)
+
+    workloads = make_workloads(args.distinct, args.size)
+    clients   = [await AsyncClient(args.host, args.port, args.unix).connect() for _ in range(args.connections)]
+    latency   = LogHistogram(precision=0.01, unit=0.01)  # milliseconds
+    errors    = []
+    budget    = [args.requests]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker(c, workloads, budget, args.depth, latency, errors) for c in clients))
+    elapsed = time.perf_counter() - start
+    stats = await clients[0].stats()
+
+    for c in clients:
+        await c.close()
+    if service is not None:
+        await service.stop()
+
+    print(f"requests    {latency.count} in {elapsed:.2f}s ({latency.count / elapsed:.0f} req/s), {len(errors)} errors")
+    print("latency ms  " + "  ".join(f"p{q}={latency.percentile(q):.2f}" for q in (50, 90, 99, 99.9))
+          + f"  max={latency.max:.2f}")
+    print(f"service     batches={stats['batches']} computed={stats['computed']} "
+          f"cache_hits={stats['cache_hits']} deduplicated={stats['deduplicated']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test for the scheduling service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=16, help="requests in flight per connection")
+    parser.add_argument("--distinct", type=int, default=200, help="distinct workloads to draw from")
+    parser.add_argument("--size", type=int, default=8, help="processes per workload")
+    parser.add_argument("--spawn", action="store_true", help="run the service in this process")
+    parser.add_argument("--workers", type=int, default=None, help="pool size for --spawn")
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
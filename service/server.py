@@ -0,0 +1,334 @@
+"""
+Long-running scheduling service.
+
+Clients send one JSON request per line over TCP or a Unix socket:
+
+    {"id": 1, "algorithm": "RR", "params": {"time_quantum": 2},
+     "processes": [{"pid": 1, "arrival": 0, "burst": 5}, ...],
+     "timeline": true}
+
+and get one JSON line back per request, carrying the same "id":
+
+    {"id": 1, "ok": true, "cached": false, "metrics": {...}, "timeline": [...]}
+
+or {"id": 1, "ok": false, "error": "..."}. Responses on one connection may
+arrive out of order when requests are pipelined. {"op": "stats"} returns
+the service counters.
+
+Requests from all connections go through one bounded queue. A batcher
+drains it in batches (up to `batch_size`, waiting at most `batch_window`
+seconds for a batch to fill), answers repeats from an in-memory LRU,
+deduplicates the rest (also against requests still computing in
+earlier batches) and runs them in a process pool. At most two batches
+per pool worker are in flight; past that the queue fills up and
+connection handlers stop reading, so backpressure reaches clients
+through their sockets.
+
+Each request is priced with the planner first and refused when no engine
+fits `max_seconds`; a pool round trip that still runs past `timeout`
+fails its requests, and the pool is replaced (as it is when a worker
+dies).
+
+    python -m service.server --port 8765
+    python -m service.server --unix /tmp/algo-scheduler.sock
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from algorithms import registry
+from algorithms.planner import Budget, plan
+
+
+def request_key(req):
+    """Canonical hash of what determines a result."""
+    doc = {
+        "algorithm": req["algorithm"].upper(),
+        "params"   : req.get("params") or {},
+        "processes": req["processes"],
+        "timeline" : bool(req.get("timeline", True)),
+    }
+    return hashlib.sha256(json.dumps(doc, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def run_request(req, budget=None):
+    """Schedule one request, unless its plan is over `budget`; returns the response body (without id)."""
+    try:
+        params = dict(req.get("params") or {})
+        if req["algorithm"].upper() == "PART":
+            # pool workers cannot start pools of their own
+            params.setdefault("workers", 0)
+        processes = [registry.process_from_dict(d) for d in req["processes"]]
+        if budget is not None:
+            p = plan(req["algorithm"], processes, budget, **params)
+            if p.decision != "run":
+                return {"ok": False, "error": f"over budget: {p.reason}"}
+        sched = registry.run(req["algorithm"], processes, **params)
+        body  = {"ok": True, "metrics": sched.metrics.as_dict() if sched.metrics else None}
+        if req.get("timeline", True):
+            body["timeline"] = [list(seg) for seg in sched.timeline]
+        return body
+    except Exception as e:
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def run_batch(reqs, budget=None):
+    """Worker entry point: several requests per pool round trip."""
+    return [run_request(req, budget) for req in reqs]
+
+
+class SchedulingService:
+    """
+    Parameters:
+        workers       – process pool size (None → CPU count, 0 → run in the event loop's thread)
+        batch_size    – most requests taken from the queue at once
+        batch_window  – seconds to wait for a batch to fill after its first request
+        max_pending   – queue capacity; beyond it readers block (backpressure)
+        cache_entries – LRU capacity, in responses
+        max_seconds   – planner estimate above which a request is refused (None: no limit)
+        timeout       – seconds a pool round trip may take before its requests fail
+                        (None: no limit; not enforced without a pool)
+    """
+    def __init__(self, workers=None, batch_size=64, batch_window=0.002, max_pending=1024, cache_entries=4096,
+                 max_seconds=5.0, timeout=60.0):
+        self.workers       = workers
+        self.batch_size    = batch_size
+        self.batch_window  = batch_window
+        self.max_pending   = max_pending
+        self.cache_entries = cache_entries
+        self.budget        = Budget(max_seconds=max_seconds, max_bytes=None) if max_seconds is not None else None
+        self.timeout       = timeout
+        self.cache         = OrderedDict()
+        self.stats         = {"requests": 0, "cache_hits": 0, "deduplicated": 0,
+                              "computed": 0, "batches": 0, "errors": 0, "pool_restarts": 0}
+        self.queue = None
+        self.pool  = None
+        self._inflight    = {}  # key → futures waiting for a result being computed
+        self._connections = set()
+
+    # ─── lifecycle ───────────────────────────────────────────────────────────
+
+    async def start(self, host="127.0.0.1", port=8765, unix=None):
+        self.queue = asyncio.Queue(maxsize=self.max_pending)
+        self.pool_size = self.workers if self.workers is not None else (os.cpu_count() or 1)
+        if self.pool_size:
+            self.pool = ProcessPoolExecutor(max_workers=self.pool_size)
+        self._slots = asyncio.Semaphore(2 * max(self.pool_size, 1))
+        self._batcher = asyncio.ensure_future(self._batch_loop())
+        if unix:
+            self.server = await asyncio.start_unix_server(self._handle, path=unix)
+        else:
+            self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server
+
+    async def stop(self, grace=1.0):
+        """Stop listening, give open connections `grace` seconds to finish, then cancel them."""
+        self.server.close()
+        await self.server.wait_closed()
+        if self._connections:
+            _, rest = await asyncio.wait(self._connections, timeout=grace)
+            for task in rest:
+                task.cancel()
+            await asyncio.gather(*rest, return_exceptions=True)
+        self._batcher.cancel()
+        if self.pool is not None:
+            self.pool.shutdown()
+
+    def _replace_pool(self, broken, kill=False):
+        """Swap in a fresh pool for `broken`, unless another batch already did."""
+        if self.pool is not broken:
+            return
+        self.stats["pool_restarts"] += 1
+        self.pool = ProcessPoolExecutor(max_workers=self.pool_size)
+        if kill:
+            # a worker past the timeout would otherwise keep its CPU until it finishes
+            for proc in list((getattr(broken, "_processes", None) or {}).values()):
+                proc.terminate()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    # ─── connections ─────────────────────────────────────────────────────────
+
+    async def _handle(self, reader, writer):
+        me      = asyncio.current_task()
+        lock    = asyncio.Lock()
+        pending = set()
+        self._connections.add(me)
+
+        async def reply(req_id, body):
+            if isinstance(body, asyncio.Future):
+                body = await body
+            line = json.dumps(dict(body, id=req_id)).encode() + b"\n"
+            async with lock:
+                writer.write(line)
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    req = json.loads(line)
+                    req_id = req.get("id")
+                except (ValueError, AttributeError) as e:
+                    req_id, body = None, {"ok": False, "error": f"bad request: {e}"}
+                else:
+                    if req.get("op") == "stats":
+                        body = self._stats()
+                    else:
+                        body = asyncio.get_running_loop().create_future()
+                        # blocks while the queue is full, which stops this reader
+                        await self.queue.put((req, body))
+                task = asyncio.ensure_future(reply(req_id, body))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._connections.discard(me)
+            writer.close()
+
+    def _stats(self):
+        return dict(self.stats, ok=True, pending=self.queue.qsize(), cached=len(self.cache))
+
+    # ─── batching ────────────────────────────────────────────────────────────
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._slots.acquire()
+            batch    = [await self.queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self.stats["batches"] += 1
+            # run the batch in the background so the next one can form meanwhile
+            asyncio.ensure_future(self._serve(batch))
+
+    async def _serve(self, batch):
+        try:
+            await self._compute(batch)
+        finally:
+            self._slots.release()
+
+    async def _compute(self, batch):
+        todo = OrderedDict()  # key → (request, [futures])
+        for req, fut in batch:
+            self.stats["requests"] += 1
+            try:
+                key = request_key(req)
+            except (KeyError, TypeError, AttributeError) as e:
+                self.stats["errors"] += 1
+                fut.set_result({"ok": False, "error": f"malformed request: {e!r}"})
+                continue
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                fut.set_result(dict(self.cache[key], cached=True))
+            elif key in self._inflight:
+                # same request in this batch or one still computing
+                self.stats["deduplicated"] += 1
+                self._inflight[key].append(fut)
+            else:
+                todo[key] = (req, [fut])
+                self._inflight[key] = todo[key][1]
+        if not todo:
+            return
+
+        try:
+            bodies = await self._run([req for req, _ in todo.values()])
+        finally:
+            for key in todo:
+                del self._inflight[key]
+
+        for (key, (_, futs)), body in zip(todo.items(), bodies):
+            self.stats["computed"] += 1
+            if body["ok"]:
+                self.cache[key] = body
+                if len(self.cache) > self.cache_entries:
+                    self.cache.popitem(last=False)
+            else:
+                self.stats["errors"] += 1
+            for fut in futs:
+                if not fut.done():
+                    fut.set_result(dict(body, cached=False))
+
+    async def _run(self, reqs):
+        if self.pool is None:
+            return run_batch(reqs, self.budget)
+        # one pool round trip per worker-sized chunk
+        pool = self.pool
+        size = -(-len(reqs) // self.pool_size)
+        loop = asyncio.get_running_loop()
+        try:
+            chunks = await asyncio.wait_for(asyncio.gather(*(
+                loop.run_in_executor(pool, run_batch, reqs[i:i + size], self.budget)
+                for i in range(0, len(reqs), size)
+            )), self.timeout)
+            return [body for chunk in chunks for body in chunk]
+        except asyncio.TimeoutError:
+            self._replace_pool(pool, kill=True)
+            error = f"timed out after {self.timeout:g}s"
+        except BrokenProcessPool as e:
+            self._replace_pool(pool)
+            error = f"worker failed: {type(e).__name__}: {e}"
+        except Exception as e:
+            error = f"worker failed: {type(e).__name__}: {e}"
+        return [{"ok": False, "error": error}] * len(reqs)
+
+
+async def serve(host="127.0.0.1", port=8765, unix=None, **options):
+    service = SchedulingService(**options)
+    server  = await service.start(host, port, unix)
+    where   = unix or f"{host}:{port}"
+    print(f"algo-scheduler service listening on {where}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scheduling service (JSON lines over TCP or a Unix socket)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (0: no pool)")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--batch-window", type=float, default=0.002, help="seconds")
+    parser.add_argument("--max-pending", type=int, default=1024)
+    parser.add_argument("--cache-entries", type=int, default=4096)
+    parser.add_argument("--max-seconds", type=float, default=5.0, help="refuse requests estimated to take longer")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds per pool round trip")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(
+            args.host, args.port, args.unix,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            batch_window=args.batch_window,
+            max_pending=args.max_pending,
+            cache_entries=args.cache_entries,
+            max_seconds=args.max_seconds,
+            timeout=args.timeout,
+        ))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from algorithms.cache import ResultCache
+from algorithms.fcfs import FCFS_Scheduler
+from algorithms.process import Process
+from algorithms.rrs import RoundRobinScheduler
+from algorithms.sjns import ShortestJobNextScheduler
+
+
+def _workload():
+    return [Process(1, 0, 3), Process(2, 1, 2), Process(3, 2, 1)]
+
+
+def _fresh(cls, processes, **params):
+    sched = cls(**params)
+    for p in processes:
+        sched.add_process(p)
+    sched.schedule()
+    return sched
+
+
+def test_cache_hit_after_incremental_edit():
+    for cls, params in ((ShortestJobNextScheduler, {}), (RoundRobinScheduler, {"time_quantum": 2})):
+        cache = ResultCache(":memory:")
+        sched = cls(**params)
+        for p in _workload():
+            sched.add_process(p)
+        cache.run(sched)
+        sched.add_process(Process(4, 0, 5))
+        sched.remove_process(2)
+
+        again = cls(**params)
+        for p in _workload():
+            again.add_process(p)
+        assert cache.get(again)
+        expected = _fresh(cls, _workload(), **params)
+        assert again.timeline == expected.timeline
+        assert again.metrics.as_dict() == expected.metrics.as_dict()
+        assert again.result.waiting == expected.result.waiting
+
+
+def test_result_of_earlier_run_is_kept():
+    sched  = _fresh(ShortestJobNextScheduler, _workload())
+    before = sched.result
+    waits  = list(before.waiting)
+    sched.add_process(Process(4, 0, 5))
+    assert before.waiting == waits
+    assert len(before.workload) == 3
+    assert sched.result.of(4)["completion"] is not None
+
+
+def test_rerun_after_hit_leaves_cache_alone():
+    cache = ResultCache(":memory:")
+    first = FCFS_Scheduler()
+    for p in _workload():
+        first.add_process(p)
+    cache.run(first)
+    expected = list(first.timeline)
+
+    for _ in range(2):
+        again = FCFS_Scheduler()
+        for p in _workload():
+            again.add_process(p)
+        assert cache.get(again)
+        assert again.timeline == expected
+        again.schedule()
+        assert again.timeline == expected
+        again.timeline.append((9, 100, 101))
+    assert first.timeline == expected
+
+
+class _Exploit:
+    def __reduce__(self):
+        return (print, ("executed",))
+
+
+def test_foreign_blob_is_refused():
+    import pickle
+    import zlib
+
+    from algorithms.cache import workload_key
+
+    cache = ResultCache(":memory:", memory_entries=0)
+    sched = _fresh(ShortestJobNextScheduler, _workload())
+    cache.put(sched)
+    key  = workload_key(sched)
+    blob = zlib.compress(pickle.dumps({"timeline": _Exploit()}))
+    cache.db.execute("UPDATE results SET blob = ? WHERE key = ?", (blob, key))
+
+    again = ShortestJobNextScheduler()
+    for p in _workload():
+        again.add_process(p)
+    assert not cache.get(again)
+    cache.run(again)
+    assert again.timeline == sched.timeline
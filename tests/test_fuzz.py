@@ -0,0 +1,17 @@
+from algorithms import fuzz as fuzzer
+
+
+def test_engines_agree_with_reference():
+    failures = fuzzer.fuzz(200, seed=0)
+    assert failures == [], failures
+
+
+def test_mismatch_is_reported_and_shrunk(monkeypatch):
+    def late(algorithm, params, processes):
+        # every segment one unit late
+        return [(pid, s + 1, e + 1) for pid, s, e in fuzzer._full(algorithm, params, processes)]
+
+    monkeypatch.setitem(fuzzer.TARGETS, "SJN/late", ("SJN", {}, late))
+    failures = fuzzer.fuzz(20, seed=0, targets=["SJN/late"], max_failures=1)
+    assert len(failures) == 1
+    assert len(failures[0].shrunk["processes"]) == 1